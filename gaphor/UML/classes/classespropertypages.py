@@ -51,17 +51,24 @@ class NamedElementPropertyPage(NamePropertyPage):
         super().__init__(subject, event_manager)
 
     def construct(self):
-        if (
-            not self.subject
-            or UML.recipes.is_metaclass(self.subject)
-            or isinstance(
-                self.subject, UML.ActivityPartition | UML.ActivityParameterNode
-            )
-        ):
+        if not self._has_name_editor(self.subject):
             return
 
         return super().construct()
 
+    def rebind(self, subject):
+        return self._has_name_editor(subject) and super().rebind(subject)
+
+    @staticmethod
+    def _has_name_editor(subject) -> bool:
+        return bool(
+            subject
+            and not UML.recipes.is_metaclass(subject)
+            and not isinstance(
+                subject, UML.ActivityPartition | UML.ActivityParameterNode
+            )
+        )
+
 
 @PropertyPages.register(UML.Classifier)
 class ClassifierPropertyPage(PropertyPageBase):
@@ -7,7 +7,15 @@ from gaphor.diagram.presentation import (
     Classified,
     ElementPresentation,
 )
-from gaphor.diagram.shapes import Box, CssNode, Text, draw_border, draw_top_separator
+from gaphor.diagram.shapes import (
+    Box,
+    CssNode,
+    KeyedShapes,
+    Text,
+    draw_border,
+    draw_top_separator,
+    keyed_css_node,
+)
 from gaphor.diagram.support import represents
 from gaphor.UML.classes.stereotype import stereotype_compartments, stereotype_watches
 from gaphor.UML.compartments import name_compartment
@@ -36,6 +44,7 @@ class ClassItem(Classified, ElementPresentation[UML.Class]):
         attribute_watches(self, "Class")
         operation_watches(self, "Class")
         stereotype_watches(self)
+        self._keyed_shapes = KeyedShapes()
 
     show_stereotypes: attribute[int] = attribute("show_stereotypes", int)
 
@@ -51,23 +60,28 @@ class ClassItem(Classified, ElementPresentation[UML.Class]):
         return ()
 
     def update_shapes(self, event=None):
-        self.shape = Box(
-            name_compartment(self, self.additional_stereotypes),
-            *(
-                self.show_attributes
-                and self.subject
-                and [attributes_compartment(self.subject)]
-                or []
-            ),
-            *(
-                self.show_operations
-                and self.subject
-                and [operations_compartment(self.subject)]
-                or []
-            ),
-            *(self.show_stereotypes and stereotype_compartments(self.subject) or []),
-            draw=draw_border,
-        )
+        with self._keyed_shapes.update() as shapes:
+            self.shape = Box(
+                name_compartment(self, self.additional_stereotypes),
+                *(
+                    self.show_attributes
+                    and self.subject
+                    and [attributes_compartment(self.subject, shapes)]
+                    or []
+                ),
+                *(
+                    self.show_operations
+                    and self.subject
+                    and [operations_compartment(self.subject, shapes)]
+                    or []
+                ),
+                *(
+                    self.show_stereotypes
+                    and stereotype_compartments(self.subject)
+                    or []
+                ),
+                draw=draw_border,
+            )
 
 
 def attribute_watches(presentation, cast):
@@ -106,23 +120,22 @@ def operation_watches(presentation, cast):
     )
 
 
-def attributes_compartment(subject):
+def attributes_compartment(subject, shapes: KeyedShapes | None = None):
+    """Attribute compartment.
+
+    Provide ``shapes`` to reuse attribute shapes from a previous update.
+    """
+
     # We need to scope the attribute value, since the for loop changes it.
-    def lazy_format(attribute):
-        return lambda: format(attribute, tags=True)
+    def lazy_text(attribute):
+        return lambda: Text(text=lambda: format(attribute, tags=True))
 
     return CssNode(
         "compartment",
         subject,
         Box(
             *(
-                CssNode(
-                    "attribute",
-                    attribute,
-                    Text(
-                        text=lazy_format(attribute),
-                    ),
-                )
+                keyed_css_node(shapes, "attribute", attribute, lazy_text(attribute))
                 for attribute in subject.ownedAttribute
                 if not attribute.association
             ),
@@ -131,10 +144,17 @@ def attributes_compartment(subject):
     )
 
 
-def operations_compartment(subject):
-    def lazy_format(operation):
-        return lambda: format(
-            operation, visibility=True, type=True, multiplicity=True, default=True
+def operations_compartment(subject, shapes: KeyedShapes | None = None):
+    """Operation compartment.
+
+    Provide ``shapes`` to reuse operation shapes from a previous update.
+    """
+
+    def lazy_text(operation):
+        return lambda: Text(
+            text=lambda: format(
+                operation, visibility=True, type=True, multiplicity=True, default=True
+            )
         )
 
     return CssNode(
@@ -142,13 +162,7 @@ def operations_compartment(subject):
         subject,
         Box(
             *(
-                CssNode(
-                    "operation",
-                    operation,
-                    Text(
-                        text=lazy_format(operation),
-                    ),
-                )
+                keyed_css_node(shapes, "operation", operation, lazy_text(operation))
                 for operation in subject.ownedOperation
             ),
             draw=draw_top_separator,
@@ -97,3 +97,18 @@ def test_compartment_resizing(element_factory):
 
     width = klass.width
     assert width >= 170.0
+
+
+def test_attribute_shapes_are_reused(element_factory):
+    diagram = element_factory.create(Diagram)
+    klass = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    attr = element_factory.create(UML.Property)
+    klass.subject.ownedAttribute = attr
+
+    (attr_shape,) = compartments(klass)[0].child.children
+    klass.subject.ownedAttribute = element_factory.create(UML.Property)
+
+    attr_shapes = compartments(klass)[0].child.children
+    assert len(attr_shapes) == 2
+    assert attr_shapes[0] is attr_shape
+    assert attr_shapes[0].element is attr
@@ -1,5 +1,7 @@
 """Message item connection adapters."""
 
+import bisect
+
 from gaphor import UML
 from gaphor.core.modeling import Presentation
 from gaphor.diagram.connectors import BaseConnector, Connector
@@ -24,38 +26,93 @@ def get_lifeline(item, handle):
     return get_lifeline(connected_item, connected_item.handles()[0])
 
 
-def order_lifeline_covered_by(lifeline):
-    diagram = lifeline.diagram
+def occurrence_positions(item, handle):
+    """Vertical positions of the occurrences of an item connected to a
+    lifeline, including the items connected to it."""
+    if not item.subject:
+        # Can happen during DnD
+        return
+    m = item.matrix_i2c
+    if isinstance(item, ExecutionSpecificationItem):
+        yield m.transform_point(*item.top.pos)[1], item.subject.start
+        yield m.transform_point(*item.bottom.pos)[1], item.subject.finish
+        for conn in item.diagram.connections.get_connections(connected=item):
+            yield from occurrence_positions(conn.item, conn.handle)
+    elif isinstance(item, MessageItem):
+        yield (
+            m.transform_point(*handle.pos)[1],
+            item.subject.sendEvent
+            if handle is item.head
+            else item.subject.receiveEvent,
+        )
+
+
+def occurrence_y(diagram, occurrence) -> float:
+    """Find the vertical position of a single occurrence in a diagram."""
+    if isinstance(occurrence, UML.ExecutionOccurrenceSpecification) and (
+        execution := occurrence.execution
+    ):
+        for item in execution.presentation:
+            if item.diagram is diagram and isinstance(item, ExecutionSpecificationItem):
+                handle = item.top if execution.start is occurrence else item.bottom
+                return float(item.matrix_i2c.transform_point(*handle.pos)[1])
+    elif isinstance(occurrence, UML.MessageOccurrenceSpecification) and (
+        message := occurrence.sendMessage or occurrence.receiveMessage
+    ):
+        for item in message.presentation:
+            if item.diagram is diagram and isinstance(item, MessageItem):
+                handle = item.head if occurrence.sendMessage else item.tail
+                return float(item.matrix_i2c.transform_point(*handle.pos)[1])
+    return 0.0
 
-    def y_and_occurrence(connected):
-        for conn in diagram.connections.get_connections(connected=connected):
-            m = conn.item.matrix_i2c
-            if not conn.item.subject:
-                # Can happen during DnD
-                continue
-            if isinstance(conn.item, ExecutionSpecificationItem):
-                yield (
-                    m.transform_point(*conn.item.top.pos)[1],
-                    conn.item.subject.start,
-                )
-                yield (
-                    m.transform_point(*conn.item.bottom.pos)[1],
-                    conn.item.subject.finish,
-                )
-                yield from y_and_occurrence(conn.item)
-            elif isinstance(conn.item, MessageItem):
-                yield (
-                    m.transform_point(*conn.handle.pos)[1],
-                    conn.item.subject.sendEvent
-                    if conn.handle is conn.item.head
-                    else conn.item.subject.receiveEvent,
-                )
 
+def order_lifeline_covered_by(lifeline):
+    """Sort all occurrences covering a lifeline by their position."""
     if lifeline.subject:
-        keys = {o: y for y, o in y_and_occurrence(lifeline)}
+        keys = {
+            o: y
+            for conn in lifeline.diagram.connections.get_connections(connected=lifeline)
+            for y, o in occurrence_positions(conn.item, conn.handle)
+        }
         lifeline.subject.coveredBy.order(lambda key: keys.get(key, 0.0))
 
 
+def insert_lifeline_covered_by(lifeline, positions):
+    """Move occurrences to their place in the covered-by order of a
+    lifeline.
+
+    The other occurrences are expected to be in order already, so
+    each occurrence is inserted with a binary search. The collection
+    is reordered, and an update is emitted, at most once.
+    """
+    if not (subject := lifeline.subject):
+        return
+
+    covered_by = subject.coveredBy
+    covered = set(covered_by)
+    keys = {o: y for y, o in positions if o in covered}
+    if not keys:
+        return
+
+    diagram = lifeline.diagram
+
+    def key(occurrence):
+        if (y := keys.get(occurrence)) is None:
+            y = keys[occurrence] = occurrence_y(diagram, occurrence)
+        return y
+
+    moved = sorted(keys, key=keys.__getitem__)
+    occurrences = [o for o in covered_by if o not in keys]
+    for occurrence in moved:
+        occurrences.insert(
+            bisect.bisect_right(occurrences, keys[occurrence], key=key), occurrence
+        )
+
+    if occurrences != covered_by.items:
+        index = {o: i for i, o in enumerate(occurrences)}
+        covered_by.order(index.__getitem__)
+
+
 def owner_for_message(line, lifeline):
     maybe_interaction = lifeline.parent
     if line.subject.interaction:
@@ -83,7 +140,9 @@ def connect_lifelines(line, send, received):
             event = message.model.create(UML.MessageOccurrenceSpecification)
             event.sendMessage = message
             event.covered = send.subject
-            order_lifeline_covered_by(send)
+            insert_lifeline_covered_by(
+                send, [(line.matrix_i2c.transform_point(*line.head.pos)[1], event)]
+            )
         owner_for_message(line, send)
 
     if received:
@@ -92,7 +151,9 @@ def connect_lifelines(line, send, received):
             event = message.model.create(UML.MessageOccurrenceSpecification)
             event.receiveMessage = message
             event.covered = received.subject
-            order_lifeline_covered_by(received)
+            insert_lifeline_covered_by(
+                received, [(line.matrix_i2c.transform_point(*line.tail.pos)[1], event)]
+            )
         owner_for_message(line, received)
 
 
@@ -221,6 +282,10 @@ class LifelineExecutionSpecificationConnect(BaseConnector):
 
         for cinfo in self.diagram.connections.get_connections(connected=self.line):
             Connector(self.line, cinfo.item).connect(cinfo.handle, cinfo.port)
+
+        insert_lifeline_covered_by(
+            self.element, occurrence_positions(self.line, handle)
+        )
         return True
 
     def disconnect(self, handle):
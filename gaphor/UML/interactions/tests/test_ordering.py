@@ -3,7 +3,11 @@ import pytest
 from gaphor import UML
 from gaphor.diagram.tests.fixtures import connect
 from gaphor.UML.interactions.executionspecification import ExecutionSpecificationItem
-from gaphor.UML.interactions.interactionsconnect import order_lifeline_covered_by
+from gaphor.UML.interactions.interactionsconnect import (
+    insert_lifeline_covered_by,
+    occurrence_positions,
+    order_lifeline_covered_by,
+)
 from gaphor.UML.interactions.lifeline import LifelineItem
 from gaphor.UML.interactions.message import MessageItem
 
@@ -74,3 +78,55 @@ def test_ordering_with_connection_missing_in_diagram(
     order_lifeline_covered_by(lifeline)
 
     assert list(lifeline.subject.coveredBy) == occurrences
+
+
+def test_ordering_on_connect(lifeline, diagram):
+    exec_spec = diagram.create(ExecutionSpecificationItem)
+    message1 = diagram.create(MessageItem)
+    message2 = diagram.create(MessageItem)
+    message3 = diagram.create(MessageItem)
+
+    lifetime_top = lifeline.lifetime.top.pos
+    message1.head.pos.y = message1.tail.pos.y = lifetime_top.y + 300
+    exec_spec.top.pos.y = lifetime_top.y + 400
+    message2.head.pos.y = message2.tail.pos.y = lifetime_top.y + 500
+    exec_spec.bottom.pos.y = lifetime_top.y + 600
+    message3.head.pos.y = message3.tail.pos.y = lifetime_top.y + 700
+    diagram.connections.solve()
+
+    connect(message3, message3.tail, lifeline)
+    connect(exec_spec, exec_spec.handles()[0], lifeline)
+    connect(message2, message2.head, exec_spec)
+    connect(message1, message1.head, lifeline)
+
+    assert list(lifeline.subject.coveredBy) == [
+        message1.subject.sendEvent,
+        exec_spec.subject.start,
+        message2.subject.sendEvent,
+        exec_spec.subject.finish,
+        message3.subject.receiveEvent,
+    ]
+
+
+def test_insert_moved_occurrence(lifeline, diagram):
+    message1 = diagram.create(MessageItem)
+    message2 = diagram.create(MessageItem)
+
+    lifetime_top = lifeline.lifetime.top.pos
+    message1.head.pos.y = message1.tail.pos.y = lifetime_top.y + 300
+    message2.head.pos.y = message2.tail.pos.y = lifetime_top.y + 500
+    diagram.connections.solve()
+
+    connect(message1, message1.head, lifeline)
+    connect(message2, message2.head, lifeline)
+
+    message1.head.pos.y = lifetime_top.y + 600
+    insert_lifeline_covered_by(
+        lifeline,
+        occurrence_positions(message1, message1.head),
+    )
+
+    assert list(lifeline.subject.coveredBy) == [
+        message2.subject.sendEvent,
+        message1.subject.sendEvent,
+    ]
@@ -1,6 +1,9 @@
+import multiprocessing
 import sys
 
 from gaphor.main import main
 
 if __name__ == "__main__":
+    # Needed for worker processes in a frozen (PyInstaller) application
+    multiprocessing.freeze_support()
     sys.exit(main(sys.argv))
@@ -17,7 +17,7 @@ from gaphor.abc import ActionProvider, Service
 from gaphor.action import action
 from gaphor.core import event_handler
 from gaphor.core.eventmanager import EventManager
-from gaphor.entrypoint import initialize
+from gaphor.entrypoint import LazyService, initialize, resolve_service
 from gaphor.event import (
     ActiveSessionChanged,
     ApplicationShutdown,
@@ -70,7 +70,7 @@ class Application(Service, ActionProvider):
         if not self._services_by_name:
             raise NotInitializedError("Session is no longer alive")
 
-        return self._services_by_name[name]
+        return resolve_service(self._services_by_name[name])
 
     @property
     def active_window(self):
@@ -164,6 +164,10 @@ class Application(Service, ActionProvider):
         self.event_manager.handle(ApplicationShutdown(self))
 
         for c in self._services_by_name.values():
+            if isinstance(c, LazyService):
+                if not c.resolved:
+                    continue
+                c = c.resolve()
             if c is not self:
                 c.shutdown()
         self._services_by_name.clear()
@@ -205,12 +209,18 @@ class Session(Service):
         )
 
         for name, srv in services_by_name.items():
-            logger.debug("Initializing service %s", name)
             self.component_registry.register(name, srv)
-            self.event_manager.handle(ServiceInitializedEvent(name, srv))
+            if isinstance(srv, LazyService):
+                srv.on_resolve(self._service_initialized)
+            else:
+                self._service_initialized(name, srv)
 
         self.event_manager.subscribe(self.on_filename_changed)
 
+    def _service_initialized(self, name, srv):
+        logger.debug("Initializing service %s", name)
+        self.event_manager.handle(ServiceInitializedEvent(name, srv))
+
     def get_service(self, name):
         if not self.component_registry:
             raise NotInitializedError("Session is no longer alive")
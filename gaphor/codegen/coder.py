@@ -24,13 +24,19 @@ from __future__ import annotations
 
 import argparse
 import contextlib
+import hashlib
 import logging
+import pickle
 import sys
 import textwrap
+from collections import Counter
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from weakref import WeakKeyDictionary
 
 from gaphor import UML
+from gaphor.codegen import override
 from gaphor.codegen.override import Overrides
 from gaphor.core.modeling import Base, ElementFactory
 from gaphor.core.modeling.modelinglanguage import (
@@ -40,7 +46,9 @@ from gaphor.core.modeling.modelinglanguage import (
 )
 from gaphor.diagram.general.modelinglanguage import GeneralModelingLanguage
 from gaphor.entrypoint import initialize
+from gaphor.storage import parser as model_parser
 from gaphor.storage import storage
+from gaphor.storage.parser import element
 from gaphor.SysML.modelinglanguage import SysMLModelingLanguage
 from gaphor.UML.modelinglanguage import UMLModelingLanguage
 
@@ -74,9 +82,35 @@ def main(
     supermodelfiles: list[tuple[str, str]] | None = None,
     overridesfile: str | None = None,
     outfile: str | None = None,
+    cache: bool | str | Path = False,
 ):
+    """Generate the data model for a model file.
+
+    If ``cache`` is enabled, parsed models are stored as snapshots in
+    the Gaphor cache directory, or in ``cache`` if it is a path. The data model
+    is not generated again if none of the inputs changed since the
+    output file was written.
+    """
     logging.basicConfig()
 
+    cache_dir = codegen_cache_dir() if cache is True else Path(cache) if cache else None
+    modelfiles = [modelfile, *(f for _, f in supermodelfiles or ())]
+    stamp_file = stamp = None
+    if cache_dir and outfile:
+        stamp_file = cache_dir / f"{Path(outfile).name}-{path_digest(outfile)}.stamp"
+        stamp = "\n".join(
+            sha256sum(f)
+            for f in [
+                *modelfiles,
+                *([overridesfile] if overridesfile else []),
+                __file__,
+                override.__file__,
+            ]
+        )
+        if is_up_to_date(outfile, stamp_file, stamp):
+            log.info("%s is up to date", outfile)
+            return
+
     extra_langs = (
         [
             load_modeling_language(lang)
@@ -98,10 +132,15 @@ def main(
         )
     )
 
-    model = load_model(modelfile, modeling_language)
+    # Parse all models at once, so they can be parsed in parallel
+    parsed = parse_models(modelfiles, cache_dir)
+    model = load_parsed(parsed[str(modelfile)], modeling_language)
     super_models = (
         [
-            (load_modeling_language(lang), load_model(f, modeling_language))
+            (
+                load_modeling_language(lang),
+                load_parsed(parsed[str(f)], modeling_language),
+            )
             for lang, f in supermodelfiles
         ]
         if supermodelfiles
@@ -117,14 +156,26 @@ def main(
         for line in coder(model, super_models, overrides):
             print(line, file=out)
 
+    if stamp_file and outfile:
+        stamp_file.write_text(f"{stamp}\n{sha256sum(outfile)}", encoding="utf-8")
+
 
-def load_model(modelfile: str, modeling_language: ModelingLanguage) -> ElementFactory:
+def load_model(
+    modelfile: str, modeling_language: ModelingLanguage, cache_dir: Path | None = None
+) -> ElementFactory:
+    return load_parsed(
+        parse_models([modelfile], cache_dir)[str(modelfile)], modeling_language
+    )
+
+
+def load_parsed(
+    parsed: tuple[dict[str, element], str], modeling_language: ModelingLanguage
+) -> ElementFactory:
+    elements, gaphor_version = parsed
     element_factory = ElementFactory()
-    with open(modelfile, encoding="utf-8") as file_obj:
-        storage.load(
-            file_obj,
-            element_factory,
-            modeling_language,
+    with element_factory.block_events():
+        storage.load_elements(
+            elements, element_factory, modeling_language, gaphor_version
         )
 
     resolve_attribute_type_values(element_factory)
@@ -132,6 +183,83 @@ def load_model(modelfile: str, modeling_language: ModelingLanguage) -> ElementFa
     return element_factory
 
 
+def parse_models(
+    modelfiles: Iterable[str | Path], cache_dir: Path | None = None
+) -> dict[str, tuple[dict[str, element], str]]:
+    """Parse model files, each in a separate process if there is more than
+    one model to parse.
+
+    If a cache directory is provided, parsed models are stored there as
+    snapshots, keyed by the digest of the model file. Unchanged models
+    are read from their snapshot instead.
+    """
+    filenames = list(dict.fromkeys(map(str, modelfiles)))
+    parsed: dict[str, tuple[dict[str, element], str]] = {}
+    snapshots: dict[str, Path] = {}
+    if cache_dir:
+        # Snapshots are invalidated when the parser changes
+        parser_digest = sha256sum(model_parser.__file__)[:16]
+        snapshots = {
+            f: cache_dir / f"{sha256sum(f)}-{parser_digest}.pickle" for f in filenames
+        }
+
+    for filename, snapshot in snapshots.items():
+        try:
+            with open(snapshot, "rb") as f:
+                parsed[filename] = pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except (EOFError, pickle.UnpicklingError):
+            log.warning("Snapshot %s is corrupt, parsing %s", snapshot, filename)
+
+    missing = [f for f in filenames if f not in parsed]
+    if len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=len(missing)) as executor:
+            parsed.update(
+                zip(missing, executor.map(storage.parse_file, missing), strict=True)
+            )
+    else:
+        parsed.update((f, storage.parse_file(f)) for f in missing)
+
+    for filename in missing:
+        if snapshot := snapshots.get(filename):
+            tmp = snapshot.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(parsed[filename], f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(snapshot)
+
+    return parsed
+
+
+def is_up_to_date(outfile: str | Path, stamp_file: Path, stamp: str) -> bool:
+    """Check if the output file is generated from the same inputs, and has
+    not changed since."""
+    try:
+        return stamp_file.read_text(encoding="utf-8") == (
+            f"{stamp}\n{sha256sum(outfile)}"
+        )
+    except FileNotFoundError:
+        return False
+
+
+def codegen_cache_dir() -> Path:
+    from gaphor.settings import get_cache_dir
+
+    cache_dir = get_cache_dir() / "codegen"
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
+
+def sha256sum(filename: str | Path) -> str:
+    with open(filename, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def path_digest(filename: str | Path) -> str:
+    path = str(Path(filename).resolve())
+    return hashlib.sha256(path.encode("utf-8")).hexdigest()[:16]
+
+
 def load_modeling_language(lang) -> ModelingLanguage:
     return initialize("gaphor.modelinglanguages", [lang])[lang]
 
@@ -156,6 +284,8 @@ def coder(
     if overrides and overrides.header:
         yield overrides.header
 
+    # Class names change while classes are imported, so keep count
+    class_names = Counter(c.name for c in classes)
     already_imported = set()
     for c in classes:
         if overrides and overrides.has_override(c.name):
@@ -167,8 +297,9 @@ def coder(
             if element_type and cls:
                 # always alias imported name
                 line = f"from {element_type.__module__} import {element_type.__name__}"
-                if len([t for t in classes if t.name == c.name]) > 1:
+                if class_names[c.name] > 1:
                     line += f" as _{c.name}"
+                    class_names[c.name] -= 1
                     c.name = f"_{c.name}"
                 yield line
                 already_imported.add(line)
@@ -405,17 +536,26 @@ def opposite(a):
 
 
 def order_classes(classes: Iterable[UML.Class]) -> Iterable[UML.Class]:
-    seen_classes = set()
-
-    def order(c):
-        if c not in seen_classes:
-            for b in bases(c):
-                yield from order(b)
-            yield c
-            seen_classes.add(c)
+    """Order classes, so base classes come before the classes derived from
+    them."""
+    seen_classes: set[UML.Class] = set()
 
     for c in classes:
-        yield from order(c)
+        if c in seen_classes:
+            continue
+        visiting = {c}
+        stack = [(c, iter(bases(c)))]
+        while stack:
+            cls, todo = stack[-1]
+            for b in todo:
+                if b not in seen_classes and b not in visiting:
+                    visiting.add(b)
+                    stack.append((b, iter(bases(b))))
+                    break
+            else:
+                stack.pop()
+                yield cls
+                seen_classes.add(cls)
 
 
 def bases(c: UML.Class) -> Iterable[UML.Class]:
@@ -511,21 +651,40 @@ def in_super_model(
     name: str, super_models: list[tuple[ModelingLanguage, ElementFactory]]
 ) -> tuple[type[Base], UML.Class] | tuple[None, None]:
     for modeling_language, factory in super_models:
-        cls: UML.Class
-        for cls in factory.select(  # type: ignore[assignment]
-            lambda e: isinstance(e, UML.Class) and e.name == name
-        ):
-            if not (is_in_profile(cls) or is_enumeration(cls)):
-                element_type = modeling_language.lookup_element(cls.name)
-                assert element_type, (
-                    f"Type {cls.name} found in model, but not in generated model"
-                )
-                return element_type, cls
+        if cls := super_model_classes(factory).get(name):
+            element_type = modeling_language.lookup_element(cls.name)
+            assert element_type, (
+                f"Type {cls.name} found in model, but not in generated model"
+            )
+            return element_type, cls
     return None, None
 
 
+_super_model_classes: WeakKeyDictionary[ElementFactory, dict[str, UML.Class]] = (
+    WeakKeyDictionary()
+)
+
+
+def super_model_classes(factory: ElementFactory) -> dict[str, UML.Class]:
+    """Index the classes in a super model by name.
+
+    Super models do not change while code is generated, so the index
+    is created only once.
+    """
+    if (index := _super_model_classes.get(factory)) is None:
+        index = _super_model_classes[factory] = {}
+        for cls in factory.select(UML.Class):
+            if not (cls.name in index or is_in_profile(cls) or is_enumeration(cls)):
+                index[cls.name] = cls
+    return index
+
+
 def resolve_attribute_type_values(element_factory: ElementFactory) -> None:
     """Some model updates that are hard to do from Gaphor itself."""
+    classes: dict[str, UML.Class] = {}
+    for cls in element_factory.select(UML.Class):
+        classes.setdefault(cls.name, cls)
+
     for prop in element_factory.select(UML.Property):
         if prop.typeValue in ("String", "str", "object"):
             prop.typeValue = "str"
@@ -538,12 +697,7 @@ def resolve_attribute_type_values(element_factory: ElementFactory) -> None:
             prop.typeValue = "int"
         elif prop.typeValue == "UnlimitedNatural":
             pass
-        elif c := next(
-            element_factory.select(
-                lambda e: isinstance(e, UML.Class) and e.name == prop.typeValue  # noqa: B023
-            ),
-            None,
-        ):
+        elif c := classes.get(prop.typeValue):
             prop.type = c  # type: ignore[assignment]
             del prop.typeValue
             prop.aggregation = "composite"
@@ -577,9 +731,15 @@ if __name__ == "__main__":
         help="Reference to dependent model file (e.g. UML:models/UML.gaphor)",
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache parsed models, and only generate the data model if inputs changed",
+    )
+
     args = parser.parse_args()
     supermodelfiles = (
         [s.split(":") for s in args.supermodelfiles] if args.supermodelfiles else []
     )
 
-    main(args.modelfile, supermodelfiles, args.overridesfile, args.outfile)
+    main(args.modelfile, supermodelfiles, args.overridesfile, args.outfile, args.cache)
@@ -1,6 +1,7 @@
 import pytest
 
 from gaphor import UML
+from gaphor.codegen import coder
 from gaphor.codegen.coder import (
     associations,
     attribute,
@@ -12,8 +13,11 @@ from gaphor.codegen.coder import (
     is_simple_type,
     load_model,
     load_modeling_language,
+    main,
     order_classes,
+    parse_models,
     resolve_attribute_type_values,
+    super_model_classes,
     variables,
 )
 from gaphor.core.format import parse
@@ -226,6 +230,26 @@ def test_order_classes(uml_metamodel):
     assert classes[2].name == "NamedElement"
 
 
+def test_order_classes_with_bases_first(uml_metamodel):
+    classes = list(order_classes(uml_metamodel.select(UML.Class)))
+    position = {c: i for i, c in enumerate(classes)}
+
+    assert len(position) == len(classes)
+    assert all(position[b] < position[c] for c in classes for b in bases(c))
+
+
+def test_super_model_classes(element_factory: ElementFactory):
+    class_ = element_factory.create(UML.Class)
+    class_.name = "A"
+    profile_class = element_factory.create(UML.Class)
+    profile_class.name = "B"
+    element_factory.create(UML.Profile).ownedType = profile_class
+    enumeration = element_factory.create(UML.Class)
+    enumeration.name = "AKind"
+
+    assert super_model_classes(element_factory) == {"A": class_}
+
+
 def test_coder_write_association(navigable_association: UML.Association):
     a = list(associations(navigable_association.memberEnd[0].type))
 
@@ -310,3 +334,67 @@ def test_replace_simple_attribute(uml_metamodel: ElementFactory):
     assert a.name == "isActive"
     assert a.typeValue == "bool"
     assert not a.type
+
+
+def test_parse_models_from_snapshot(tmp_path):
+    parsed = parse_models(["models/Core.gaphor"], tmp_path)
+    snapshots = list(tmp_path.glob("*.pickle"))
+    cached = parse_models(["models/Core.gaphor"], tmp_path)
+
+    assert len(snapshots) == 1
+    assert (
+        cached["models/Core.gaphor"][0].keys() == parsed["models/Core.gaphor"][0].keys()
+    )
+
+
+def test_generate_data_model_only_once(tmp_path):
+    outfile = tmp_path / "coremodel.py"
+
+    main(
+        "models/Core.gaphor",
+        overridesfile="models/Core.override",
+        outfile=str(outfile),
+        cache=tmp_path,
+    )
+    generated = outfile.stat().st_mtime_ns
+    main(
+        "models/Core.gaphor",
+        overridesfile="models/Core.override",
+        outfile=str(outfile),
+        cache=tmp_path,
+    )
+
+    assert outfile.stat().st_mtime_ns == generated
+
+
+def test_generate_data_model_when_output_changed(tmp_path):
+    outfile = tmp_path / "coremodel.py"
+
+    main(
+        "models/Core.gaphor",
+        overridesfile="models/Core.override",
+        outfile=str(outfile),
+        cache=tmp_path,
+    )
+    outfile.write_text("", encoding="utf-8")
+    main(
+        "models/Core.gaphor",
+        overridesfile="models/Core.override",
+        outfile=str(outfile),
+        cache=tmp_path,
+    )
+
+    assert "class PendingChange(Base):" in outfile.read_text(encoding="utf-8")
+
+
+def test_generate_data_model_without_cache(tmp_path, monkeypatch):
+    outfile = tmp_path / "coremodel.py"
+    monkeypatch.setattr(coder, "codegen_cache_dir", lambda: pytest.fail("cached"))
+
+    main(
+        "models/Core.gaphor",
+        overridesfile="models/Core.override",
+        outfile=str(outfile),
+    )
+
+    assert "class PendingChange(Base):" in outfile.read_text(encoding="utf-8")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Mapping
 from operator import setitem
 
 from gaphor.core.modeling import (
@@ -24,13 +24,20 @@ class UnmatchableModel(Exception):
 
 
 def compare(
-    current: ElementFactory, ancestor: ElementFactory, incoming: ElementFactory
+    current: ElementFactory,
+    ancestor: ElementFactory,
+    incoming: ElementFactory,
+    unchanged: Collection[str] = (),
 ) -> Iterable[ElementChange | ValueChange | RefChange]:
     """Compare two models.
 
     Changes are recorded in the current model as `PendingChange` objects
     (`ElementChange`, `ValueChange`, `RefChange`).
 
+    Elements with an id in ``unchanged`` are known to be the same in both
+    models, e.g. by their :func:`~gaphor.storage.storage.element_digests`.
+    They are not compared property by property.
+
     Returns an iterable of the added change objects.
     """
     ancestor_keys = set(ancestor.keys())
@@ -73,7 +80,7 @@ def compare(
             )
             yield from updated_properties(None, e, create)
 
-    for key in ancestor_keys.intersection(incoming_keys):
+    for key in ancestor_keys.intersection(incoming_keys).difference(unchanged):
         a = ancestor[key]
         i = incoming[key]
         if type(a) is not type(i):
@@ -90,6 +97,17 @@ def compare(
         )
 
 
+def unchanged_elements(
+    ancestor_digests: Mapping[str, bytes], incoming_digests: Mapping[str, bytes]
+) -> set[str]:
+    """Ids of elements with the same digest in both models."""
+    return {
+        id
+        for id, digest in ancestor_digests.items()
+        if incoming_digests.get(id) == digest
+    }
+
+
 def updated_properties(ancestor, incoming, create) -> Iterable[ValueChange | RefChange]:
     ancestor_vals: dict[str, Base | collection[Base] | str | int | None] = {}
     if ancestor:
@@ -1,7 +1,12 @@
 import pytest
 
 from gaphor.core.changeset.apply import get_value_change_property_value
-from gaphor.core.changeset.compare import RefChange, UnmatchableModel, compare
+from gaphor.core.changeset.compare import (
+    RefChange,
+    UnmatchableModel,
+    compare,
+    unchanged_elements,
+)
 from gaphor.core.modeling import (
     ElementFactory,
     PendingChange,
@@ -264,6 +269,23 @@ def test_style_sheet_with_different_ids(current, ancestor, incoming):
     assert not changes
 
 
+def test_unchanged_elements_are_not_compared(current, ancestor, incoming):
+    element = incoming.create(Class)
+    element.name = "Foo"
+    ancestor.create_as(Class, element.id)
+
+    change_set = list(compare(current, ancestor, incoming, {element.id}))
+
+    assert not change_set
+
+
+def test_unchanged_elements_have_equal_digests():
+    ancestor_digests = {"a": b"1", "b": b"2", "c": b"3"}
+    incoming_digests = {"a": b"1", "b": b"4", "d": b"3"}
+
+    assert unchanged_elements(ancestor_digests, incoming_digests) == {"a"}
+
+
 def test_style_sheet_comparison(current, ancestor, incoming):
     ancestor_style_sheet = ancestor.create(StyleSheet)
     incoming_style_sheet = incoming.create(StyleSheet)
@@ -167,6 +167,18 @@ class Base:
         log.debug("unlinking %s", self)
         self.handle(UnlinkEvent(self))
 
+    def dispose(self) -> None:
+        """Drop all references held by this element, without notification.
+
+        Unlike :meth:`unlink`, the opposite ends of associations are not
+        updated and no events are emitted. This is only safe when all related
+        elements are disposed of as well, e.g. when the whole model is flushed.
+        """
+        self._model = None
+        state = self.__dict__
+        for name in _property_attribute_names(type(self)):
+            state.pop(name, None)
+
     def handle(self, event: object) -> None:
         """Propagate incoming events.
 
@@ -206,6 +218,9 @@ class DummyEventWatcher:
     def watch(self, path: str, handler: Handler | None = None) -> DummyEventWatcher:
         return self
 
+    def rebind(self, element: Base) -> DummyEventWatcher:
+        return self
+
     def unsubscribe_all(self, *_args) -> None:
         pass
 
@@ -243,6 +258,8 @@ class EventWatcherProtocol(Protocol):
         self, path: str, handler: Handler | None = None
     ) -> EventWatcherProtocol: ...
 
+    def rebind(self, element: Base) -> EventWatcherProtocol: ...
+
     def unsubscribe_all(self) -> None: ...
 
 
@@ -266,3 +283,9 @@ def _resolve_modeling_language(module_name: str) -> str | None:
     if parent_name == module_name:
         return None
     return _resolve_modeling_language(parent_name)
+
+
+@cache
+def _property_attribute_names(cls: type[Base]) -> tuple[str, ...]:
+    """The instance attributes where the properties of ``cls`` store their values."""
+    return tuple(prop._name for prop in cls.__properties__)  # noqa: SLF001
@@ -6,9 +6,11 @@ Diagrams can be visualized and edited.
 from __future__ import annotations
 
 import logging
+import weakref
 from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cache
 from typing import (
     Protocol,
     TypeVar,
@@ -34,6 +36,7 @@ from gaphor.core.modeling.properties import (
 )
 from gaphor.core.modeling.stylesheet import StyleSheet
 from gaphor.core.styling import CompiledStyleSheet, Style, StyleNode
+from gaphor.core.tracing import span
 from gaphor.i18n import translation
 
 log = logging.getLogger(__name__)
@@ -74,11 +77,24 @@ class DrawContext:
     dropzone: bool
 
 
-@lru_cache
+@cache
+def _attribute_names(cls: type) -> dict[str, str]:
+    """Map normalized (lower case) names to real attribute names of a class."""
+    names: dict[str, str] = {}
+    for name in dir(cls):
+        names.setdefault(name.lower(), name)
+    return names
+
+
 def attrname(obj, lower_name):
     """Look up a real attribute name based on a lower case (normalized)
     name."""
-    return next((name for name in dir(obj) if name.lower() == lower_name), lower_name)
+    if name := _attribute_names(type(obj)).get(lower_name):
+        return name
+    return next(
+        (name for name in getattr(obj, "__dict__", ()) if name.lower() == lower_name),
+        lower_name,
+    )
 
 
 NO_ATTR = object()
@@ -116,6 +132,29 @@ def attrstr(obj):
     return ""
 
 
+_attribute_values: dict[tuple[Base, str], str | None] | None = None
+
+
+@contextmanager
+def attribute_cache() -> Iterator[None]:
+    """Memoize attribute lookups.
+
+    Within this context, :func:`lookup_attribute` returns the same value
+    for the same element and name. The model should not change while
+    the cache is active.
+    """
+    global _attribute_values
+    if _attribute_values is not None:
+        yield
+        return
+
+    _attribute_values = {}
+    try:
+        yield
+    finally:
+        _attribute_values = None
+
+
 def lookup_attribute(element: Base, name: str) -> str | None:
     """Look up an attribute from an element.
 
@@ -124,6 +163,18 @@ def lookup_attribute(element: Base, name: str) -> str | None:
     Returns ``""`` if the value is empty,
     ``None`` if the attribute does not exist.
     """
+    if (values := _attribute_values) is None:
+        return _lookup_attribute(element, name)
+
+    key = (element, name)
+    try:
+        return values[key]
+    except KeyError:
+        value = values[key] = _lookup_attribute(element, name)
+        return value
+
+
+def _lookup_attribute(element: Base, name: str) -> str | None:
     fields = name.split(".")
     values = list(rgetattr(element, fields))
     attr_values = [v for v in values if v is not NO_ATTR]
@@ -140,10 +191,14 @@ class StyledDiagram:
         dark_mode: bool | None = None,
     ):
         self.diagram = diagram
-        self.selection = selection
+        self._selection = weakref.ref(selection) if selection is not None else None
         self.pseudo: str | None = None
         self.dark_mode = dark_mode
 
+    @property
+    def selection(self) -> gaphas.selection.Selection | None:
+        return self._selection() if self._selection else None
+
     def name(self) -> str:
         return "diagram"
 
@@ -151,9 +206,10 @@ class StyledDiagram:
         return None
 
     def children(self) -> Iterator[StyleNode]:
+        diagram = self.diagram
         return (
-            StyledItem(item, self.selection, dark_mode=self.dark_mode)
-            for item in self.diagram.get_all_items()
+            diagram.styled_item(item, self.selection, dark_mode=self.dark_mode)
+            for item in diagram.get_all_items()
             if not item.parent
         )
 
@@ -167,7 +223,7 @@ class StyledDiagram:
         return hash((self.diagram, self.state(), self.dark_mode))
 
     def __eq__(self, other):
-        return (
+        return other is self or (
             isinstance(other, StyledDiagram)
             and self.diagram == other.diagram
             and self.state() == other.state()
@@ -179,7 +235,9 @@ class StyledItem:
     """Wrapper to allow style information to be retrieved.
 
     For convenience, a selection can be added. The selection instance
-    will provide pseudo-classes for the item (focus, hover, etc.).
+    will provide pseudo-classes for the item (focus, hover, etc.). The
+    state is taken when the node is created. Nodes handed out by
+    :meth:`Diagram.styled_item` are dropped when the selection changes.
     """
 
     def __init__(
@@ -191,20 +249,16 @@ class StyledItem:
         assert item.diagram
         self.item = item
         self.diagram = item.diagram
-        self.selection = selection
+        self._selection = weakref.ref(selection) if selection is not None else None
         self.pseudo: str | None = None
         self.dark_mode = dark_mode
-        self._state = (
-            (
-                "active" if item in selection.selected_items else "",
-                "focus" if item is selection.focused_item else "",
-                "hover" if item is selection.hovered_item else "",
-                "drop" if item is selection.dropzone_item else "",
-                "disabled" if item in selection.grayed_out_items else "",
-            )
-            if selection
-            else ()
-        )
+        self._state = item_state(item, selection)
+        # The parent is part of the identity, so the state of ancestors is too
+        self._hash = hash((item, self._state, dark_mode, self.parent()))
+
+    @property
+    def selection(self) -> gaphas.selection.Selection | None:
+        return self._selection() if self._selection else None
 
     def name(self) -> str:
         return css_name(self.item)
@@ -212,9 +266,9 @@ class StyledItem:
     def parent(self) -> StyleNode | None:
         parent = self.item.parent
         return (
-            StyledItem(parent, self.selection, dark_mode=self.dark_mode)
+            self.diagram.styled_item(parent, self.selection, dark_mode=self.dark_mode)
             if parent
-            else StyledDiagram(self.diagram, self.selection, self.dark_mode)
+            else self.diagram.styled_diagram(self.selection, self.dark_mode)
         )
 
     def children(self) -> Iterator[StyleNode]:
@@ -223,7 +277,7 @@ class StyledItem:
 
         selection = self.selection
         yield from (
-            StyledItem(child, selection, dark_mode=self.dark_mode)
+            self.diagram.styled_item(child, selection, dark_mode=self.dark_mode)
             for child in item.children
         )
 
@@ -243,17 +297,37 @@ class StyledItem:
         return self._state
 
     def __hash__(self):
-        return hash((self.item, self.state(), self.dark_mode))
+        return self._hash
 
     def __eq__(self, other):
-        return (
+        return other is self or (
             isinstance(other, StyledItem)
             and self.item == other.item
             and self.state() == other.state()
             and self.dark_mode == other.dark_mode
+            and self.parent() == other.parent()
         )
 
 
+def item_state(
+    item: Presentation, selection: gaphas.selection.Selection | None
+) -> tuple[str, ...]:
+    return (
+        (
+            "active" if item in selection.selected_items else "",
+            "focus" if item is selection.focused_item else "",
+            "hover" if item is selection.hovered_item else "",
+            "drop" if item is selection.dropzone_item else "",
+            "disabled" if item in selection.grayed_out_items else "",
+        )
+        if selection
+        else ()
+    )
+
+
+StyleNodes = dict[tuple[Presentation | None, bool | None], StyledItem | StyledDiagram]
+
+
 def css_name(item) -> str:
     return type(item).__name__.removesuffix("Item").lower()
 
@@ -281,6 +355,12 @@ class Diagram(Base):
         self._compiled_style_sheet: CompiledStyleSheet | None = None
         self._registered_views: set[gaphas.model.View] = set()
         self._dirty_items: set[gaphas.Item] = set()
+        self._revision = 0
+        self._item_revisions: dict[gaphas.Item, int] = {}
+        self._style_nodes: StyleNodes = {}
+        self._selection_style_nodes: weakref.WeakKeyDictionary[
+            gaphas.selection.Selection, StyleNodes
+        ] = weakref.WeakKeyDictionary()
 
         self._watcher = self.watcher()
         self._watcher.watch("ownedPresentation", self._owned_presentation_changed)
@@ -330,6 +410,48 @@ class Diagram(Base):
             else FALLBACK_STYLE
         )
 
+    def styled_item(
+        self,
+        item: Presentation,
+        selection: gaphas.selection.Selection | None = None,
+        dark_mode: bool | None = None,
+    ) -> StyledItem:
+        """A style node for an item in this diagram.
+
+        Nodes are shared until the compiled style sheet is reset or the
+        selection changes, so repeated style lookups for an item are cheap.
+        """
+        nodes = self._style_nodes_for(selection)
+        if (node := nodes.get((item, dark_mode))) is None:
+            node = nodes[item, dark_mode] = StyledItem(item, selection, dark_mode)
+        return node  # type: ignore[return-value]
+
+    def styled_diagram(
+        self,
+        selection: gaphas.selection.Selection | None = None,
+        dark_mode: bool | None = None,
+    ) -> StyledDiagram:
+        """A style node for this diagram, shared like :meth:`styled_item`."""
+        nodes = self._style_nodes_for(selection)
+        if (node := nodes.get((None, dark_mode))) is None:
+            node = nodes[None, dark_mode] = StyledDiagram(self, selection, dark_mode)
+        return node  # type: ignore[return-value]
+
+    def _style_nodes_for(
+        self, selection: gaphas.selection.Selection | None
+    ) -> StyleNodes:
+        if selection is None:
+            return self._style_nodes
+        if (nodes := self._selection_style_nodes.get(selection)) is None:
+            nodes = self._selection_style_nodes[selection] = {}
+            selection.add_handler(lambda _item: nodes.clear())
+        return nodes
+
+    def _clear_style_nodes(self) -> None:
+        self._style_nodes.clear()
+        for nodes in self._selection_style_nodes.values():
+            nodes.clear()
+
     def gettext(self, message: str) -> str:
         """Translate a message to the language used in the model."""
         style_sheet = self.styleSheet
@@ -347,6 +469,8 @@ class Diagram(Base):
         type_: type[P],
         parent: Presentation | None = None,
         subject: Base | None = None,
+        *,
+        update: bool = True,
     ) -> P:
         """Create a new diagram item on the diagram.
 
@@ -354,9 +478,12 @@ class Diagram(Base):
         diagram's root item.  The type parameter is the element class to
         create.  The new element also has an optional parent and
         subject.
+
+        If ``update`` is false, the item is only scheduled for updating,
+        like :meth:`request_update`.
         """
 
-        return self.create_as(type_, generate_id(), parent, subject)
+        return self.create_as(type_, generate_id(), parent, subject, update=update)
 
     def create_as(
         self,
@@ -364,6 +491,8 @@ class Diagram(Base):
         id: Id,
         parent: Presentation | None = None,
         subject: Base | None = None,
+        *,
+        update: bool = True,
     ) -> P:
         assert isinstance(self.model, PresentationRepositoryProtocol)
         item = self.model.create_as(type_, id, diagram=self)
@@ -374,7 +503,10 @@ class Diagram(Base):
         if parent:
             item.parent = parent
 
-        self.update({item})
+        if update:
+            self.update({item})
+        else:
+            self.request_update(item)
         return item
 
     def lookup(self, id: Id) -> Presentation | None:
@@ -391,6 +523,14 @@ class Diagram(Base):
         self._watcher.unsubscribe_all()
         super().unlink()
 
+    def dispose(self) -> None:
+        self._connections = gaphas.connections.Connections()
+        self._dirty_items.clear()
+        self._item_revisions.clear()
+        self._compiled_style_sheet = None
+        self._clear_style_nodes()
+        super().dispose()
+
     @overload
     def select(
         self, expression: Callable[[Presentation], bool]
@@ -422,18 +562,27 @@ class Diagram(Base):
 
         # Clear our (cached) style sheet first
         self._compiled_style_sheet = None
+        self._clear_style_nodes()
 
         def dirty_items_with_ancestors():
             for item in self._dirty_items:
                 yield item
                 yield from gaphas.canvas.ancestors(self, item)
 
-        for item in reversed(list(self.sort(dirty_items_with_ancestors()))):
-            if update := getattr(item, "update", None):
-                update(UpdateContext(style=self.style(StyledItem(item))))
+        with span("diagram.update", items=len(self._dirty_items)):
+            updated_items = list(self.sort(dirty_items_with_ancestors()))
+            with attribute_cache():
+                for item in reversed(updated_items):
+                    if update := getattr(item, "update", None):
+                        update(UpdateContext(style=self.style(self.styled_item(item))))
 
-        self._connections.solve()
+            self._connections.solve()
 
+        # Drawings made between the update request and now are outdated
+        self._revision += 1
+        self._item_revisions.update(
+            dict.fromkeys([*updated_items, *self._dirty_items], self._revision)
+        )
         self._dirty_items.clear()
 
     # gaphas.model.Model protocol:
@@ -470,6 +619,27 @@ class Diagram(Base):
     def update_now(self, _dirty_items: Collection[Presentation]) -> None:
         pass
 
+    def request_update_all(self) -> None:
+        """Schedule all items in the diagram for updating.
+
+        Used to defer the update of a diagram, for example after it has
+        been loaded, until :meth:`update` is invoked.
+        """
+        self._update_dirty_items(dirty_items=self.ownedPresentation)
+
+    def revision(self, item: Presentation) -> int:
+        """A number that changes every time ``item`` requests an update,
+        and once it has been updated.
+
+        It can be used to tell if cached drawings of an item are outdated.
+        """
+        return self._item_revisions.get(item, 0)
+
+    @property
+    def update_pending(self) -> bool:
+        """``True`` if items are waiting to be updated."""
+        return bool(self._dirty_items)
+
     def register_view(self, view: gaphas.model.View[Presentation]) -> None:
         self._registered_views.add(view)
 
@@ -482,8 +652,13 @@ class Diagram(Base):
 
         if dirty_items:
             self._dirty_items.update(dirty_items)
+            self._revision += 1
+            self._item_revisions.update(dict.fromkeys(dirty_items, self._revision))
         if removed_items:
             self._dirty_items.difference_update(removed_items)
+            for item in removed_items:
+                self._item_revisions.pop(item, None)
+            self._clear_style_nodes()
 
         if should_emit:
             self.handle(DiagramUpdateRequested(self))
@@ -55,6 +55,18 @@ class EventWatcher:
             dispatcher.subscribe(self._watched_paths[path], self.element, path)
         return self
 
+    def rebind(self, element: Base) -> EventWatcher:
+        """Watch the same paths, starting from another element.
+
+        This interface is fluent (returns self).
+        """
+        self.unsubscribe_all()
+        self.element = element
+        if dispatcher := self.element_dispatcher:
+            for path, handler in self._watched_paths.items():
+                dispatcher.subscribe(handler, element, path)
+        return self
+
     def unsubscribe_all(self, *_args):
         """Unregister handlers.
 
@@ -140,6 +152,11 @@ class ElementDispatcher(Service):
                     del self._handlers[key]
         del self._reverse[handler]
 
+    def clear(self) -> None:
+        """Unregister all handlers, e.g. when the whole model is flushed."""
+        self._handlers.clear()
+        self._reverse.clear()
+
     def _path_to_properties(self, element: Base, path: str) -> tuple[umlproperty]:
         """Given a start element and a path, return a tuple of properties
         (association, attribute, etc.) representing the path."""
@@ -190,15 +190,17 @@ class ElementFactory(Service):
     def flush(self) -> None:
         """Flush all elements (remove them from the factory).
 
-        Diagram elements are flushed first. The remaining elements are
-        flushed next.
+        The model is disposed of as a whole: elements are not unlinked
+        one by one, but all references between elements are dropped at once.
+        Only a :obj:`~gaphor.core.modeling.event.ModelFlushed` event is emitted.
         """
-        with self.block_events():
-            for element in self.lselect(Diagram):
-                element.unlink()
+        elements = list(self._elements.values())
+        self._elements.clear()
+        if self.element_dispatcher:
+            self.element_dispatcher.clear()
 
-            for element in self.lselect():
-                element.unlink()
+        for element in elements:
+            element.dispose()
 
         self.handle(ModelFlushed(self))
 
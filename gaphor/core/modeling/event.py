@@ -245,14 +245,22 @@ class ElementDeleted(ModelChanged):
 class ModelReady(ModelChanged):
     """A generic element factory event."""
 
-    def __init__(self, service, filename: Path | None = None, modified=False):
+    def __init__(
+        self,
+        service,
+        filename: Path | None = None,
+        modified=False,
+        digest: str | None = None,
+    ):
         """Constructor.
 
         The service parameter is the service the emitted the event.
+        The digest is the SHA-256 hex digest of the file, if known.
         """
         super().__init__(service)
         self.filename = filename
         self.modified = modified
+        self.digest = digest
 
 
 class ModelFlushed(ModelChanged):
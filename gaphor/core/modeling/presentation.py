@@ -134,6 +134,10 @@ class Presentation(Matrices, Base, Generic[S]):
             log.debug("unlinking %s", self)
             self.handle(UnlinkEvent(self, diagram=diagram))
 
+    def dispose(self) -> None:
+        self._original_diagram = None
+        super().dispose()
+
     def _on_diagram_changed(self, event):
         new_value = event.new_value
         if new_value and new_value is not self._original_diagram:
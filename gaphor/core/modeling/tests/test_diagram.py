@@ -110,6 +110,28 @@ def test_remove_presentation_triggers_view(element_factory):
     assert example in view.removed_items
 
 
+def test_revision_changes_on_update_request(diagram):
+    example = diagram.create(Example)
+    other = diagram.create(Example)
+    revision = diagram.revision(example)
+    other_revision = diagram.revision(other)
+
+    diagram.request_update(example)
+
+    assert diagram.revision(example) != revision
+    assert diagram.revision(other) == other_revision
+
+
+def test_revision_changes_on_update(diagram):
+    example = diagram.create(Example)
+    diagram.request_update(example)
+    revision = diagram.revision(example)
+
+    diagram.update()
+
+    assert diagram.revision(example) != revision
+
+
 def test_order_presentations_lines_are_last(diagram):
     example_line = diagram.create(ExampleLine)
     example = diagram.create(Example)
@@ -1,5 +1,9 @@
+import gc
+import weakref
+
 import gaphas
 import pytest
+from gaphas.selection import Selection
 
 from gaphor.core.eventmanager import EventManager
 from gaphor.core.modeling import ElementFactory, Presentation, StyleSheet
@@ -52,3 +56,56 @@ def test_style_sheet_has_default_style():
     style_sheet = StyleSheet()
 
     assert "diagram {" in style_sheet.styleSheet
+
+
+def test_styled_items_are_shared(diagram):
+    item = diagram.create(DemoItem)
+
+    assert diagram.styled_item(item) is diagram.styled_item(item)
+    assert diagram.styled_item(item).parent() is diagram.styled_diagram()
+
+
+def test_styled_items_are_not_shared_after_update(diagram):
+    item = diagram.create(DemoItem)
+    node = diagram.styled_item(item)
+
+    diagram.update()
+
+    assert diagram.styled_item(item) is not node
+    assert diagram.styled_item(item) == node
+
+
+def test_styled_items_are_dropped_when_selection_changes(diagram):
+    item = diagram.create(DemoItem)
+    selection = Selection()
+    node = diagram.styled_item(item, selection)
+
+    assert diagram.styled_item(item, selection) is node
+
+    selection.hovered_item = item
+
+    assert diagram.styled_item(item, selection) is not node
+    assert "hover" in diagram.styled_item(item, selection).state()
+
+
+def test_styled_item_depends_on_parent_state(diagram):
+    parent = diagram.create(DemoItem)
+    item = diagram.create(DemoItem, parent=parent)
+    selection = Selection()
+    node = diagram.styled_item(item, selection)
+
+    selection.hovered_item = parent
+
+    assert diagram.styled_item(item, selection) != node
+
+
+def test_styled_items_do_not_keep_selection_alive(diagram):
+    item = diagram.create(DemoItem)
+    selection = Selection()
+    selection_ref = weakref.ref(selection)
+    diagram.styled_item(item, selection)
+
+    del selection
+    gc.collect()
+
+    assert selection_ref() is None
@@ -418,6 +418,20 @@ def test_braking_big_diamond(element_factory, dispatcher, handler):
     assert len(dispatcher._handlers) == 0
 
 
+def test_rebind_watcher(element_factory, dispatcher, handler):
+    a = element_factory.create(A)
+    b = element_factory.create(A)
+    watcher = EventWatcher(a, dispatcher, handler)
+    watcher.watch("one")
+
+    watcher.rebind(b)
+    a.one = element_factory.create(A)
+    b.one = element_factory.create(A)
+
+    assert len(handler.events) == 1
+    assert handler.events[0].element is b
+
+
 def test_cyclic(element_factory, dispatcher, handler):
     """Test cyclic dependency a -> b -> c -> a."""
     a = element_factory.create(A)
@@ -143,6 +143,30 @@ def test_flush_event(element_factory):
     assert isinstance(last_event, ModelFlushed)
 
 
+def test_flush_drops_references(element_factory):
+    p = element_factory.create(Parameter)
+    defaultValue = element_factory.create(LiteralString)
+    p.defaultValue = defaultValue
+    p.name = "p"
+
+    element_factory.flush()
+
+    assert p.defaultValue is None
+    assert defaultValue.owningParameter is None
+    assert p.name is None
+    with pytest.raises(TypeError):
+        assert p.model
+
+
+def test_flush_unsubscribes_element_handlers(element_factory):
+    p = element_factory.create(Parameter)
+    p.watcher(default_handler=handler).watch("name")
+
+    element_factory.flush()
+
+    assert not element_factory.element_dispatcher._handlers  # noqa: SLF001
+
+
 def test_no_create_events_when_blocked(element_factory):
     with element_factory.block_events():
         element_factory.create(Parameter)
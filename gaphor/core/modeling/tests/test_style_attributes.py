@@ -3,6 +3,7 @@ from gaphor.core.modeling.collection import collection
 from gaphor.core.modeling.diagram import (
     Diagram,
     StyledItem,
+    attribute_cache,
     attrname,
     lookup_attribute,
 )
@@ -131,6 +132,31 @@ def test_attrname_collection_subject(diagram):
     assert attrname(collection1, "subject") == "subject"
 
 
+def test_attrname_mixed_case():
+    diagram = Diagram()
+    assert attrname(diagram, "diagramtype") == "diagramType"
+
+
+def test_attrname_instance_attribute():
+    class Plain:
+        def __init__(self):
+            self.customValue = 1
+
+    assert attrname(Plain(), "customvalue") == "customValue"
+
+
+def test_attribute_cache_memoizes_values():
+    diagram = Diagram()
+    diagram.diagramType = "first"
+
+    with attribute_cache():
+        assert lookup_attribute(diagram, "diagramType") == "first"
+        diagram.diagramType = "second"
+        assert lookup_attribute(diagram, "diagramType") == "first"
+
+    assert lookup_attribute(diagram, "diagramType") == "second"
+
+
 def test_attribute_on_item_and_not_on_subject(diagram, element_factory):
     class_ = element_factory.create(UML.Class)
     classitem = diagram.create(ClassItem, subject=class_)
@@ -0,0 +1,87 @@
+import json
+
+from gaphor.core.tracing import Tracer, mark, span, tracing
+
+
+def test_span_is_not_recorded_without_tracer():
+    tracer = Tracer()
+
+    with span("test"):
+        pass
+
+    assert tracer.spans == []
+
+
+def test_span_is_recorded():
+    with tracing() as tracer:
+        with span("test", elements=3):
+            pass
+
+    (recorded,) = tracer.spans
+
+    assert recorded.name == "test"
+    assert recorded.duration >= 0
+    assert recorded.args == {"elements": 3}
+
+
+def test_span_info_can_be_added():
+    with tracing() as tracer:
+        with span("test") as info:
+            info["diagrams"] = 2
+
+    assert tracer.spans[0].args == {"diagrams": 2}
+
+
+def test_mark_is_recorded_from_start_of_tracer():
+    with tracing() as tracer:
+        with span("test"):
+            pass
+        mark("milestone")
+
+    recorded = tracer.spans[-1]
+
+    assert recorded.name == "milestone"
+    assert recorded.start == 0
+    assert recorded.duration >= tracer.spans[0].duration
+
+
+def test_nested_spans():
+    with tracing() as tracer:
+        with span("outer"):
+            with span("inner"):
+                pass
+
+    inner, outer = tracer.spans
+
+    assert inner.name == "inner"
+    assert outer.name == "outer"
+    assert outer.start <= inner.start
+    assert outer.duration >= inner.duration
+
+
+def test_write_chrome_trace(tmp_path):
+    with tracing() as tracer:
+        with span("load.parse", elements=1):
+            pass
+
+    trace_file = tmp_path / "trace.json"
+    tracer.write(trace_file, "chrome")
+    data = json.loads(trace_file.read_text(encoding="utf-8"))
+
+    (event,) = data["traceEvents"]
+    assert event["name"] == "load.parse"
+    assert event["cat"] == "load"
+    assert event["ph"] == "X"
+    assert event["args"] == {"elements": 1}
+
+
+def test_write_json(tmp_path):
+    with tracing() as tracer:
+        with span("save"):
+            pass
+
+    trace_file = tmp_path / "trace.json"
+    tracer.write(trace_file, "json")
+    data = json.loads(trace_file.read_text(encoding="utf-8"))
+
+    assert data["spans"][0]["name"] == "save"
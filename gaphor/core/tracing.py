@@ -0,0 +1,142 @@
+"""Named timing spans, to follow the performance of Gaphor over time.
+
+Spans are only recorded while a :class:`Tracer` is active, e.g. when Gaphor
+is started with ``--trace FILE``. Otherwise a span is a no-op.
+
+Spans wrapping a generator (such as :func:`gaphor.storage.storage.load_generator`)
+also include the time spent by the consumer of the generator.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+TraceFormat = Literal["json", "chrome"]
+
+
+@dataclass
+class Span:
+    """A named, timed section of code.
+
+    Start and duration are in seconds. Start is relative to the
+    start of the tracer.
+    """
+
+    name: str
+    start: float
+    duration: float
+    args: dict[str, object] = field(default_factory=dict)
+    thread_id: int = 0
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+
+    @property
+    def origin(self) -> float:
+        return self._origin
+
+    def add(self, name: str, start: float, end: float, args: dict[str, object]):
+        self.spans.append(
+            Span(
+                name,
+                start - self._origin,
+                end - start,
+                args,
+                threading.get_ident(),
+            )
+        )
+
+    def to_json(self) -> dict[str, object]:
+        """A plain JSON representation of the recorded spans."""
+        return {
+            "spans": [
+                {
+                    "name": s.name,
+                    "start": s.start,
+                    "duration": s.duration,
+                    "args": s.args,
+                }
+                for s in self.spans
+            ]
+        }
+
+    def to_trace_events(self) -> dict[str, object]:
+        """Spans in Chrome's Trace Event Format.
+
+        The file can be viewed in ``about://tracing`` or https://ui.perfetto.dev.
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": s.name,
+                    "cat": s.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": s.start * 1_000_000,
+                    "dur": s.duration * 1_000_000,
+                    "pid": pid,
+                    "tid": s.thread_id,
+                    "args": s.args,
+                }
+                for s in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, filename: str | Path, format: TraceFormat = "chrome") -> None:
+        data = self.to_trace_events() if format == "chrome" else self.to_json()
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, default=str)
+
+
+_tracer: Tracer | None = None
+
+
+@contextmanager
+def tracing(tracer: Tracer | None = None) -> Iterator[Tracer]:
+    """Record spans for the duration of this context."""
+    global _tracer
+    previous = _tracer
+    active = _tracer = tracer or Tracer()
+    try:
+        yield active
+    finally:
+        _tracer = previous
+
+
+@contextmanager
+def span(name: str, **args: object) -> Iterator[dict[str, object]]:
+    """Time a section of code.
+
+    The yielded dictionary can be used to add information
+    to the span, such as the amount of elements processed.
+    """
+    if (tracer := _tracer) is None:
+        yield args
+        return
+
+    start = time.perf_counter()
+    try:
+        yield args
+    finally:
+        tracer.add(name, start, time.perf_counter(), args)
+
+
+def mark(name: str, **args: object) -> None:
+    """Record a point in time, as a span from the start of the tracer.
+
+    Used for milestones, such as the main window being shown.
+    """
+    if (tracer := _tracer) is not None:
+        tracer.add(name, tracer.origin, time.perf_counter(), args)
@@ -17,16 +17,28 @@ and yields it. On the next invocation it will populate the element and perform
 complete the model loading.
 
 `copy()` and `paste()` use `Base`'s `save()` and `load()` methods.
+
+`encode_copy_data()` turns copied data into bytes. Element classes are stored by
+modeling language and name, so `decode_copy_data()` can restore the data in
+another session, or another Gaphor instance.
+
+Within a `bulk_paste()` context, pasted elements are not post-loaded and
+diagrams are not updated per element. `paste_full()` and `paste_link()` do
+this once, after all elements have been pasted.
 """
 
 from __future__ import annotations
 
+import json
+import zlib
 from collections.abc import Callable, Collection, Iterable, Iterator
+from contextlib import contextmanager
 from functools import singledispatch
 from typing import NamedTuple
 
 from gaphor.core.modeling import Base, Diagram, Id, Presentation
 from gaphor.core.modeling.collection import collection
+from gaphor.core.modeling.modelinglanguage import ModelingLanguage
 from gaphor.diagram.group import owner, owns
 
 Opaque = object
@@ -71,6 +83,86 @@ def paste_full(copy_data: Opaque, diagram: Diagram) -> set[Presentation]:
     return _paste(copy_data, diagram, full=True)
 
 
+def encode_copy_data(copy_data: CopyData) -> bytes:
+    """Serialize copy data to a compact byte string."""
+    return zlib.compress(
+        json.dumps(_encode(copy_data), separators=(",", ":")).encode("utf-8")
+    )
+
+
+def decode_copy_data(data: bytes, modeling_language: ModelingLanguage) -> CopyData:
+    """Restore copy data serialized with :func:`encode_copy_data`.
+
+    Raises a ``ValueError`` if the data can not be decoded.
+    """
+    try:
+        decoded = json.loads(zlib.decompress(data))
+    except (zlib.error, UnicodeDecodeError) as e:
+        raise ValueError("Data is not a copy buffer") from e
+
+    copy_data = _decode(decoded, modeling_language, _copy_types())
+    if not isinstance(copy_data, CopyData):
+        raise ValueError("Data is not a copy buffer")
+    return copy_data
+
+
+def _copy_types() -> dict[str, type[tuple]]:
+    """Types of copied data, as registered with `paste()`."""
+    return {
+        f"{t.__module__}.{t.__qualname__}": t
+        for t in (CopyData, *paste.registry)
+        if issubclass(t, tuple) and hasattr(t, "_fields")
+    }
+
+
+def _encode(value):
+    if value is None or isinstance(value, str | int | float):
+        return value
+    if isinstance(value, type) and issubclass(value, Base):
+        return ["c", value.__modeling_language__, value.__name__]
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        t = type(value)
+        return ["t", f"{t.__module__}.{t.__qualname__}", [_encode(v) for v in value]]
+    if isinstance(value, dict):
+        return ["d", {k: _encode(v) for k, v in value.items()}]
+    if isinstance(value, set | frozenset):
+        return ["s", [_encode(v) for v in value]]
+    if isinstance(value, tuple):
+        return ["u", [_encode(v) for v in value]]
+    if isinstance(value, list):
+        return ["l", [_encode(v) for v in value]]
+    raise ValueError(f"Can not serialize {value!r}")
+
+
+def _decode(value, modeling_language, copy_types):
+    if not isinstance(value, list):
+        return value
+
+    def decode_all(values):
+        return [_decode(v, modeling_language, copy_types) for v in values]
+
+    match value:
+        case ["c", ns, name]:
+            if not (cls := modeling_language.lookup_element(name, ns)):
+                raise ValueError(f"Unknown element type {ns}:{name}")
+            return cls
+        case ["t", name, values]:
+            if name not in copy_types:
+                raise ValueError(f"Unknown copy type {name}")
+            return copy_types[name](*decode_all(values))
+        case ["d", values]:
+            return {
+                k: _decode(v, modeling_language, copy_types) for k, v in values.items()
+            }
+        case ["s", values]:
+            return set(decode_all(values))
+        case ["u", values]:
+            return tuple(decode_all(values))
+        case ["l", values]:
+            return decode_all(values)
+    raise ValueError(f"Can not deserialize {value!r}")
+
+
 @singledispatch
 def copy(obj: Base | Iterable) -> Iterator[tuple[Id, Opaque]]:
     """Create a copy of an element (or list of elements).
@@ -93,6 +185,28 @@ def paste(
     raise ValueError(f"No paster for {copy_data}")
 
 
+_bulk_paste = False
+
+
+@contextmanager
+def bulk_paste() -> Iterator[None]:
+    """Defer post-loading and updating pasted elements.
+
+    The caller is responsible for calling ``postload()`` on the pasted
+    elements, and for updating the diagrams, once all elements are pasted.
+    """
+    global _bulk_paste
+    if _bulk_paste:
+        yield
+        return
+
+    _bulk_paste = True
+    try:
+        yield
+    finally:
+        _bulk_paste = False
+
+
 def serialize(value):
     if isinstance(value, Base):
         return ("r", value.id)
@@ -169,7 +283,8 @@ def paste_element(
         for value in deserialize(ser, lookup):
             if not filter or filter(name, value):
                 element.load(name, value)
-    element.postload()
+    if not _bulk_paste:
+        element.postload()
 
 
 paste.register(BaseCopy, paste_element)
@@ -205,7 +320,7 @@ def _copy_presentation(item: Presentation) -> Iterator[tuple[Id, object]]:
 def _paste_presentation(copy_data: PresentationCopy, _diagram, lookup):
     cls, data, diagram_ref, parent = copy_data
     diagram = lookup(diagram_ref)
-    item = diagram.create(cls)
+    item = diagram.create(cls, update=not _bulk_paste)
     yield item
     if parent:
         if p := lookup(parent):
@@ -214,7 +329,8 @@ def _paste_presentation(copy_data: PresentationCopy, _diagram, lookup):
     for name, ser in data.items():
         for value in deserialize(ser, lookup):
             item.load(name, value)
-    diagram.update({item})
+    if not _bulk_paste:
+        diagram.update({item})
 
 
 def _paste(copy_data: Opaque, diagram: Diagram, full: bool) -> set[Presentation]:
@@ -245,17 +361,22 @@ def _paste(copy_data: Opaque, diagram: Diagram, full: bool) -> set[Presentation]
         if looked_up := diagram.lookup(ref):
             return looked_up
 
-    for old_id in copy_data.elements.keys():
-        if old_id in new_elements:
-            continue
-        element_lookup(old_id)
+    with bulk_paste():
+        for old_id in copy_data.elements.keys():
+            if old_id in new_elements:
+                continue
+            element_lookup(old_id)
 
     for element in new_elements.values():
         assert element
         element.postload()
 
-    return {
-        e
-        for e in new_elements.values()
-        if isinstance(e, Presentation) and e.diagram is diagram
-    }
+    pasted_items: dict[Diagram, set[Presentation]] = {}
+    for e in new_elements.values():
+        if isinstance(e, Presentation) and e.diagram:
+            pasted_items.setdefault(e.diagram, set()).add(e)
+
+    for d, items in pasted_items.items():
+        d.update(items)
+
+    return pasted_items.get(diagram, set())
@@ -7,6 +7,7 @@ from gaphas.geometry import Rectangle
 from gaphas.painter import FreeHandPainter, PainterChain
 
 from gaphor.core.modeling.diagram import StyledDiagram
+from gaphor.core.tracing import span
 from gaphor.diagram.painter import DiagramTypePainter, ItemPainter
 
 
@@ -15,6 +16,11 @@ def escape_filename(diagram_name):
 
 
 def render(diagram, new_surface, padding=8, write_to_png=None) -> None:
+    with span("export.render", items=len(diagram.ownedPresentation)):
+        _render(diagram, new_surface, padding, write_to_png)
+
+
+def _render(diagram, new_surface, padding, write_to_png) -> None:
     diagram.update(diagram.ownedPresentation)
 
     painter = new_painter(diagram)
@@ -8,52 +8,146 @@ and handles).
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from functools import singledispatch
+from typing import NamedTuple
+from weakref import WeakKeyDictionary
 
+import cairo
 from cairo import LINE_JOIN_ROUND
 
-from gaphor.core.modeling.diagram import Diagram, DrawContext, StyledItem
+from gaphor.core.modeling.diagram import (
+    Diagram,
+    DrawContext,
+    attribute_cache,
+)
+from gaphor.core.styling import Style, StyleNode
 from gaphor.diagram.selection import Selection
 
 
 class ItemPainter:
+    """Draw diagram items.
+
+    If ``cache`` is set, items are drawn on a cairo recording surface
+    once, and replayed as long as the item did not request an update
+    and its computed style did not change. The style covers the state of
+    the item and its ancestors (selection, hover, disabled, etc.) and
+    attribute selectors. Recordings are resolution independent, so they
+    can be replayed at any zoom level. Replay is clipped to the area the
+    item drew on.
+    """
+
     def __init__(
-        self, selection: Selection | None = None, dark_mode: bool | None = None
+        self,
+        selection: Selection | None = None,
+        dark_mode: bool | None = None,
+        cache: bool = False,
     ):
         self.selection: Selection = selection or Selection()
         self.dark_mode = dark_mode
+        self._recordings: WeakKeyDictionary[object, _Recording] | None = (
+            WeakKeyDictionary() if cache else None
+        )
 
     def paint_item(self, item, cr):
-        selection = self.selection
         if not (diagram := item.diagram):
             return
 
-        style = diagram.style(StyledItem(item, selection, self.dark_mode))
-
         cr.save()
         try:
-            cr.set_line_join(LINE_JOIN_ROUND)
-            cr.set_source_rgba(*style["color"])
             cr.transform(item.matrix_i2c.to_cairo())
 
-            item.draw(
-                DrawContext(
-                    cairo=cr,
-                    style=style,
-                    selected=(item in selection.selected_items),
-                    focused=(item is selection.focused_item),
-                    hovered=(item is selection.hovered_item),
-                    dropzone=(item is selection.dropzone_item),
-                )
-            )
-
+            # Proxies, such as a free hand context, can not be recorded
+            if self._recordings is not None and isinstance(cr, cairo.Context):
+                recording = self._recording(diagram, item)
+                if recording.width and recording.height:
+                    cr.rectangle(
+                        recording.x, recording.y, recording.width, recording.height
+                    )
+                    cr.clip()
+                    cr.set_source_surface(recording.surface, 0, 0)
+                    cr.paint()
+            else:
+                self._draw_item(item, cr, self._style(diagram, item))
         finally:
             cr.restore()
 
+    def _style(self, diagram, item) -> Style:
+        return diagram.style(diagram.styled_item(item, self.selection, self.dark_mode))
+
+    def _recording(self, diagram, item) -> _Recording:
+        assert self._recordings is not None
+        node = diagram.styled_item(item, self.selection, self.dark_mode)
+        style = diagram.style(node)
+        key = (diagram.revision(item), _states(node), _drawing_style(style))
+        recorded = self._recordings.get(item)
+        if recorded and recorded.key == key:
+            return recorded
+
+        surface = cairo.RecordingSurface(cairo.Content.COLOR_ALPHA, None)
+        self._draw_item(item, cairo.Context(surface), style)
+        recording = self._recordings[item] = _Recording(
+            key, surface, *surface.ink_extents()
+        )
+        return recording
+
+    def _draw_item(self, item, cr, style: Style):
+        selection = self.selection
+
+        cr.set_line_join(LINE_JOIN_ROUND)
+        cr.set_source_rgba(*style["color"])
+
+        item.draw(
+            DrawContext(
+                cairo=cr,
+                style=style,
+                selected=(item in selection.selected_items),
+                focused=(item is selection.focused_item),
+                hovered=(item is selection.hovered_item),
+                dropzone=(item is selection.dropzone_item),
+            )
+        )
+
     def paint(self, items, cr):
         """Draw the items."""
-        for item in items:
-            self.paint_item(item, cr)
+        with attribute_cache():
+            for item in items:
+                self.paint_item(item, cr)
+
+
+class _Recording(NamedTuple):
+    key: tuple[int, tuple[Sequence[str], ...], dict[str, object]]
+    surface: cairo.RecordingSurface
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+def _states(node: StyleNode | None) -> tuple[Sequence[str], ...]:
+    """The state of a style node and its ancestors.
+
+    Pseudo elements and child nodes are styled based on those states.
+    """
+    states = []
+    while node:
+        states.append(node.state())
+        node = node.parent()
+    return tuple(states)
+
+
+def _drawing_style(style: Style) -> dict[str, object]:
+    """The style properties, without references to the style node and
+    compiled style sheet.
+
+    Styles are computed again once the compiled style sheet is reset,
+    which happens on every diagram update.
+    """
+    return {
+        k: v
+        for k, v in style.items()
+        if k not in ("-gaphor-style-node", "-gaphor-compiled-style-sheet")
+    }
 
 
 @singledispatch
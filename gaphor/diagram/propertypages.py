@@ -98,6 +98,15 @@ class PropertyPageBase(abc.ABC):
         Returns the page's toplevel widget (Gtk.Widget).
         """
 
+    def rebind(self, subject) -> bool:
+        """Show a new subject on the constructed page.
+
+        Pages that can be reused for another subject override this method,
+        and return ``True`` if the page now shows ``subject``. Otherwise a
+        new page is constructed.
+        """
+        return False
+
 
 def help_link(builder, help_widget, popover):
     """Show the help popover for a `Help` link in the property page."""
@@ -142,6 +151,7 @@ class TypeLabelPropertyPage(PropertyPageBase):
     def __init__(self, subject):
         super().__init__()
         self.subject = subject.subject if isinstance(subject, Presentation) else subject
+        self.type_label: Gtk.Label | None = None
 
     def construct(self):
         if not self.subject:
@@ -151,11 +161,20 @@ class TypeLabelPropertyPage(PropertyPageBase):
             "type-label-editor",
         )
 
-        type = builder.get_object("type-label")
-        type.set_text(gettext(self.subject.__class__.__name__))
+        self.type_label = builder.get_object("type-label")
+        self.type_label.set_text(gettext(self.subject.__class__.__name__))
 
         return builder.get_object("type-label-editor")
 
+    def rebind(self, subject):
+        subject = subject.subject if isinstance(subject, Presentation) else subject
+        if not (subject and self.type_label):
+            return False
+
+        self.subject = subject
+        self.type_label.set_text(gettext(subject.__class__.__name__))
+        return True
+
 
 @PropertyPages.register(Diagram)
 class NamePropertyPage(PropertyPageBase):
@@ -171,6 +190,7 @@ class NamePropertyPage(PropertyPageBase):
         self.subject = subject
         self.event_manager = event_manager
         self.watcher = subject.watcher() if subject else None
+        self.entry: Gtk.Entry | None = None
 
     def construct(self):
         if not self.subject:
@@ -181,14 +201,13 @@ class NamePropertyPage(PropertyPageBase):
             "name-editor",
         )
 
-        subject = self.subject
-
         entry = builder.get_object("name-entry")
-        entry.set_text(subject and subject.name or "")
+        entry.set_text(self.subject.name or "")
+        self.entry = entry
 
         @handler_blocking(entry, "changed", self._on_name_changed)
         def handler(event):
-            if event.element is subject and event.new_value != entry.get_text():
+            if event.element is self.subject and event.new_value != entry.get_text():
                 entry.set_text(event.new_value or "")
 
         self.watcher.watch("name", handler)
@@ -197,6 +216,17 @@ class NamePropertyPage(PropertyPageBase):
             builder.get_object("name-editor"), self.watcher
         )
 
+    def rebind(self, subject):
+        if not (subject and self.entry and self.watcher):
+            return False
+
+        self.subject = subject
+        self.watcher.rebind(subject)
+        self.entry.handler_block_by_func(self._on_name_changed)
+        self.entry.set_text(subject.name or "")
+        self.entry.handler_unblock_by_func(self._on_name_changed)
+        return True
+
     def _on_name_changed(self, entry):
         with Transaction(self.event_manager):
             if self.subject.name != entry.get_text():
@@ -303,15 +333,30 @@ class InternalsPropertyPage(PropertyPageBase):
 
     def __init__(self, subject):
         self.subject = subject
+        self.internals: Gtk.Label | None = None
 
     def construct(self):
-        subject = self.subject
-
-        if not subject:
+        if not self.subject:
             return
 
         builder = new_builder("internals-editor")
-        internals = builder.get_object("internals")
+        self.internals = builder.get_object("internals")
+        self._update_internals()
+
+        return builder.get_object("internals-editor")
+
+    def rebind(self, subject):
+        if not (subject and self.internals):
+            return False
+
+        self.subject = subject
+        self._update_internals()
+        return True
+
+    def _update_internals(self):
+        subject = self.subject
+        internals = self.internals
+        assert internals
 
         if isinstance(subject, Presentation):
             presentation_text = textwrap.dedent(
@@ -342,8 +387,6 @@ class InternalsPropertyPage(PropertyPageBase):
         else:
             internals.set_label(presentation_text or element_text)
 
-        return builder.get_object("internals-editor")
-
 
 def presentation_class(subject):
     t = type(subject)
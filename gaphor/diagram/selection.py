@@ -22,7 +22,10 @@ class Selection(_Selection):
     @dropzone_item.setter
     def dropzone_item(self, item: Item | None) -> None:
         if item is not self._dropzone_item:
-            self._dropzone_item = item
+            old_item, self._dropzone_item = self._dropzone_item, item
+            for changed in (old_item, item):
+                if changed:
+                    self.notify(changed)
 
     @property
     def grayed_out_items(self) -> set[Item]:
@@ -30,4 +33,7 @@ class Selection(_Selection):
 
     @grayed_out_items.setter
     def grayed_out_items(self, items: Iterable[Item]) -> None:
-        self._grayed_out_items = set(items)
+        grayed_out_items = set(items)
+        if grayed_out_items != self._grayed_out_items:
+            self._grayed_out_items = grayed_out_items
+            self.notify(None)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import replace
 from enum import Enum
 from math import pi
@@ -624,3 +625,48 @@ def traverse_css_nodes(shape: Shape, only_children=False) -> Iterator[CssNode]:
     else:
         for s in shape:
             yield from traverse_css_nodes(s)
+
+
+class KeyedShapes:
+    """Reuse shapes when the shape tree of an item is rebuilt.
+
+    Shapes are identified by a key, typically a CSS name and the model
+    element the shape shows. While :meth:`update` is active, shapes are
+    created, or taken from the previous update if the key is known.
+    Shapes that are not used during an update are dropped.
+
+    Reused shapes keep their text layouts and measurements.
+    """
+
+    def __init__(self) -> None:
+        self._shapes: dict[Hashable, Shape] = {}
+        self._used: dict[Hashable, Shape] | None = None
+
+    def __call__(self, key: Hashable, create: Callable[[], Shape]) -> Shape:
+        shape = self._shapes.get(key)
+        if shape is None:
+            shape = create()
+        if self._used is not None:
+            self._used[key] = shape
+        return shape
+
+    @contextmanager
+    def update(self) -> Iterator[KeyedShapes]:
+        self._used = {}
+        try:
+            yield self
+        finally:
+            self._shapes = self._used
+            self._used = None
+
+
+def keyed_css_node(
+    shapes: KeyedShapes | None,
+    name: str,
+    element: Base | None,
+    create: Callable[[], Shape],
+) -> Shape:
+    """A CSS node for ``element``, reused from ``shapes`` if possible."""
+    if shapes is None:
+        return CssNode(name, element, create())
+    return shapes((name, element), lambda: CssNode(name, element, create()))
@@ -1,6 +1,11 @@
 from gaphor import UML
 from gaphor.core.modeling import Diagram, ElementFactory
-from gaphor.diagram.copypaste import copy_full, paste_full
+from gaphor.diagram.copypaste import (
+    copy_full,
+    decode_copy_data,
+    encode_copy_data,
+    paste_full,
+)
 from gaphor.diagram.tests.test_copypaste_link import two_classes_and_a_generalization
 from gaphor.UML.classes import ClassItem, GeneralizationItem, PackageItem
 from gaphor.UML.general import DiagramItem
@@ -135,3 +140,38 @@ def test_copy_diagram_with_elements(diagram, element_factory):
     new_diagram = new_diagram_item.subject
 
     assert new_diagram.ownedPresentation
+
+
+def test_paste_updates_diagram_once(diagram, element_factory, monkeypatch):
+    for _ in range(3):
+        diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+
+    buffer = copy_full(set(diagram.get_all_items()))
+    updates = []
+    monkeypatch.setattr(
+        Diagram, "update", lambda self, items=(): updates.append(set(items))
+    )
+
+    new_items = paste_full(buffer, diagram)
+
+    assert updates == [new_items]
+    assert len(new_items) == 3
+
+
+def test_paste_encoded_copy_data_in_other_model(
+    diagram, element_factory, modeling_language
+):
+    spc_cls_item, gen_cls_item, gen_item = two_classes_and_a_generalization(
+        diagram, element_factory
+    )
+
+    data = encode_copy_data(copy_full({gen_cls_item, gen_item, spc_cls_item}))
+    other_factory = ElementFactory()
+    other_diagram = other_factory.create(Diagram)
+    new_items = paste_full(decode_copy_data(data, modeling_language), other_diagram)
+
+    assert isinstance(data, bytes)
+    assert len(new_items) == 3
+    assert len(other_factory.lselect(UML.Generalization)) == 1
+    (new_gen,) = other_factory.select(UML.Generalization)
+    assert new_gen.general in other_factory.select(UML.Class)
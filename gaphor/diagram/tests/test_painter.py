@@ -0,0 +1,75 @@
+import cairo
+
+from gaphor import UML
+from gaphor.diagram.painter import ItemPainter
+from gaphor.diagram.selection import Selection
+from gaphor.UML.classes import ClassItem
+
+
+def paint(painter, item):
+    surface = cairo.ImageSurface(cairo.Format.ARGB32, 10, 10)
+    painter.paint([item], cairo.Context(surface))
+
+
+def test_cached_item_is_drawn_once(create, diagram, monkeypatch):
+    class_item = create(ClassItem, UML.Class)
+    diagram.update()
+    draws = []
+    original_draw = class_item.draw
+    monkeypatch.setattr(class_item, "draw", lambda c: draws.append(original_draw(c)))
+    painter = ItemPainter(cache=True)
+
+    paint(painter, class_item)
+    paint(painter, class_item)
+
+    assert len(draws) == 1
+
+
+def test_cached_item_is_drawn_after_update_request(create, diagram, monkeypatch):
+    class_item = create(ClassItem, UML.Class)
+    diagram.update()
+    draws = []
+    original_draw = class_item.draw
+    monkeypatch.setattr(class_item, "draw", lambda c: draws.append(original_draw(c)))
+    painter = ItemPainter(cache=True)
+
+    paint(painter, class_item)
+    diagram.request_update(class_item)
+    paint(painter, class_item)
+
+    assert len(draws) == 2
+
+
+def test_cached_item_is_drawn_when_grayed_out(create, diagram, monkeypatch):
+    class_item = create(ClassItem, UML.Class)
+    diagram.update()
+    draws = []
+    original_draw = class_item.draw
+    monkeypatch.setattr(class_item, "draw", lambda c: draws.append(original_draw(c)))
+    selection = Selection()
+    painter = ItemPainter(selection, cache=True)
+
+    paint(painter, class_item)
+    selection.grayed_out_items = {class_item}
+    paint(painter, class_item)
+    paint(painter, class_item)
+
+    assert len(draws) == 2
+
+
+def test_cached_item_is_drawn_after_diagram_update(create, diagram, monkeypatch):
+    class_item = create(ClassItem, UML.Class)
+    diagram.update()
+    draws = []
+    original_draw = class_item.draw
+    monkeypatch.setattr(class_item, "draw", lambda c: draws.append(original_draw(c)))
+    painter = ItemPainter(cache=True)
+
+    paint(painter, class_item)
+    class_item.subject.name = "Changed"
+    diagram.request_update(class_item)
+    paint(painter, class_item)
+    diagram.update()
+    paint(painter, class_item)
+
+    assert len(draws) == 3
@@ -17,12 +17,14 @@ from gaphor.diagram.shapes import (
     CssNode,
     DrawContext,
     IconBox,
+    KeyedShapes,
     Orientation,
     Shape,
     Text,
     TextAlign,
     UpdateContext,
     VerticalAlign,
+    keyed_css_node,
     traverse_css_nodes,
 )
 
@@ -347,3 +349,20 @@ def test_iterate_css_node(update_context):
         "first",
         "second",
     ]
+
+
+def test_keyed_shapes_are_reused_between_updates():
+    shapes = KeyedShapes()
+
+    with shapes.update():
+        first = keyed_css_node(shapes, "attribute", None, lambda: Text("a"))
+        dropped = keyed_css_node(shapes, "operation", None, lambda: Text("b"))
+
+    with shapes.update():
+        reused = keyed_css_node(shapes, "attribute", None, lambda: Text("a"))
+
+    with shapes.update():
+        recreated = keyed_css_node(shapes, "operation", None, lambda: Text("b"))
+
+    assert reused is first
+    assert recreated is not dropped
@@ -6,6 +6,8 @@ from gaphor.diagram.text import (
     Layout,
     TextAlign,
     TextDecoration,
+    TextMeasurementCache,
+    text_measurements,
     text_point_at_line,
 )
 
@@ -101,3 +103,52 @@ def test_text_with_just_font_as_dict():
     w, h = Layout("Example", {"font-family": "sans", "font-size": 10}).size()
     assert w
     assert h
+
+
+def test_text_measurement_is_shared_between_layouts():
+    font = {"font-family": "sans", "font-size": 10}
+    text_measurements.clear()
+
+    size = Layout("«block»", font).size()
+    other_size = Layout("«block»", font).size()
+    info = text_measurements.info()
+
+    assert size == other_size
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.hit_rate == 0.5
+
+
+def test_text_measurement_does_not_create_pango_layout():
+    layout = Layout("Example", {"font-family": "sans", "font-size": 10})
+
+    layout.size()
+
+    assert layout._layout is None  # noqa: SLF001
+
+
+def test_text_measurement_depends_on_width():
+    font = {"font-family": "sans", "font-size": 10}
+    text = "A rather long text that can be wrapped"
+
+    w, h = Layout(text, font).size()
+    wrapped_w, wrapped_h = Layout(text, font, width=w // 2).size()
+
+    assert wrapped_w < w
+    assert wrapped_h > h
+
+
+def test_text_measurement_cache_evicts_least_recently_used():
+    cache = TextMeasurementCache(maxsize=2)
+    key_a = ("a", None, False, -1, TextAlign.CENTER)
+    key_b = ("b", None, False, -1, TextAlign.CENTER)
+    key_c = ("c", None, False, -1, TextAlign.CENTER)
+
+    cache.put(key_a, (1, 1))
+    cache.put(key_b, (2, 2))
+    cache.get(key_a)
+    cache.put(key_c, (3, 3))
+
+    assert cache.get(key_a) == (1, 1)
+    assert cache.get(key_b) is None
+    assert cache.info().currsize == 2
@@ -2,14 +2,139 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+from typing import NamedTuple
+
 from gaphas.canvas import instant_cairo_context
 from gaphas.painter.freehand import FreeHandCairoContext
 from gi.repository import Pango, PangoCairo
 
 from gaphor.core.styling import FontStyle, FontWeight, Style, TextAlign, TextDecoration
 
+FontId = tuple[str, float | str, FontWeight | None, FontStyle | None]
+MeasurementKey = tuple[str, FontId | None, bool, float, TextAlign]
+
+
+class MeasurementCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TextMeasurementCache:
+    """A least-recently-used cache of text sizes.
+
+    Text with the same content, font, width and alignment always has the
+    same size, so items with identical labels can share the measurement,
+    without Pango having to lay out the text again.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._sizes: OrderedDict[MeasurementKey, tuple[int, int]] = OrderedDict()
+
+    def get(self, key: MeasurementKey) -> tuple[int, int] | None:
+        sizes = self._sizes
+        if (size := sizes.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        sizes.move_to_end(key)
+        return size
+
+    def put(self, key: MeasurementKey, size: tuple[int, int]) -> None:
+        sizes = self._sizes
+        sizes[key] = size
+        sizes.move_to_end(key)
+        if len(sizes) > self.maxsize:
+            sizes.popitem(last=False)
+
+    def clear(self) -> None:
+        self._sizes.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> MeasurementCacheInfo:
+        return MeasurementCacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._sizes)
+        )
+
+
+class LayoutPool:
+    """A pool of Pango layouts, used for measuring text.
+
+    Pango layouts are reconfigured every time they are taken from the pool.
+    """
+
+    def __init__(self):
+        self._free: list[Pango.Layout] = []
+
+    @contextmanager
+    def layout(self) -> Iterator[Pango.Layout]:
+        layout = (
+            self._free.pop()
+            if self._free
+            else PangoCairo.create_layout(instant_cairo_context())
+        )
+        try:
+            yield layout
+        finally:
+            self._free.append(layout)
+
+
+text_measurements = TextMeasurementCache()
+layout_pool = LayoutPool()
+
+
+@cache
+def _font_description(font_id: FontId) -> Pango.FontDescription:
+    font_family, font_size, font_weight, font_style = font_id
+    fd = Pango.FontDescription.new()
+    fd.set_family(font_family)
+    fd.set_absolute_size(font_size * Pango.SCALE)
+
+    if font_weight:
+        assert isinstance(font_weight, FontWeight)
+        fd.set_weight(getattr(Pango.Weight, font_weight.name))
+    if font_style:
+        assert isinstance(font_style, FontStyle)
+        fd.set_style(getattr(Pango.Style, font_style.name))
+    return fd
+
+
+@cache
+def _text_attributes(underline: bool) -> Pango.AttrList:
+    attrs = Pango.AttrList.new()
+    attrs.insert(
+        Pango.attr_underline_new(
+            Pango.Underline.SINGLE if underline else Pango.Underline.NONE
+        )
+    )
+    return attrs
+
+
+def _pango_width(width: float) -> int:
+    return -1 if width == -1 else min(int(width * Pango.SCALE), 2147483647)
+
 
 class Layout:
+    """Text layout.
+
+    Text is measured through the shared ``text_measurements`` cache. A
+    Pango layout is only allocated once the text is drawn.
+    """
+
     def __init__(
         self,
         text: str = "",
@@ -18,12 +143,13 @@ class Layout:
         text_align: TextAlign = TextAlign.CENTER,
         default_size: tuple[int, int] = (0, 0),
     ):
-        self.layout = PangoCairo.create_layout(instant_cairo_context())
-        self.font_id: (
-            tuple[str, float | str, FontWeight | None, FontStyle | None] | None
-        ) = None
+        self._layout: Pango.Layout | None = None
+        self._dirty = True
+        self.font_id: FontId | None = None
+        self.underline = False
         self.text = ""
-        self.width = -1
+        self.width: float = -1
+        self.text_align = text_align
         self.default_size = default_size
 
         if text:
@@ -34,6 +160,16 @@ class Layout:
             self.set_font(font)
         self.set_alignment(text_align)
 
+    @property
+    def layout(self) -> Pango.Layout:
+        """The Pango layout used for drawing."""
+        if self._layout is None:
+            self._layout = PangoCairo.create_layout(instant_cairo_context())
+        if self._dirty:
+            self._configure(self._layout)
+            self._dirty = False
+        return self._layout
+
     def set(self, text=None, font=None, width=None, text_align=None):
         # Since text expressions can return False, we should also accommodate for that
         if text not in (None, False):
@@ -54,63 +190,58 @@ class Layout:
         assert font_size, "Font size should be set"
 
         font_id = (font_family, font_size, font_weight, font_style)
-        if font_id == self.font_id:
-            return
-
-        self.font_id = font_id
-
-        fd = Pango.FontDescription.new()
-        fd.set_family(font_family)
-        fd.set_absolute_size(font_size * Pango.SCALE)
-
-        if font_weight:
-            assert isinstance(font_weight, FontWeight)
-            fd.set_weight(getattr(Pango.Weight, font_weight.name))
-        if font_style:
-            assert isinstance(font_style, FontStyle)
-            fd.set_style(getattr(Pango.Style, font_style.name))
-
-        self.layout.set_font_description(fd)
-
         underline = (
             font.get("text-decoration", TextDecoration.NONE) == TextDecoration.UNDERLINE
         )
+        if font_id == self.font_id and underline == self.underline:
+            return
 
-        attrs = Pango.AttrList.new()
-        attrs.insert(
-            Pango.attr_underline_new(
-                Pango.Underline.SINGLE if underline else Pango.Underline.NONE
-            )
-        )
-        self.layout.set_attributes(attrs)
+        self.font_id = font_id
+        self.underline = underline
+        self._dirty = True
 
     def set_text(self, text: str) -> None:
         if text != self.text:
             self.text = text
-            self.layout.set_text(self.text, length=-1)
+            self._dirty = True
 
-    def set_width(self, width: int) -> None:
-        self.width = width
-        if width == -1:
-            self.layout.set_width(-1)
-        else:
-            self.layout.set_width(int(width * Pango.SCALE))
+    def set_width(self, width: float) -> None:
+        if width != self.width:
+            self.width = width
+            self._dirty = True
 
     def set_alignment(self, text_align: TextAlign) -> None:
-        self.layout.set_alignment(getattr(Pango.Alignment, text_align.name))
+        if text_align != self.text_align:
+            self.text_align = text_align
+            self._dirty = True
+
+    def _configure(self, layout: Pango.Layout) -> None:
+        layout.set_font_description(
+            _font_description(self.font_id) if self.font_id else None
+        )
+        layout.set_attributes(_text_attributes(self.underline))
+        layout.set_text(self.text, length=-1)
+        layout.set_width(_pango_width(self.width))
+        layout.set_alignment(getattr(Pango.Alignment, self.text_align.name))
 
     def size(self) -> tuple[int, int]:
         if not self.text:
             return self.default_size
-        self.set_width(self.width)
-        return self.layout.get_pixel_size()  # type: ignore[no-any-return]
+
+        key = (self.text, self.font_id, self.underline, self.width, self.text_align)
+        if (size := text_measurements.get(key)) is None:
+            with layout_pool.layout() as layout:
+                self._configure(layout)
+                size = layout.get_pixel_size()
+            text_measurements.put(key, size)
+        return size
 
     def show_layout(self, cr, width=None, default_size=None):
-        layout = self.layout
         if not self.text:
             return default_size or self.default_size
-        if width is not None:
-            layout.set_width(min(int(width * Pango.SCALE), 2147483647))
+
+        layout = self.layout
+        layout.set_width(_pango_width(self.width if width is None else width))
 
         if isinstance(cr, FreeHandCairoContext):
             PangoCairo.show_layout(cr.cr, layout)
@@ -2,6 +2,7 @@ import functools
 import importlib.metadata
 import inspect
 import logging
+from collections.abc import Callable
 from typing import TypeVar
 
 T = TypeVar("T")
@@ -10,10 +11,19 @@ logger = logging.getLogger(__name__)
 
 
 def initialize(scope, services=None, **known_services: T) -> dict[str, T]:
-    return init_entry_points(load_entry_points(scope, services), **known_services)
+    """Initialize services defined in entry point group `scope`.
+
+    Services in group `{scope}.lazy` are imported and created on first
+    use.
+    """
+    return init_entry_points(
+        load_entry_points(scope, services),
+        lazy_entry_points(f"{scope}.lazy", services),
+        **known_services,
+    )
 
 
-@functools.lru_cache(maxsize=4)
+@functools.lru_cache(maxsize=8)
 def list_entry_points(group):
     return importlib.metadata.entry_points(group=group)
 
@@ -29,14 +39,79 @@ def load_entry_points(scope, services=None) -> dict[str, type]:
     return uninitialized_services
 
 
+def lazy_entry_points(scope, services=None) -> dict[str, Callable[[], type]]:
+    """Find services from resources, without loading them."""
+    return {
+        ep.name: ep.load
+        for ep in list_entry_points(scope)
+        if not services or ep.name in services
+    }
+
+
+class LazyService:
+    """Placeholder for a service that is created on first use.
+
+    Attribute access is forwarded to the service.
+    """
+
+    def __init__(self, name: str, load: Callable[[], type], create: Callable):
+        self._name = name
+        self._load = load
+        self._create = create
+        self._service: object | None = None
+        self._resolve_handlers: list[Callable[[str, object], None]] = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def resolved(self) -> bool:
+        return self._service is not None
+
+    def service_class(self) -> type:
+        return self._load()
+
+    def on_resolve(self, handler: Callable[[str, object], None]) -> None:
+        """Call ``handler(name, service)`` once the service is created."""
+        self._resolve_handlers.append(handler)
+
+    def resolve(self):
+        if self._service is None:
+            logger.debug("Initializing lazy service %s", self._name)
+            self._service = self._create(self._name, self.service_class())
+            for handler in self._resolve_handlers:
+                handler(self._name, self._service)
+        return self._service
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+        return getattr(self.resolve(), key)
+
+    def __repr__(self):
+        return f"<LazyService {self._name} resolved={self.resolved}>"
+
+
+def resolve_service(service: T | LazyService) -> T:
+    """Return the actual service, creating it if it's lazy."""
+    return service.resolve() if isinstance(service, LazyService) else service
+
+
 def init_entry_points(
-    uninitialized_services: dict[str, type[T]], **known_services: T
+    uninitialized_services: dict[str, type[T]],
+    lazy_services: dict[str, Callable[[], type[T]]] | None = None,
+    **known_services: T,
 ) -> dict[str, T]:
     """Instantiate service definitions, taking into account dependencies
     defined in the constructor.
 
     Given a dictionary `{name: service-class}`, return a map `{name:
     service-instance}`.
+
+    Lazy services, `{name: service-class-loader}`, are added as
+    :obj:`LazyService` placeholders. Once such a service is created,
+    it replaces the placeholder in the returned map.
     """
     ready: dict[str, T] = known_services.copy()
 
@@ -60,11 +135,15 @@ def init_entry_points(
                         param_name,
                     )
             else:
-                kwargs[param_name] = ready[param_name]
+                kwargs[param_name] = resolve_service(ready[param_name])
         srv = cls(**kwargs)
         ready[name] = srv
         return srv
 
+    for name, load in (lazy_services or {}).items():
+        if name not in ready and name not in uninitialized_services:
+            ready[name] = LazyService(name, load, init)  # type: ignore[assignment]
+
     while uninitialized_services:
         name = next(iter(uninitialized_services.keys()))
         cls = pop(name)
@@ -78,6 +78,8 @@ class SessionShutdown:
 @dataclass
 class ModelSaved:
     filename: Path | None = None
+    digest: str | None = None
+    """SHA-256 hex digest of the saved file."""
 
 
 class TransactionBegin:
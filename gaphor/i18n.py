@@ -58,11 +58,18 @@ def translation(lang) -> _gettext.GNUTranslations | _gettext.NullTranslations:
 
 def force_english_locale():
     """Force English locale, instead of OS language."""
-    global gettext
-    gettext = translation("en_US.UTF-8").gettext
+    set_language("en_US.UTF-8")
 
 
-gettext = translation(os.getenv("LANG") or _get_os_language()).gettext
+def set_language(lang: str) -> None:
+    global gettext, _language
+    _language = lang
+    gettext = translation(lang).gettext
+    _translated_ui_string.cache_clear()
+
+
+_language = os.getenv("LANG") or _get_os_language()
+gettext = translation(_language).gettext
 
 
 def i18nize(message):
@@ -70,8 +77,16 @@ def i18nize(message):
     return message
 
 
-@functools.cache
 def translated_ui_string(package: str, ui_filename: str) -> str:
+    """A UI definition with translatable text translated.
+
+    Translated UI definitions are cached per language.
+    """
+    return _translated_ui_string(package, ui_filename, _language)
+
+
+@functools.cache
+def _translated_ui_string(package: str, ui_filename: str, _lang: str) -> str:
     with (importlib.resources.files(package) / ui_filename).open(
         encoding="utf-8"
     ) as ui_file:
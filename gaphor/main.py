@@ -23,7 +23,21 @@ def main(argv=None) -> int:
 
         args = parse_args(argv[1:], commands)
 
-        return run_profiler(args) if args.profiler else args.command(args)  # type: ignore[no-any-return]
+        return run_tracer(args) if args.trace else run_command(args)
+
+
+def run_command(args) -> int:
+    return run_profiler(args) if args.profiler else args.command(args)  # type: ignore[no-any-return]
+
+
+def run_tracer(args) -> int:
+    from gaphor.core.tracing import tracing
+
+    with tracing() as tracer:
+        exit_code = run_command(args)
+
+    tracer.write(args.trace, args.trace_format)
+    return exit_code
 
 
 def run_profiler(args):
@@ -100,6 +114,17 @@ def default_parser():
     parser.add_argument(
         "--profiler", help="run in profiler (cProfile)", action="store_true"
     )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="record timings of load, save, update and export phases to FILE",
+    )
+    parser.add_argument(
+        "--trace-format",
+        help="trace file format, default chrome (trace event format)",
+        default="chrome",
+        choices=["chrome", "json"],
+    )
     return parser
 
 
@@ -1,3 +1,22 @@
-# ruff: noqa: F401
+from __future__ import annotations
 
-from gaphor.plugins.autolayout.pydot import AutoLayout, AutoLayoutService
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gaphor.plugins.autolayout.layered import LayeredAutoLayout
+    from gaphor.plugins.autolayout.pydot import AutoLayout, AutoLayoutService
+
+__all__ = ["AutoLayout", "AutoLayoutService", "LayeredAutoLayout"]
+
+
+def __getattr__(name: str):
+    # Loaded on demand: pydot is only needed once a diagram is laid out.
+    if name == "LayeredAutoLayout":
+        from gaphor.plugins.autolayout.layered import LayeredAutoLayout
+
+        return LayeredAutoLayout
+    if name in ("AutoLayout", "AutoLayoutService"):
+        import gaphor.plugins.autolayout.pydot
+
+        return getattr(gaphor.plugins.autolayout.pydot, name)
+    raise AttributeError(f"module '{__name__!r}' has no attribute '{name!r}'")
@@ -0,0 +1,36 @@
+"""Auto-layout actions.
+
+Auto-layout is a lazy service. Its actions are declared here, so Pydot
+and the layout engines are only loaded once a diagram is laid out.
+"""
+
+from gaphor.abc import ActionProvider, Service
+from gaphor.action import action
+from gaphor.i18n import gettext
+
+
+class AutoLayoutActions(Service, ActionProvider):
+    def __init__(self, component_registry, tools_menu):
+        self.component_registry = component_registry
+        tools_menu.add_actions(self)
+
+    def shutdown(self):
+        pass
+
+    @property
+    def auto_layout(self):
+        return self.component_registry.get_service("auto_layout")
+
+    @action(
+        name="auto-layout", label=gettext("Auto Layout"), shortcut="<Primary><Shift>L"
+    )
+    def layout_current_diagram(self):
+        self.auto_layout.layout_current_diagram()
+
+    @action(
+        name="auto-layout-ortho",
+        label=gettext("Auto Layout (orthogonal)"),
+        shortcut="<Primary><Shift>K",
+    )
+    def layout_current_diagram_orthogonal(self):
+        self.auto_layout.layout_current_diagram_orthogonal()
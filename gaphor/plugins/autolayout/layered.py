@@ -0,0 +1,531 @@
+"""Layered auto-layout, without Graphviz.
+
+Diagrams are laid out in layers, in the style of Sugiyama:
+
+1. cycles are broken by reversing edges,
+2. nodes are assigned to layers (longest path),
+3. long edges get a dummy node in every layer they cross,
+4. the order of nodes in the layers is improved with barycenter sweeps,
+5. nodes are positioned, so edges are as straight as possible.
+
+Nested elements are laid out first. The element containing them is then
+laid out as a single node, like a cluster in Graphviz. Edges are placed
+in the innermost graph that contains both ends.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right, insort
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from gaphas.geometry import Point
+from gaphas.matrix import Matrix
+
+import gaphor.UML.interactions
+from gaphor.core.modeling import Diagram, Presentation
+from gaphor.diagram.presentation import (
+    AttachedPresentation,
+    ElementPresentation,
+    LinePresentation,
+)
+from gaphor.plugins.autolayout.pydot import (
+    AutoLayout,
+    as_cluster,
+    place_element,
+    reconnect,
+    set_line_points,
+)
+from gaphor.UML.actions.activitynodes import ForkNodeItem
+from gaphor.UML.classes.generalization import GeneralizationItem
+
+MARGIN = 8.0
+NODE_SEPARATION = 40.0
+DUMMY_SEPARATION = 10.0
+RANK_SEPARATION = 80.0
+CLUSTER_PADDING = 20.0
+CLUSTER_LABEL_HEIGHT = 40.0
+ORDERING_SWEEPS = 8
+POSITIONING_SWEEPS = 4
+
+# Do not auto-layout sequence diagrams
+INTERACTION_ITEMS = tuple(
+    getattr(gaphor.UML.interactions, name)
+    for name in dir(gaphor.UML.interactions)
+    if name.endswith("Item")
+)
+
+
+@dataclass(eq=False)
+class Node:
+    presentation: Presentation
+    width: float
+    height: float
+    parent: Graph
+    graph: Graph | None = None
+    x: float = 0.0
+    y: float = 0.0
+
+
+@dataclass(eq=False)
+class Edge:
+    presentation: LinePresentation
+    source: Node
+    target: Node
+    reverse: bool = False
+    points: list[Point] = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class Graph:
+    node: Node | None = None
+    nodes: list[Node] = field(default_factory=list)
+    edges: list[Edge] = field(default_factory=list)
+    width: float = 0.0
+    height: float = 0.0
+
+
+class LayeredAutoLayout(AutoLayout):
+    """Auto-layout diagrams in-process, without Graphviz."""
+
+    def layout(self, diagram: Diagram, splines="polyline") -> None:
+        diagram.update(diagram.ownedPresentation)
+        graph = diagram_as_graph(diagram)
+        layout_graph(graph, orthogonal=splines == "ortho")
+        self.apply_graph(diagram, graph)
+        diagram.update(diagram.ownedPresentation)
+
+    def layout_all(
+        self, diagrams: Sequence[Diagram], splines="polyline", jobs: int | None = None
+    ) -> None:
+        """Lay out a number of diagrams, one after another."""
+        for diagram in diagrams:
+            self.layout(diagram, splines)
+
+    def apply_graph(
+        self,
+        diagram: Diagram,
+        graph: Graph,
+        offset: Point = (MARGIN, MARGIN),
+        parent_presentation: Presentation | None = None,
+    ) -> None:
+        ox, oy = offset
+        matrix_c2i = (
+            parent_presentation.matrix_i2c.inverse()
+            if parent_presentation
+            else Matrix()
+        )
+
+        # First record original positions for involved lines
+        for edge in graph.edges:
+            self.record_line_position(diagram, edge.presentation)
+
+        for node in graph.nodes:
+            presentation = node.presentation
+            x, y = ox + node.x, oy + node.y
+            if isinstance(presentation, ElementPresentation):
+                place_element(
+                    presentation,
+                    (x, y),
+                    (node.width, node.height) if node.graph else None,
+                    matrix_c2i,
+                )
+            else:
+                center = matrix_c2i.transform_point(
+                    x + node.width / 2, y + node.height / 2
+                )
+                presentation.matrix.set(x0=center[0], y0=center[1])
+
+            for child in presentation.children:
+                if isinstance(child, AttachedPresentation):
+                    reconnect(child, child.handles()[0], diagram.connections)
+
+            if node.graph:
+                self.apply_graph(
+                    diagram,
+                    node.graph,
+                    (x + CLUSTER_PADDING, y + CLUSTER_LABEL_HEIGHT),
+                    presentation,
+                )
+
+        for edge in graph.edges:
+            points = [(ox + x, oy + y) for x, y in edge.points]
+            if edge.reverse:
+                points.reverse()
+            set_line_points(edge.presentation, diagram, points)
+
+
+def node_size(presentation: Presentation) -> tuple[float, float] | None:
+    """The size of a presentation, or ``None`` if it's not laid out."""
+    if isinstance(presentation, INTERACTION_ITEMS):
+        return None
+    if isinstance(presentation, ForkNodeItem):
+        h1, h2 = presentation.handles()
+        return h2.pos.x - h1.pos.x, h2.pos.y - h1.pos.y
+    if isinstance(presentation, ElementPresentation):
+        return presentation.width, presentation.height
+    return None
+
+
+def diagram_as_graph(diagram: Diagram) -> Graph:
+    graph = Graph()
+    nodes: dict[Presentation, Node] = {}
+
+    def add_nodes(graph, presentations):
+        for presentation in presentations:
+            if not (size := node_size(presentation)):
+                continue
+            node = Node(presentation, *size, parent=graph)
+            graph.nodes.append(node)
+            nodes[presentation] = node
+            if as_cluster(presentation):
+                node.graph = Graph(node=node)
+                add_nodes(node.graph, presentation.children)
+
+    add_nodes(graph, (p for p in diagram.ownedPresentation if not p.parent))
+
+    connections = diagram.connections
+
+    def connected_node(handle) -> Node | None:
+        if not (cinfo := connections.get_connection(handle)):
+            return None
+        connected = cinfo.connected
+        if isinstance(connected, AttachedPresentation):
+            connected = connected.parent
+        return nodes.get(connected)
+
+    for line in diagram.ownedPresentation:
+        if not isinstance(line, LinePresentation) or isinstance(
+            line, INTERACTION_ITEMS
+        ):
+            continue
+        head = connected_node(line.head)
+        tail = connected_node(line.tail)
+        if not (head and tail):
+            continue
+        reverse = isinstance(line, GeneralizationItem)
+        source, target = (tail, head) if reverse else (head, tail)
+        container, source, target = common_graph(source, target)
+        if source is not target:
+            container.edges.append(Edge(line, source, target, reverse))
+
+    return graph
+
+
+def common_graph(source: Node, target: Node) -> tuple[Graph, Node, Node]:
+    """Find the innermost graph that contains both nodes.
+
+    Nodes are replaced by the (cluster) node they are nested in, in that
+    graph.
+    """
+
+    def ancestors(node: Node | None) -> Iterator[tuple[Graph, Node]]:
+        while node:
+            yield node.parent, node
+            node = node.parent.node
+
+    target_ancestors = dict(ancestors(target))
+    for graph, node in ancestors(source):
+        if graph in target_ancestors:
+            return graph, node, target_ancestors[graph]
+    raise ValueError("Nodes are not part of the same graph")
+
+
+def layout_graph(graph: Graph, orthogonal: bool = False) -> None:
+    """Position the nodes and edges in a graph, and nested graphs.
+
+    Positions are relative to the graph.
+    """
+    for node in graph.nodes:
+        if node.graph:
+            layout_graph(node.graph, orthogonal)
+            node.width = max(
+                node.graph.width + 2 * CLUSTER_PADDING,
+                node.presentation.min_width,  # type: ignore[attr-defined]
+            )
+            node.height = max(
+                node.graph.height + CLUSTER_PADDING + CLUSTER_LABEL_HEIGHT,
+                node.presentation.min_height,  # type: ignore[attr-defined]
+            )
+
+    if not graph.nodes:
+        graph.width = graph.height = 0.0
+        return
+
+    index = {node: i for i, node in enumerate(graph.nodes)}
+    dag = acyclic(len(index), [(index[e.source], index[e.target]) for e in graph.edges])
+    layers = assign_layers(len(index), [(s, t) for s, t, _ in dag])
+    layout = LayeredLayout(graph.nodes, layers, dag)
+    layout.order()
+    layout.position()
+
+    for i, node in enumerate(graph.nodes):
+        node.x, node.y = layout.top_left(i)
+    for edge, points in zip(graph.edges, layout.edge_points(orthogonal), strict=True):
+        edge.points = points
+    graph.width, graph.height = layout.size()
+
+
+def acyclic(count: int, edges: list[tuple[int, int]]) -> list[tuple[int, int, bool]]:
+    """Break cycles by reversing edges found through a depth first search.
+
+    Returns ``(source, target, reversed)`` for every edge.
+    """
+    out_edges: list[list[tuple[int, int]]] = [[] for _ in range(count)]
+    for e, (s, t) in enumerate(edges):
+        out_edges[s].append((e, t))
+
+    reversed_edges = set()
+    state = [0] * count  # 0: new, 1: on stack, 2: done
+    for root in range(count):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [(root, iter(out_edges[root]))]
+        while stack:
+            v, children = stack[-1]
+            for e, w in children:
+                if state[w] == 1:
+                    reversed_edges.add(e)
+                elif state[w] == 0:
+                    state[w] = 1
+                    stack.append((w, iter(out_edges[w])))
+                    break
+            else:
+                state[v] = 2
+                stack.pop()
+
+    return [
+        (t, s, True) if e in reversed_edges else (s, t, False)
+        for e, (s, t) in enumerate(edges)
+    ]
+
+
+def assign_layers(count: int, edges: list[tuple[int, int]]) -> list[int]:
+    """Assign layers by longest path, for an acyclic graph.
+
+    Sources are moved down, right above their first successor.
+    """
+    successors: list[list[int]] = [[] for _ in range(count)]
+    in_degree = [0] * count
+    for s, t in edges:
+        successors[s].append(t)
+        in_degree[t] += 1
+
+    layers = [0] * count
+    sources = [v for v in range(count) if not in_degree[v]]
+    todo = list(reversed(sources))
+    while todo:
+        v = todo.pop()
+        for w in successors[v]:
+            layers[w] = max(layers[w], layers[v] + 1)
+            in_degree[w] -= 1
+            if not in_degree[w]:
+                todo.append(w)
+
+    for v in sources:
+        if successors[v]:
+            layers[v] = min(layers[w] for w in successors[v]) - 1
+
+    top = min(layers, default=0)
+    return [layer - top for layer in layers]
+
+
+class LayeredLayout:
+    """Order and position vertices in layers.
+
+    Vertices are the nodes of a graph, followed by dummy vertices for
+    edges that span more than one layer.
+    """
+
+    def __init__(
+        self,
+        nodes: list[Node],
+        layers: list[int],
+        edges: list[tuple[int, int, bool]],
+    ):
+        self.node_count = len(nodes)
+        self.widths = [node.width for node in nodes]
+        self.heights = [node.height for node in nodes]
+        self.layer_of = list(layers)
+        self.upper: list[list[int]] = [[] for _ in nodes]
+        self.lower: list[list[int]] = [[] for _ in nodes]
+        self.chains: list[tuple[list[int], bool]] = []
+
+        for s, t, reversed_edge in edges:
+            chain = [s]
+            for layer in range(layers[s] + 1, layers[t]):
+                chain.append(self._add_dummy(layer))
+            chain.append(t)
+            for u, v in zip(chain, chain[1:], strict=False):
+                self.lower[u].append(v)
+                self.upper[v].append(u)
+            self.chains.append((chain, reversed_edge))
+
+        self.layers: list[list[int]] = [[] for _ in range(max(layers) + 1)]
+        for v, layer in enumerate(self.layer_of):
+            self.layers[layer].append(v)
+        self.x = [0.0] * len(self.layer_of)
+        self.layer_y: list[float] = []
+        self.layer_heights: list[float] = []
+
+    def _add_dummy(self, layer: int) -> int:
+        self.widths.append(0.0)
+        self.heights.append(0.0)
+        self.layer_of.append(layer)
+        self.upper.append([])
+        self.lower.append([])
+        return len(self.layer_of) - 1
+
+    def _is_dummy(self, v: int) -> bool:
+        return v >= self.node_count
+
+    def order(self) -> None:
+        """Reduce edge crossings with barycenter sweeps, down and up."""
+        pos = [0] * len(self.layer_of)
+        for layer in self.layers:
+            for i, v in enumerate(layer):
+                pos[v] = i
+
+        best = [list(layer) for layer in self.layers]
+        best_crossings = self.crossings(pos)
+        for sweep in range(ORDERING_SWEEPS):
+            if not best_crossings:
+                break
+            down = sweep % 2 == 0
+            layers = self.layers[1:] if down else self.layers[-2::-1]
+            neighbours = self.upper if down else self.lower
+            for layer in layers:
+                centers = {v: barycenter(v, neighbours[v], pos) for v in layer}
+                layer.sort(key=centers.__getitem__)
+                for i, v in enumerate(layer):
+                    pos[v] = i
+            if (crossings := self.crossings(pos)) < best_crossings:
+                best = [list(layer) for layer in self.layers]
+                best_crossings = crossings
+        self.layers = best
+
+    def crossings(self, pos: list[int]) -> int:
+        count = 0
+        for layer in self.layers[:-1]:
+            pairs = sorted((pos[u], pos[v]) for u in layer for v in self.lower[u])
+            seen: list[int] = []
+            for _, p in pairs:
+                count += len(seen) - bisect_right(seen, p)
+                insort(seen, p)
+        return count
+
+    def position(self) -> None:
+        """Assign coordinates.
+
+        Vertices are moved towards the center of their neighbours, while
+        keeping their order and separation.
+        """
+        x = self.x
+        for layer in self.layers:
+            for i, v in enumerate(layer):
+                x[v] = (
+                    x[layer[i - 1]] + self._separation(layer[i - 1], v)
+                    if i
+                    else self.widths[v] / 2
+                )
+
+        for sweep in range(POSITIONING_SWEEPS):
+            layers = self.layers if sweep % 2 == 0 else self.layers[::-1]
+            for layer in layers:
+                self._balance(layer)
+
+        left = min(x[v] - self.widths[v] / 2 for v in range(len(x)))
+        for v in range(len(x)):
+            x[v] -= left
+
+        y = 0.0
+        for layer in self.layers:
+            height = max((self.heights[v] for v in layer), default=0.0)
+            self.layer_y.append(y)
+            self.layer_heights.append(height)
+            y += height + RANK_SEPARATION
+
+    def _separation(self, u: int, v: int) -> float:
+        """Minimal distance between the centers of neighbouring vertices."""
+        separation = (
+            DUMMY_SEPARATION
+            if self._is_dummy(u) or self._is_dummy(v)
+            else NODE_SEPARATION
+        )
+        return (self.widths[u] + self.widths[v]) / 2 + separation
+
+    def _balance(self, layer: list[int]) -> None:
+        x = self.x
+        desired = [
+            barycenter(v, self.upper[v] + self.lower[v], x, default=x[v]) for v in layer
+        ]
+
+        from_left = list(desired)
+        for i in range(1, len(layer)):
+            from_left[i] = max(
+                desired[i], from_left[i - 1] + self._separation(layer[i - 1], layer[i])
+            )
+
+        from_right = list(desired)
+        for i in range(len(layer) - 2, -1, -1):
+            from_right[i] = min(
+                desired[i], from_right[i + 1] - self._separation(layer[i], layer[i + 1])
+            )
+
+        for v, left, right in zip(layer, from_left, from_right, strict=True):
+            x[v] = (left + right) / 2
+
+    def top_left(self, v: int) -> Point:
+        layer = self.layer_of[v]
+        return (
+            self.x[v] - self.widths[v] / 2,
+            self.layer_y[layer] + (self.layer_heights[layer] - self.heights[v]) / 2,
+        )
+
+    def size(self) -> tuple[float, float]:
+        return (
+            max(x + w / 2 for x, w in zip(self.x, self.widths, strict=True)),
+            self.layer_y[-1] + self.layer_heights[-1],
+        )
+
+    def edge_points(self, orthogonal: bool) -> Iterator[list[Point]]:
+        """Points for every edge, from source to target."""
+        for chain, reversed_edge in self.chains:
+            s, t = chain[0], chain[-1]
+            _, sy = self.top_left(s)
+            _, ty = self.top_left(t)
+            points = [
+                (self.x[s], sy + self.heights[s]),
+                *(
+                    (
+                        self.x[d],
+                        self.layer_y[self.layer_of[d]]
+                        + self.layer_heights[self.layer_of[d]] / 2,
+                    )
+                    for d in chain[1:-1]
+                ),
+                (self.x[t], ty),
+            ]
+            if orthogonal:
+                points = orthogonalize(points)
+            if reversed_edge:
+                points.reverse()
+            yield points
+
+
+def barycenter(v: int, neighbours: list[int], pos, default=None) -> float:
+    if not neighbours:
+        return pos[v] if default is None else default
+    return sum(pos[u] for u in neighbours) / len(neighbours)
+
+
+def orthogonalize(points: list[Point]) -> list[Point]:
+    """Route an edge with horizontal and vertical segments only."""
+    new_points = [points[0]]
+    for (x0, y0), (x1, y1) in zip(points, points[1:], strict=False):
+        if x0 != x1:
+            mid_y = (y0 + y1) / 2
+            new_points.extend([(x0, mid_y), (x1, mid_y)])
+        new_points.append((x1, y1))
+    return new_points
@@ -0,0 +1,103 @@
+import argparse
+import logging
+import re
+from pathlib import Path
+
+from gaphor.application import Session
+from gaphor.core.modeling import Diagram
+from gaphor.plugins.autolayout.layered import LayeredAutoLayout
+from gaphor.plugins.autolayout.pydot import DOT, AutoLayout
+from gaphor.plugins.diagramexport.exportall import pkg2dir
+from gaphor.storage import storage
+
+log = logging.getLogger(__name__)
+
+
+def layout_parser():
+    parser = argparse.ArgumentParser(
+        description="Auto-layout diagrams in Gaphor models."
+    )
+
+    parser.add_argument(
+        "-o",
+        "--dir",
+        metavar="directory",
+        help="write models to directory, default overwrite the models",
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        choices=[DOT, "layered"],
+        default=DOT,
+        help="layout engine: Graphviz (dot) or in-process (layered), default dot",
+    )
+    parser.add_argument(
+        "--ortho",
+        action="store_true",
+        help="route lines with horizontal and vertical segments",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="number of Graphviz processes to run at the same time",
+    )
+    parser.add_argument(
+        "-r",
+        "--regex",
+        dest="regex",
+        metavar="regex",
+        help="process diagrams which name matches given regular expression;"
+        " name includes package name; regular expressions are case insensitive",
+    )
+    parser.add_argument("model", nargs="+")
+    parser.set_defaults(command=layout_command)
+
+    return parser
+
+
+def layout_command(args):
+    session = Session(
+        services=[
+            "event_manager",
+            "component_registry",
+            "element_factory",
+            "element_dispatcher",
+            "modeling_language",
+        ]
+    )
+    factory = session.get_service("element_factory")
+    modeling_language = session.get_service("modeling_language")
+
+    name_re = re.compile(args.regex, re.IGNORECASE) if args.regex else None
+    auto_layout = AutoLayout() if args.engine == DOT else LayeredAutoLayout()
+
+    for model in args.model:
+        log.debug("loading model %s", model)
+        with open(model, encoding="utf-8") as file_obj:
+            storage.load(file_obj, factory, modeling_language)
+
+        diagrams = select_diagrams(factory, name_re)
+        log.info("laying out %d diagrams of %s", len(diagrams), model)
+        auto_layout.layout_all(
+            diagrams, splines="ortho" if args.ortho else "polyline", jobs=args.jobs
+        )
+
+        out_path = Path(args.dir) / Path(model).name if args.dir else Path(model)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as out:
+            storage.save(out, factory)
+        log.info("saved %s", out_path)
+
+    session.shutdown()
+    return 0
+
+
+def select_diagrams(factory, name_re=None) -> list[Diagram]:
+    """Diagrams in the model, optionally those whose name, including the
+    package path, matches ``name_re``."""
+    return [
+        diagram
+        for diagram in factory.select(Diagram)
+        if not name_re or name_re.search(f"{pkg2dir(diagram.owner)}/{diagram.name}")
+    ]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+import shutil
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from functools import singledispatch
 
 import pydot
@@ -11,8 +13,7 @@ from gaphas.matrix import Matrix
 from gaphas.segment import Segment
 
 import gaphor.UML.interactions
-from gaphor.abc import ActionProvider, Service
-from gaphor.action import action
+from gaphor.abc import Service
 from gaphor.core.modeling import Base, Diagram, Presentation
 from gaphor.diagram.connectors import ItemTemporaryDisconnected
 from gaphor.diagram.presentation import (
@@ -21,7 +22,6 @@ from gaphor.diagram.presentation import (
     HandlePositionEvent,
     LinePresentation,
 )
-from gaphor.i18n import gettext
 from gaphor.transaction import Transaction
 from gaphor.UML.actions.activitynodes import ForkNodeItem
 from gaphor.UML.classes.generalization import GeneralizationItem
@@ -30,35 +30,39 @@ DOT = "dot"
 DPI = 72.0
 
 
-class AutoLayoutService(Service, ActionProvider):
-    def __init__(self, event_manager, diagrams, tools_menu=None, dump_gv=False):
+class AutoLayoutService(Service):
+    """Auto-layout diagrams.
+
+    The ``engine`` is either ``"dot"`` (Graphviz) or ``"layered"``
+    (in-process). By default Graphviz is used, if it is installed.
+
+    Its actions are provided by :obj:`AutoLayoutActions`.
+    """
+
+    def __init__(self, event_manager, diagrams, dump_gv=False, engine=None):
         self.event_manager = event_manager
         self.diagrams = diagrams
-        if tools_menu:
-            tools_menu.add_actions(self)
         self.dump_gv = dump_gv
+        self.engine = engine or (DOT if shutil.which(DOT) else "layered")
 
     def shutdown(self):
         pass
 
-    @action(
-        name="auto-layout", label=gettext("Auto Layout"), shortcut="<Primary><Shift>L"
-    )
     def layout_current_diagram(self):
         if current_diagram := self.diagrams.get_current_diagram():
             self.layout(current_diagram)
 
-    @action(
-        name="auto-layout-ortho",
-        label=gettext("Auto Layout (orthogonal)"),
-        shortcut="<Primary><Shift>K",
-    )
     def layout_current_diagram_orthogonal(self):
         if current_diagram := self.diagrams.get_current_diagram():
             self.layout(current_diagram, splines="ortho")
 
     def layout(self, diagram: Diagram, splines="polyline"):
-        auto_layout = AutoLayout(self.event_manager, self.dump_gv)
+        if self.engine == DOT:
+            auto_layout = AutoLayout(self.event_manager, self.dump_gv)
+        else:
+            from gaphor.plugins.autolayout.layered import LayeredAutoLayout
+
+            auto_layout = LayeredAutoLayout(self.event_manager)
 
         with Transaction(self.event_manager):
             auto_layout.layout(diagram, splines)
@@ -76,6 +80,25 @@ class AutoLayout:
         self.apply_layout(diagram, rendered_graph)
         diagram.update(diagram.ownedPresentation)
 
+    def layout_all(
+        self, diagrams: Sequence[Diagram], splines="polyline", jobs: int | None = None
+    ) -> None:
+        """Lay out a number of diagrams.
+
+        Graphviz is run for up to ``jobs`` diagrams at the same time.
+        """
+        graphs = []
+        for diagram in diagrams:
+            diagram.update(diagram.ownedPresentation)
+            graphs.append(diagram_as_pydot(diagram, splines=splines))
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for diagram, rendered_graph in zip(
+                diagrams, executor.map(self.render, graphs), strict=True
+            ):
+                self.apply_layout(diagram, rendered_graph)
+                diagram.update(diagram.ownedPresentation)
+
     def render(self, graph: pydot.Dot):
         if self.dump_gv:
             graph.write("auto_layout.gv")
@@ -88,8 +111,16 @@ class AutoLayout:
         return rendered_graphs[0]
 
     def apply_layout(  # noqa: C901
-        self, diagram, rendered_graph, parent_presentation=None, height=None
+        self,
+        diagram,
+        rendered_graph,
+        parent_presentation=None,
+        height=None,
+        presentations: Mapping[str, Presentation] | None = None,
     ):
+        if presentations is None:
+            presentations = {p.id: p for p in diagram.ownedPresentation}
+
         if height is None:
             _, _, _, height = parse_bb(rendered_graph.get_node("graph")[0].get("bb"))
 
@@ -101,102 +132,122 @@ class AutoLayout:
 
         # First record original positions for involved lines
         for edge in rendered_graph.get_edges():
-            if presentation := presentation_for_object(diagram, edge):
-                for handle in (presentation.head, presentation.tail):
-                    if cinfo := diagram.connections.get_connection(handle):
-                        self.handle(
-                            ItemTemporaryDisconnected(
-                                presentation, handle, cinfo.connected, cinfo.port
-                            )
-                        )
-
-                for handle in presentation.handles():
-                    self.handle(
-                        HandlePositionEvent(presentation, handle, handle.pos.tuple())
-                    )
+            if presentation := presentation_for_object(presentations, edge):
+                self.record_line_position(diagram, presentation)
 
         for subgraph in rendered_graph.get_subgraphs():
             if presentation := presentation_for_object(
-                diagram, subgraph.get_node("graph")[0]
+                presentations, subgraph.get_node("graph")[0]
             ):
                 if bb := subgraph.get_node("graph")[0].get("bb"):
                     x, y, w, h = parse_bb(bb, height)
-                    presentation.handles()[NW].pos = (0.0, 0.0)
-                    presentation.width = w
-                    presentation.height = h
-
-                    new_pos = matrix_c2i.transform_point(x, y)
-                    presentation.matrix.set(
-                        x0=new_pos[0],
-                        y0=new_pos[1],
-                    )
+                    place_element(presentation, (x, y), (w, h), matrix_c2i)
                     self.apply_layout(
                         diagram,
                         subgraph,
                         parent_presentation=presentation,
                         height=height,
+                        presentations=presentations,
                     )
 
         for node in rendered_graph.get_nodes():
             if not node.get_pos():
                 continue
 
-            if presentation := presentation_for_object(diagram, node):
+            if presentation := presentation_for_object(presentations, node):
                 center = parse_point(node.get_pos(), height)
                 if isinstance(presentation, ElementPresentation):
-                    # Normalize handle placement
                     w = presentation.width
                     h = presentation.height
-                    presentation.handles()[NW].pos = (0.0, 0.0)
-                    presentation.width = w
-                    presentation.height = h
-
-                    new_pos = matrix_c2i.transform_point(
-                        center[0] - w / 2, center[1] - h / 2
+                    place_element(
+                        presentation,
+                        (center[0] - w / 2, center[1] - h / 2),
+                        None,
+                        matrix_c2i,
                     )
                 else:
                     new_pos = matrix_c2i.transform_point(center[0], center[1])
-                presentation.matrix.set(
-                    x0=new_pos[0],
-                    y0=new_pos[1],
-                )
+                    presentation.matrix.set(
+                        x0=new_pos[0],
+                        y0=new_pos[1],
+                    )
                 if isinstance(presentation, AttachedPresentation):
                     reconnect(
                         presentation, presentation.handles()[0], diagram.connections
                     )
 
         for edge in rendered_graph.get_edges():
-            if presentation := presentation_for_object(diagram, edge):
-                presentation.orthogonal = False
-
+            if presentation := presentation_for_object(presentations, edge):
                 reverse = isinstance(presentation, GeneralizationItem)
                 points = parse_edge_pos(edge.get_pos(), height, reverse)
-                segment = Segment(presentation, diagram)
-                while len(points) > len(presentation.handles()):
-                    segment.split_segment(0)
-                while len(points) < len(presentation.handles()):
-                    segment.merge_segment(0)
-
-                assert len(points) == len(presentation.handles())
-
-                matrix = presentation.matrix_i2c.inverse()
-                for handle, point in zip(presentation.handles(), points, strict=False):
-                    handle.pos = matrix.transform_point(*point)
+                set_line_points(presentation, diagram, points)
+
+    def record_line_position(self, diagram, presentation) -> None:
+        """Emit events for the current line position, so it can be restored."""
+        for handle in (presentation.head, presentation.tail):
+            if cinfo := diagram.connections.get_connection(handle):
+                self.handle(
+                    ItemTemporaryDisconnected(
+                        presentation, handle, cinfo.connected, cinfo.port
+                    )
+                )
 
-                for handle in (presentation.head, presentation.tail):
-                    reconnect(presentation, handle, diagram.connections)
+        for handle in presentation.handles():
+            self.handle(HandlePositionEvent(presentation, handle, handle.pos.tuple()))
 
     def handle(self, event):
         if self.event_manager:
             self.event_manager.handle(event)
 
 
-def presentation_for_object(diagram, obj) -> Presentation | None:
+def presentation_for_object(
+    presentations: Mapping[str, Presentation], obj
+) -> Presentation | None:
     if not obj.get("id"):
         return None
 
-    id = strip_quotes(obj.get("id"))
-    return next((p for p in diagram.ownedPresentation if p.id == id), None)
+    return presentations.get(strip_quotes(obj.get("id")))
+
+
+def place_element(
+    presentation: ElementPresentation,
+    pos: Point,
+    size: tuple[float, float] | None,
+    matrix_c2i: Matrix,
+) -> None:
+    """Move an element to a position in canvas coordinates.
+
+    Handles are normalized, so the element's origin is its top-left corner.
+    """
+    w, h = size or (presentation.width, presentation.height)
+    presentation.handles()[NW].pos = (0.0, 0.0)
+    presentation.width = w
+    presentation.height = h
+
+    x, y = matrix_c2i.transform_point(*pos)
+    presentation.matrix.set(x0=x, y0=y)
+
+
+def set_line_points(
+    presentation: LinePresentation, diagram: Diagram, points: list[Point]
+) -> None:
+    """Route a line along points in canvas coordinates, and reconnect it."""
+    presentation.orthogonal = False
+
+    segment = Segment(presentation, diagram)
+    while len(points) > len(presentation.handles()):
+        segment.split_segment(0)
+    while len(points) < len(presentation.handles()):
+        segment.merge_segment(0)
+
+    assert len(points) == len(presentation.handles())
+
+    matrix = presentation.matrix_i2c.inverse()
+    for handle, point in zip(presentation.handles(), points, strict=False):
+        handle.pos = matrix.transform_point(*point)
+
+    for handle in (presentation.head, presentation.tail):
+        reconnect(presentation, handle, diagram.connections)
 
 
 def reconnect(presentation, handle, connections) -> None:
@@ -0,0 +1,104 @@
+from gaphor import UML
+from gaphor.diagram.tests.fixtures import connect
+from gaphor.plugins.autolayout.layered import (
+    LayeredAutoLayout,
+    acyclic,
+    assign_layers,
+    orthogonalize,
+)
+from gaphor.UML.diagramitems import (
+    ActionItem,
+    AssociationItem,
+    ClassItem,
+    ForkNodeItem,
+    GeneralizationItem,
+    InputPinItem,
+    ObjectFlowItem,
+    PackageItem,
+)
+
+
+def test_layout_diagram(diagram, create):
+    superclass = create(ClassItem, UML.Class)
+    subclass = create(ClassItem, UML.Class)
+    gen = create(GeneralizationItem, UML.Generalization)
+    connect(gen, gen.tail, superclass)
+    connect(gen, gen.head, subclass)
+
+    auto_layout = LayeredAutoLayout()
+    auto_layout.layout(diagram)
+
+    assert superclass.matrix[5] < subclass.matrix[5]
+    assert gen.head.pos != (0, 0)
+    assert gen.tail.pos != (0, 0)
+
+
+def test_layout_with_association(diagram, create, event_manager):
+    c1 = create(ClassItem, UML.Class)
+    c2 = create(ClassItem, UML.Class)
+    a = create(AssociationItem)
+    connect(a, a.head, c1)
+    connect(a, a.tail, c2)
+
+    auto_layout = LayeredAutoLayout(event_manager)
+    auto_layout.layout(diagram, splines="ortho")
+
+    assert c1.matrix[5] + c1.height < c2.matrix[5]
+
+
+def test_layout_with_nested(diagram, create, event_manager):
+    p = create(PackageItem, UML.Package)
+    c1 = create(ClassItem, UML.Class)
+    p.children = c1
+    c2 = create(ClassItem, UML.Class)
+    a = create(AssociationItem)
+    connect(a, a.head, c1)
+    connect(a, a.tail, c2)
+
+    auto_layout = LayeredAutoLayout(event_manager)
+    auto_layout.layout(diagram)
+
+    assert 0 < c1.matrix[4] < p.width
+    assert 0 < c1.matrix[5] < p.height
+
+
+def test_layout_with_attached_item(diagram, create, event_manager):
+    action = create(ActionItem, UML.Action)
+    pin = create(InputPinItem, UML.InputPin)
+    connect(pin, pin.handles()[0], action)
+
+    action2 = create(ActionItem, UML.Action)
+    object_flow = create(ObjectFlowItem, UML.ObjectFlow)
+    connect(object_flow, object_flow.head, pin)
+    connect(object_flow, object_flow.tail, action2)
+
+    auto_layout = LayeredAutoLayout(event_manager)
+    auto_layout.layout(diagram)
+
+    assert pin.parent is action
+
+
+def test_layout_fork_node_item(diagram, create, event_manager):
+    create(ForkNodeItem, UML.ForkNode)
+
+    auto_layout = LayeredAutoLayout(event_manager)
+    auto_layout.layout(diagram)
+
+
+def test_cycles_are_broken():
+    edges = acyclic(3, [(0, 1), (1, 2), (2, 0)])
+
+    assert edges == [(0, 1, False), (1, 2, False), (0, 2, True)]
+
+
+def test_layers_follow_edges():
+    assert assign_layers(4, [(0, 1), (1, 2), (3, 2)]) == [0, 1, 2, 1]
+
+
+def test_orthogonal_edge():
+    assert orthogonalize([(0, 0), (10, 20)]) == [
+        (0, 0),
+        (0, 10),
+        (10, 10),
+        (10, 20),
+    ]
@@ -0,0 +1,31 @@
+import re
+
+from gaphor.plugins.autolayout.layoutcli import layout_parser, select_diagrams
+from gaphor.UML import Diagram, Package
+
+
+def test_layout_command(test_models, tmp_path):
+    model = test_models / "simple-items.gaphor"
+    parser = layout_parser()
+    args = parser.parse_args(["-e", "layered", "-o", str(tmp_path), str(model)])
+
+    exit_code = args.command(args)
+
+    assert exit_code == 0
+    assert (tmp_path / model.name).exists()
+    assert (tmp_path / model.name).read_text(encoding="utf-8") != model.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_select_diagrams_by_name(element_factory):
+    package = element_factory.create(Package)
+    package.name = "pkg"
+    diagram = element_factory.create(Diagram)
+    diagram.name = "main"
+    diagram.element = package
+    other = element_factory.create(Diagram)
+    other.name = "other"
+
+    assert select_diagrams(element_factory) == [diagram, other]
+    assert select_diagrams(element_factory, re.compile("pkg/main")) == [diagram]
@@ -0,0 +1,197 @@
+import argparse
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+from gaphor.plugins.benchmark.benchmarks import (
+    BENCHMARKS,
+    environment,
+    run_benchmarks,
+)
+from gaphor.plugins.benchmark.modelgenerator import (
+    ModelParameters,
+    generate_model_file,
+)
+from gaphor.plugins.benchmark.startup import measure_startup
+
+log = logging.getLogger(__name__)
+
+BUNDLED_MODELS = ["UML.gaphor", "UML_test.gaphor", "RAAML_full.gaphor"]
+
+
+def bundled_models() -> list[Path]:
+    """Models from the source tree, if available."""
+    models_dir = Path(__file__).parent.parent.parent.parent / "models"
+    return [
+        models_dir / name for name in BUNDLED_MODELS if (models_dir / name).exists()
+    ]
+
+
+def benchmark_parser():
+    parser = argparse.ArgumentParser(
+        description="Measure performance of common operations on models."
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="file",
+        help="write results as JSON to file",
+    )
+    parser.add_argument(
+        "-n",
+        "--rounds",
+        type=int,
+        default=3,
+        help="number of rounds per benchmark, default 3",
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmark",
+        dest="benchmarks",
+        action="append",
+        choices=list(BENCHMARKS),
+        help="benchmark to run (can be repeated), default all",
+    )
+    parser.add_argument(
+        "-c",
+        "--compare",
+        metavar="file",
+        help="compare results with an earlier JSON results file",
+    )
+    parser.add_argument(
+        "-s",
+        "--synthetic",
+        metavar="scale",
+        type=int,
+        action="append",
+        help="also benchmark a generated model, scale 1 is about 2000 elements",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="also measure start up time of the GUI and the export command",
+    )
+    parser.add_argument(
+        "model", nargs="*", help="model file(s), default the bundled models"
+    )
+    parser.set_defaults(command=benchmark_command)
+
+    return parser
+
+
+def synthetic_parameters(scale: int) -> ModelParameters:
+    return ModelParameters(
+        packages=10 * scale,
+        classes=20,
+        attributes=5,
+        associations=100 * scale,
+        diagrams=10 * scale,
+        presentations=20,
+    )
+
+
+def benchmark_command(args):
+    models = [Path(m) for m in args.model]
+    if not models and not args.synthetic:
+        models = bundled_models()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for scale in args.synthetic or ():
+            path = Path(tmpdir) / f"synthetic-{scale}.gaphor"
+            log.info("Generating synthetic model %s", path.name)
+            generate_model_file(path, synthetic_parameters(scale))
+            models.append(path)
+
+        if not models:
+            log.error("No models to benchmark")
+            return 1
+
+        results = list(
+            run_benchmarks(
+                models,
+                args.benchmarks,
+                args.rounds,
+                progress=lambda name, path: log.info(
+                    "Running %s on %s", name, path.name
+                ),
+            )
+        )
+        if args.startup:
+            log.info("Measuring start up time")
+            results.extend(measure_startup(models, args.rounds))
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    for result in results:
+        line = (
+            f"{result.name:12} {result.model:24} {result.elements:8} elements"
+            f"  min {result.min:8.4f}s  mean {result.mean:8.4f}s"
+        )
+        if previous := baseline.get((result.name, result.model)):
+            line += f"  ({result.min / previous:5.2f}x)"
+        print(line)  # noqa: T201
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "environment": environment(),
+                    "results": [result.as_dict() for result in results],
+                },
+                f,
+                indent=2,
+            )
+    return 0
+
+
+def load_baseline(filename: str) -> dict[tuple[str, str], float]:
+    with open(filename, encoding="utf-8") as f:
+        data = json.load(f)
+    return {(r["name"], r["model"]): r["min"] for r in data["results"]}
+
+
+def generate_model_parser():
+    parser = argparse.ArgumentParser(
+        description="Generate a large model for scale testing."
+    )
+    defaults = ModelParameters()
+
+    def add(name, help):
+        parser.add_argument(
+            f"--{name}",
+            type=int,
+            default=getattr(defaults, name),
+            help=f"{help}, default {getattr(defaults, name)}",
+        )
+
+    add("packages", "number of packages")
+    add("classes", "number of classes per package")
+    add("attributes", "number of attributes per class")
+    add("associations", "number of associations")
+    add("diagrams", "number of diagrams")
+    add("presentations", "number of classes shown per diagram")
+    add("seed", "random seed")
+    parser.add_argument(
+        "--sysml", action="store_true", help="create SysML blocks instead of classes"
+    )
+    parser.add_argument("output", help="model file to write")
+    parser.set_defaults(command=generate_model_command)
+
+    return parser
+
+
+def generate_model_command(args):
+    parameters = ModelParameters(
+        packages=args.packages,
+        classes=args.classes,
+        attributes=args.attributes,
+        associations=args.associations,
+        diagrams=args.diagrams,
+        presentations=args.presentations,
+        sysml=args.sysml,
+        seed=args.seed,
+    )
+    log.info("Generating model with about %d elements", parameters.size)
+    generate_model_file(args.output, parameters)
+    return 0
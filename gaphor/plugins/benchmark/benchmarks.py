@@ -0,0 +1,363 @@
+"""Benchmarks of common operations on (large) models.
+
+A benchmark is a generator that takes a model file. It yields a function
+to be timed for each round. Setting up a round (e.g. loading the model
+to be saved) is done by the generator and is not part of the measured
+time.
+"""
+
+from __future__ import annotations
+
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+from gaphor.abc import ActionProvider
+from gaphor.action import is_action
+from gaphor.application import Session, distribution
+from gaphor.core.changeset.compare import compare, unchanged_elements
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling import Diagram, ElementFactory, StyleSheet
+from gaphor.core.modeling.diagram import StyledItem
+from gaphor.core.modeling.elementdispatcher import ElementDispatcher
+from gaphor.core.modeling.modelinglanguage import ModelingLanguage
+from gaphor.diagram.copypaste import copy_full, paste_full
+from gaphor.diagram.export import save_pdf, save_svg
+from gaphor.services.modelinglanguage import ModelingLanguageService
+from gaphor.storage import storage
+
+Benchmark = Callable[[Path], Generator[Callable[[], object], None, None]]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    model: str
+    elements: int
+    timings: list[float] = field(default_factory=list)
+
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "model": self.model,
+            "elements": self.elements,
+            "rounds": len(self.timings),
+            "min": self.min,
+            "mean": self.mean,
+            "median": self.median,
+            "timings": self.timings,
+        }
+
+
+def environment() -> dict[str, str]:
+    return {
+        "gaphor-version": distribution().version,
+        "python-version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def new_element_factory(modeling_language: ModelingLanguage) -> ElementFactory:
+    event_manager = EventManager()
+    return ElementFactory(
+        event_manager, ElementDispatcher(event_manager, modeling_language)
+    )
+
+
+def load_model(
+    path: Path, element_factory: ElementFactory, modeling_language: ModelingLanguage
+) -> None:
+    with open(path, encoding="utf-8") as file_obj:
+        storage.load(file_obj, element_factory, modeling_language)
+
+
+@contextmanager
+def loaded_model(path: Path) -> Iterator[ElementFactory]:
+    modeling_language = ModelingLanguageService()
+    element_factory = new_element_factory(modeling_language)
+    load_model(path, element_factory, modeling_language)
+    try:
+        yield element_factory
+    finally:
+        element_factory.shutdown()
+
+
+def timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure(benchmark: Benchmark, path: Path, rounds: int) -> list[float]:
+    """Run a benchmark a number of times, and return the timing per round."""
+    runs = benchmark(path)
+    try:
+        return [timed(run) for _, run in zip(range(rounds), runs, strict=False)]
+    finally:
+        runs.close()
+
+
+def bench_load(path: Path) -> Iterator[Callable[[], object]]:
+    modeling_language = ModelingLanguageService()
+    while True:
+        element_factory = new_element_factory(modeling_language)
+        yield partial(load_model, path, element_factory, modeling_language)
+        element_factory.shutdown()
+
+
+def bench_save(path: Path) -> Iterator[Callable[[], object]]:
+    class NullWriter:
+        def write(self, data):
+            pass
+
+    with loaded_model(path) as element_factory:
+        while True:
+            yield partial(storage.save, NullWriter(), element_factory)
+
+
+def bench_flush(path: Path) -> Iterator[Callable[[], object]]:
+    while True:
+        with loaded_model(path) as element_factory:
+            yield element_factory.flush
+
+
+def bench_compare(path: Path) -> Iterator[Callable[[], object]]:
+    modeling_language = ModelingLanguageService()
+    with loaded_model(path) as ancestor, loaded_model(path) as incoming:
+        # Compare as a merge does: elements with the same digest are skipped
+        parsed = storage.parse_file(path)
+
+        def compare_models(current):
+            unchanged = unchanged_elements(
+                storage.element_digests(*parsed), storage.element_digests(*parsed)
+            )
+            return list(compare(current, ancestor, incoming, unchanged))
+
+        while True:
+            current = new_element_factory(modeling_language)
+            yield partial(compare_models, current)
+            current.shutdown()
+
+
+def largest_diagram(element_factory: ElementFactory) -> Diagram | None:
+    return max(
+        element_factory.select(Diagram),
+        key=lambda d: len(d.ownedPresentation),
+        default=None,
+    )
+
+
+def bench_copy_paste(path: Path) -> Iterator[Callable[[], object]]:
+    with loaded_model(path) as element_factory:
+        diagram = largest_diagram(element_factory)
+        if not diagram:
+            return
+
+        items = set(diagram.ownedPresentation)
+
+        def copy_paste():
+            new_diagram = element_factory.create(type(diagram))
+            paste_full(copy_full(items, element_factory.lookup), new_diagram)
+
+        while True:
+            yield copy_paste
+
+
+def bench_style(path: Path) -> Iterator[Callable[[], object]]:
+    with loaded_model(path) as element_factory:
+        style_sheet = next(element_factory.select(StyleSheet))
+        nodes = [
+            StyledItem(item)
+            for diagram in element_factory.select(Diagram)
+            for item in diagram.get_all_items()
+        ]
+
+        def compute_styles():
+            compiled_style_sheet = style_sheet.new_compiled_style_sheet()
+            for node in nodes:
+                compiled_style_sheet.compute_style(node)
+
+        while True:
+            yield compute_styles
+
+
+def bench_action_dispatch(path: Path) -> Iterator[Callable[[], object]]:
+    session = Session()
+    try:
+        element_factory = session.get_service("element_factory")
+        load_model(path, element_factory, session.get_service("modeling_language"))
+        component_registry = session.get_service("component_registry")
+        actions = [
+            (name, attrname)
+            for name, provider in component_registry.all(ActionProvider)
+            for attrname in dir(type(provider))
+            if is_action(getattr(type(provider), attrname))
+        ]
+
+        def dispatch():
+            # Look up the action provider and the services an action
+            # typically needs, for each diagram
+            for _ in element_factory.select(Diagram):
+                for name, attrname in actions:
+                    getattr(session.get_service(name), attrname)
+                    session.get_service("element_factory")
+                    session.get_service("event_manager")
+
+        while True:
+            yield dispatch
+    finally:
+        session.shutdown()
+
+
+def bench_selection_change(path: Path) -> Iterator[Callable[[], object]]:
+    from gi.repository import Gtk
+
+    from gaphor.ui.elementeditor import EditorStack
+
+    session = Session()
+    try:
+        element_factory = session.get_service("element_factory")
+        load_model(path, element_factory, session.get_service("modeling_language"))
+        diagram = largest_diagram(element_factory)
+        if not diagram:
+            return
+
+        editor_stack = EditorStack(
+            session.get_service("event_manager"),
+            session.get_service("component_registry"),
+            session.get_service("diagrams"),
+            session.get_service("properties"),
+        )
+        editor_stack.vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        items = diagram.ownedPresentation
+
+        def select_each_item():
+            # Show the property pages for each item, as if it was selected
+            editor_stack.clear_pages()
+            for item in items:
+                editor_stack.update_pages(item)
+
+        while True:
+            yield select_each_item
+    finally:
+        session.shutdown()
+
+
+def _bench_export(save_fn, suffix) -> Benchmark:
+    def bench_export(path: Path) -> Iterator[Callable[[], object]]:
+        with loaded_model(path) as element_factory, tempfile.TemporaryDirectory() as d:
+            diagrams = element_factory.lselect(Diagram)
+
+            def export():
+                for n, diagram in enumerate(diagrams):
+                    save_fn(f"{d}/{n}.{suffix}", diagram)
+
+            while True:
+                yield export
+
+    return bench_export
+
+
+def _bench_layout(engine: str) -> Benchmark:
+    def bench_layout(path: Path) -> Iterator[Callable[[], object]]:
+        from gaphor.plugins.autolayout import AutoLayout, LayeredAutoLayout
+        from gaphor.plugins.autolayout.pydot import DOT
+
+        if engine == DOT and not shutil.which(DOT):
+            return
+
+        with loaded_model(path) as element_factory:
+            diagram = largest_diagram(element_factory)
+            if not diagram:
+                return
+
+            auto_layout = AutoLayout() if engine == DOT else LayeredAutoLayout()
+
+            while True:
+                yield partial(auto_layout.layout, diagram)
+
+    return bench_layout
+
+
+def _bench_paint(cache: bool) -> Benchmark:
+    def bench_paint(path: Path) -> Iterator[Callable[[], object]]:
+        import cairo
+
+        from gaphor.diagram.painter import ItemPainter
+
+        with loaded_model(path) as element_factory:
+            diagram = largest_diagram(element_factory)
+            if not diagram:
+                return
+
+            diagram.update(diagram.ownedPresentation)
+            items = list(diagram.get_all_items())
+            painter = ItemPainter(cache=cache)
+            surface = cairo.ImageSurface(cairo.Format.ARGB32, 1024, 1024)
+
+            def paint():
+                # Repaint the diagram, as is done for every frame
+                painter.paint(items, cairo.Context(surface))
+
+            while True:
+                yield paint
+
+    return bench_paint
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "load": bench_load,
+    "save": bench_save,
+    "flush": bench_flush,
+    "compare": bench_compare,
+    "copy-paste": bench_copy_paste,
+    "style": bench_style,
+    "action-dispatch": bench_action_dispatch,
+    "selection-change": bench_selection_change,
+    "export-svg": _bench_export(save_svg, "svg"),
+    "export-pdf": _bench_export(save_pdf, "pdf"),
+    "paint": _bench_paint(cache=False),
+    "paint-cached": _bench_paint(cache=True),
+    "layout-layered": _bench_layout("layered"),
+    "layout-graphviz": _bench_layout("dot"),
+}
+
+
+def model_size(path: Path) -> int:
+    with loaded_model(path) as element_factory:
+        return element_factory.size()
+
+
+def run_benchmarks(
+    models: list[Path],
+    names: list[str] | None = None,
+    rounds: int = 3,
+    progress: Callable[[str, Path], None] | None = None,
+) -> Iterator[BenchmarkResult]:
+    for path in models:
+        elements = model_size(path)
+        for name in names or BENCHMARKS:
+            if progress:
+                progress(name, path)
+            if timings := measure(BENCHMARKS[name], path, rounds):
+                yield BenchmarkResult(name, path.name, elements, timings)
@@ -0,0 +1,169 @@
+"""Generate large, synthetic models for scale testing.
+
+The generated model is deterministic: the same parameters result in
+the same model, including element ids.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from gaphor import UML
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling import ElementFactory
+from gaphor.core.modeling.base import Id, generate_id, uuid_generator
+from gaphor.diagram.presentation import connect
+from gaphor.storage import storage
+from gaphor.SysML import sysml
+from gaphor.SysML.blocks.block import BlockItem
+from gaphor.UML.classes import AssociationItem, ClassItem
+
+GRID_SIZE = 200
+
+
+@dataclass(frozen=True)
+class ModelParameters:
+    """Parameters of a generated model.
+
+    Classes and attributes are created per package, presentations
+    per diagram. Association lines are added to a diagram if both
+    ends of the association are shown.
+    """
+
+    packages: int = 10
+    classes: int = 10
+    attributes: int = 3
+    associations: int = 50
+    diagrams: int = 10
+    presentations: int = 20
+    sysml: bool = False
+    seed: int = 0
+
+    @property
+    def size(self) -> int:
+        """An estimate of the number of elements in the model."""
+        classes = self.packages * self.classes
+        return (
+            self.packages
+            + classes * (1 + self.attributes)
+            + self.associations * 3
+            + self.diagrams * (1 + self.presentations)
+        )
+
+
+def seeded_id_generator(seed: int) -> Iterator[Id]:
+    rng = random.Random(seed)
+    while True:
+        yield str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+@contextmanager
+def deterministic_ids(seed: int) -> Iterator[None]:
+    """Generate element ids from a seeded random generator."""
+    generator = seeded_id_generator(seed)
+    generate_id(generator)
+    try:
+        yield
+    finally:
+        generate_id(uuid_generator())
+
+
+def generate_model(
+    element_factory: ElementFactory, parameters: ModelParameters
+) -> UML.Package:
+    """Populate the element factory with a generated model.
+
+    Returns the top level package.
+    """
+    rng = random.Random(parameters.seed)
+    class_type = sysml.Block if parameters.sysml else UML.Class
+
+    with deterministic_ids(parameters.seed):
+        model = element_factory.create(UML.Package)
+        model.name = "Model"
+
+        packages = []
+        classes = []
+        for p in range(parameters.packages):
+            package = element_factory.create(UML.Package)
+            package.name = f"Package {p}"
+            package.nestingPackage = model
+            packages.append(package)
+
+            for c in range(parameters.classes):
+                class_ = element_factory.create(class_type)
+                class_.name = f"Class {p}.{c}"
+                class_.package = package
+                for a in range(parameters.attributes):
+                    attribute = element_factory.create(UML.Property)
+                    attribute.name = f"attribute{a}"
+                    attribute.typeValue = "int"
+                    class_.ownedAttribute = attribute
+                classes.append(class_)
+
+        associations = []
+        if classes:
+            for _ in range(parameters.associations):
+                head, tail = rng.choice(classes), rng.choice(classes)
+                association = UML.recipes.create_association(head, tail)
+                association.package = head.package
+                associations.append(association)
+
+        for d in range(parameters.diagrams):
+            _generate_diagram(
+                element_factory,
+                rng.choice(packages) if packages else model,
+                f"Diagram {d}",
+                rng.sample(classes, min(parameters.presentations, len(classes))),
+                associations,
+                parameters.sysml,
+            )
+
+    return model
+
+
+def generate_model_file(path: Path | str, parameters: ModelParameters) -> None:
+    """Generate a model and save it to a file."""
+    element_factory = ElementFactory(EventManager())
+    generate_model(element_factory, parameters)
+    with open(path, "w", encoding="utf-8") as out:
+        storage.save(out, element_factory)
+    element_factory.shutdown()
+
+
+def _generate_diagram(
+    element_factory, package, name, classes, associations, use_sysml
+) -> None:
+    diagram_type = sysml.BlockDefinitionDiagram if use_sysml else UML.ClassDiagram
+    item_type = BlockItem if use_sysml else ClassItem
+
+    diagram = element_factory.create(diagram_type)
+    diagram.name = name
+    diagram.element = package
+
+    columns = max(1, int(len(classes) ** 0.5))
+    items = {}
+    for n, class_ in enumerate(classes):
+        item = diagram.create(item_type, subject=class_)
+        item.matrix.translate((n % columns) * GRID_SIZE, (n // columns) * GRID_SIZE)
+        items[class_] = item
+
+    for association in associations:
+        head_type, tail_type = association.memberEnd[:].type
+        if head_type in items and tail_type in items and head_type is not tail_type:
+            head_item, tail_item = items[head_type], items[tail_type]
+            line = diagram.create(AssociationItem, subject=association)
+            line.head.pos = _center(head_item)
+            line.tail.pos = _center(tail_item)
+            connect(line, line.head, head_item)
+            connect(line, line.tail, tail_item)
+
+
+def _center(item) -> tuple[float, float]:
+    x, y = item.matrix.transform_point(0, 0)
+    return x + item.width / 2, y + item.height / 2
@@ -0,0 +1,166 @@
+"""Measure the time it takes for Gaphor to start.
+
+Gaphor is started in a separate process with tracing enabled. The
+``startup.*`` marks in the trace tell when the main window is shown
+and when the model is ready. For the GUI, the
+:class:`StartupBenchmark` launch service quits Gaphor as soon as the
+model is ready.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from gaphor.abc import Service
+from gaphor.core import event_handler
+from gaphor.core.modeling import ModelReady
+from gaphor.event import SessionCreated
+from gaphor.plugins.benchmark.benchmarks import BenchmarkResult, model_size
+
+MARK_PREFIX = "startup."
+TIMEOUT = 120
+
+CommandFactory = Callable[[Path, Path], list[str]]
+
+
+class StartupBenchmark(Service):
+    """Launch service that quits Gaphor once a model is ready.
+
+    It is not registered as an application service: :func:`main` hands
+    it to :func:`gaphor.ui.run` directly.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.event_manager = application.get_service("event_manager")
+
+    def init(self, gtk_app):
+        self.event_manager.subscribe(self._on_session_created)
+
+    def shutdown(self):
+        self.event_manager.unsubscribe(self._on_session_created)
+
+    def open(self):
+        self.application.new_session()
+
+    @event_handler(SessionCreated)
+    def _on_session_created(self, event: SessionCreated):
+        event.session.get_service("event_manager").subscribe(self._on_model_ready)
+
+    @event_handler(ModelReady)
+    def _on_model_ready(self, event: ModelReady):
+        from gi.repository import GLib
+
+        # Quit once pending drawing has been done
+        GLib.idle_add(self.application.shutdown, priority=GLib.PRIORITY_LOW)
+
+
+def gui_command(trace_file: Path, model: Path | None) -> list[str]:
+    return [
+        sys.executable,
+        "-m",
+        "gaphor.plugins.benchmark.startup",
+        "--trace",
+        str(trace_file),
+        *([str(model)] if model else []),
+    ]
+
+
+def export_command(trace_file: Path, model: Path, output_dir: Path) -> list[str]:
+    return [
+        sys.executable,
+        "-m",
+        "gaphor",
+        "export",
+        "--trace",
+        str(trace_file),
+        "--trace-format",
+        "json",
+        "--dir",
+        str(output_dir),
+        str(model),
+    ]
+
+
+def run_startup(command_factory: CommandFactory) -> dict[str, float]:
+    """Run a Gaphor process once, and return wall time and marks.
+
+    Marks are measured from the moment the tracer is started, the wall
+    time also includes starting the Python interpreter.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trace_file = Path(tmpdir) / "trace.json"
+        start = time.perf_counter()
+        subprocess.run(
+            command_factory(trace_file, Path(tmpdir)),
+            check=True,
+            timeout=TIMEOUT,
+            stdout=subprocess.DEVNULL,
+        )
+        timings = {"wall": time.perf_counter() - start}
+        with open(trace_file, encoding="utf-8") as f:
+            spans = json.load(f)["spans"]
+
+    for s in spans:
+        if s["name"].startswith(MARK_PREFIX):
+            timings.setdefault(s["name"].removeprefix(MARK_PREFIX), s["duration"])
+    return timings
+
+
+def measure_startup(
+    models: list[Path], rounds: int = 3, gui: bool = True
+) -> Iterator[BenchmarkResult]:
+    """Measure start up of the GUI, with a new and existing models, and of
+    the export command."""
+    runs: list[tuple[str, Path | None, CommandFactory]] = []
+    if gui:
+        runs.append(("gui", None, lambda t, _d: gui_command(t, None)))
+        runs.extend(("gui", m, lambda t, _d, m=m: gui_command(t, m)) for m in models)
+    runs.extend(
+        ("export", m, lambda t, d, m=m: export_command(t, m, d)) for m in models
+    )
+
+    for kind, model, command_factory in runs:
+        results: dict[str, BenchmarkResult] = {}
+        elements = model_size(model) if model else 0
+        for _ in range(rounds):
+            for mark, duration in run_startup(command_factory).items():
+                results.setdefault(
+                    mark,
+                    BenchmarkResult(
+                        f"{kind}.{mark}", model.name if model else "-", elements
+                    ),
+                ).timings.append(duration)
+        yield from results.values()
+
+
+def main(argv=None) -> int:
+    from gaphor.core.tracing import tracing
+
+    parser = argparse.ArgumentParser(description="Start Gaphor and quit.")
+    parser.add_argument("--trace", metavar="FILE", required=True)
+    parser.add_argument("model", nargs="?")
+    args = parser.parse_args(argv)
+
+    with tracing() as tracer:
+        # Importing the UI is part of starting up
+        import gaphor.ui
+
+        exit_code = gaphor.ui.run(
+            [sys.argv[0], *([args.model] if args.model else [])],
+            launch_service=StartupBenchmark,
+        )
+
+    tracer.write(args.trace, "json")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from gaphor.plugins.benchmark.benchmarkcli import benchmark_parser
+from gaphor.plugins.benchmark.benchmarks import BENCHMARKS, run_benchmarks
+
+
+@pytest.mark.parametrize("name", BENCHMARKS)
+def test_benchmark(name, test_models):
+    (result,) = run_benchmarks([test_models / "simple-items.gaphor"], [name], rounds=1)
+
+    assert result.name == name
+    assert result.model == "simple-items.gaphor"
+    assert result.elements > 0
+    assert len(result.timings) == 1
+
+
+def test_benchmark_command(test_models, tmp_path):
+    output = tmp_path / "results.json"
+    parser = benchmark_parser()
+    args = parser.parse_args(
+        [
+            "-n",
+            "1",
+            "-b",
+            "load",
+            "-b",
+            "save",
+            "-o",
+            str(output),
+            str(test_models / "simple-items.gaphor"),
+        ]
+    )
+
+    exit_code = args.command(args)
+    results = json.loads(output.read_text(encoding="utf-8"))
+
+    assert exit_code == 0
+    assert "gaphor-version" in results["environment"]
+    assert [r["name"] for r in results["results"]] == ["load", "save"]
+
+
+def test_benchmark_command_compares_with_baseline(test_models, tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {"results": [{"name": "load", "model": "simple-items.gaphor", "min": 1.0}]}
+        ),
+        encoding="utf-8",
+    )
+    parser = benchmark_parser()
+    args = parser.parse_args(
+        [
+            "-n",
+            "1",
+            "-b",
+            "load",
+            "-c",
+            str(baseline),
+            str(test_models / "simple-items.gaphor"),
+        ]
+    )
+
+    args.command(args)
+
+    assert "x)" in capsys.readouterr().out
@@ -0,0 +1,75 @@
+from gaphor import UML
+from gaphor.plugins.benchmark.benchmarkcli import generate_model_parser
+from gaphor.plugins.benchmark.modelgenerator import (
+    ModelParameters,
+    generate_model,
+    generate_model_file,
+)
+from gaphor.storage import storage
+from gaphor.SysML import sysml
+from gaphor.UML.classes import AssociationItem, ClassItem
+
+SMALL = ModelParameters(
+    packages=2, classes=3, attributes=2, associations=4, diagrams=2, presentations=4
+)
+
+
+def test_generate_model(element_factory):
+    model = generate_model(element_factory, SMALL)
+
+    assert model.name == "Model"
+    assert len(model.nestedPackage) == 2
+    assert len(element_factory.lselect(UML.Class)) == 6
+    assert len(element_factory.lselect(UML.Association)) == 4
+    assert len(element_factory.lselect(UML.ClassDiagram)) == 2
+    assert len(element_factory.lselect(ClassItem)) == 8
+
+
+def test_generated_association_items_are_connected(element_factory):
+    generate_model(
+        element_factory,
+        ModelParameters(packages=1, classes=2, associations=1, presentations=2),
+    )
+
+    for line in element_factory.select(AssociationItem):
+        connections = line.diagram.connections
+        assert connections.get_connection(line.head)
+        assert connections.get_connection(line.tail)
+
+
+def test_generate_sysml_model(element_factory):
+    generate_model(element_factory, ModelParameters(sysml=True, packages=1))
+
+    assert element_factory.lselect(sysml.Block)
+    assert element_factory.lselect(sysml.BlockDefinitionDiagram)
+
+
+def test_generated_model_is_deterministic(element_factory):
+    generate_model(element_factory, SMALL)
+    ids = [e.id for e in element_factory]
+    element_factory.flush()
+
+    generate_model(element_factory, SMALL)
+
+    assert [e.id for e in element_factory] == ids
+
+
+def test_generate_model_file(tmp_path, element_factory, modeling_language):
+    path = tmp_path / "generated.gaphor"
+
+    generate_model_file(path, SMALL)
+    with open(path, encoding="utf-8") as f:
+        storage.load(f, element_factory, modeling_language)
+
+    assert len(element_factory.lselect(UML.Class)) == 6
+
+
+def test_generate_model_command(tmp_path):
+    path = tmp_path / "generated.gaphor"
+    parser = generate_model_parser()
+    args = parser.parse_args(["--packages", "1", "--diagrams", "1", str(path)])
+
+    exit_code = args.command(args)
+
+    assert exit_code == 0
+    assert path.exists()
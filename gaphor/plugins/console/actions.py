@@ -0,0 +1,22 @@
+"""Console actions.
+
+The console window is a lazy service. Its actions are declared here,
+so the console is only loaded once it's opened.
+"""
+
+from gaphor.abc import ActionProvider, Service
+from gaphor.action import action
+from gaphor.i18n import gettext
+
+
+class ConsoleWindowActions(Service, ActionProvider):
+    def __init__(self, component_registry, tools_menu):
+        self.component_registry = component_registry
+        tools_menu.add_actions(self)
+
+    def shutdown(self):
+        pass
+
+    @action(name="console-window-open", label=gettext("Console"))
+    def open_console(self):
+        self.component_registry.get_service("console_window").open_console()
@@ -5,8 +5,6 @@ import logging
 from gi.repository import Adw, Gdk, Gtk
 
 from gaphor import settings
-from gaphor.abc import ActionProvider
-from gaphor.action import action
 from gaphor.i18n import gettext
 from gaphor.plugins.console.console import GTKInterpreterConsole
 from gaphor.ui.abc import UIComponent
@@ -14,11 +12,15 @@ from gaphor.ui.abc import UIComponent
 log = logging.getLogger(__name__)
 
 
-class ConsoleWindow(UIComponent, ActionProvider):
-    def __init__(self, component_registry, main_window, tools_menu):
+class ConsoleWindow(UIComponent):
+    """The console window.
+
+    Its action is provided by :obj:`ConsoleWindowActions`.
+    """
+
+    def __init__(self, component_registry, main_window):
         self.component_registry = component_registry
         self.main_window = main_window
-        tools_menu.add_actions(self)
         self.window = None
 
     def load_console_py(self, console):
@@ -35,7 +37,6 @@ class ConsoleWindow(UIComponent, ActionProvider):
         except OSError:
             log.info(f"No initiation script {console_py}")
 
-    @action(name="console-window-open", label=gettext("Console"))
     def open_console(self):
         if not self.window:
             self.open()
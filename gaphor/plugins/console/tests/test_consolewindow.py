@@ -4,6 +4,7 @@ from gi.repository import GLib, Gtk
 import gaphor.services.componentregistry
 import gaphor.ui.menufragment
 from gaphor.core.modeling import ElementFactory
+from gaphor.plugins.console.actions import ConsoleWindowActions
 from gaphor.plugins.console.consolewindow import ConsoleWindow
 
 
@@ -29,13 +30,13 @@ def tools_menu():
     return gaphor.ui.menufragment.MenuFragment()
 
 
-def test_open_close(component_registry, main_window, tools_menu):
+def test_open_close(component_registry, main_window):
     def on_activate(app):
         def auto_close():
             window.close()
             app.quit()
 
-        window = ConsoleWindow(component_registry, main_window, tools_menu)
+        window = ConsoleWindow(component_registry, main_window)
         window.open()
         app.add_window(window)
 
@@ -47,4 +48,8 @@ def test_open_close(component_registry, main_window, tools_menu):
     app.connect("activate", on_activate)
     app.run()
 
+
+def test_actions_do_not_create_console_window(component_registry, tools_menu):
+    ConsoleWindowActions(component_registry, tools_menu)
+
     assert tools_menu.menu.get_n_items() == 1
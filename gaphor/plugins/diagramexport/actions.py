@@ -0,0 +1,87 @@
+"""Diagram export actions.
+
+Diagram export is a lazy service. Its actions are declared here, so
+export support is only loaded once a diagram is exported.
+"""
+
+from gaphor.abc import ActionProvider, Service
+from gaphor.action import action
+from gaphor.i18n import gettext
+
+
+class DiagramExportActions(Service, ActionProvider):
+    def __init__(self, component_registry, export_menu):
+        self.component_registry = component_registry
+        self.export_menu = export_menu
+        export_menu.add_actions(self)
+
+    def shutdown(self):
+        self.export_menu.remove_actions(self)
+
+    @property
+    def diagram_export(self):
+        return self.component_registry.get_service("diagram_export")
+
+    @action(
+        name="file-export-svg",
+        label=gettext("Export as SVG"),
+        tooltip=gettext("Export diagram as SVG"),
+    )
+    def save_svg_action(self):
+        self.diagram_export.save_svg_action()
+
+    @action(
+        name="file-export-png",
+        label=gettext("Export as PNG"),
+        tooltip=gettext("Export diagram as PNG"),
+    )
+    def save_png_action(self):
+        self.diagram_export.save_png_action()
+
+    @action(
+        name="file-export-pdf",
+        label=gettext("Export as PDF"),
+        tooltip=gettext("Export diagram as PDF"),
+    )
+    def save_pdf_action(self):
+        self.diagram_export.save_pdf_action()
+
+    @action(
+        name="file-export-eps",
+        label=gettext("Export as EPS"),
+        tooltip=gettext("Export diagram as Encapsulated PostScript"),
+    )
+    def save_eps_action(self):
+        self.diagram_export.save_eps_action()
+
+    @action(
+        name="all-export-svg",
+        label=gettext("Export all diagrams as SVG"),
+        tooltip=gettext("Export all diagrams as SVG diagrams in a specifieddirectory"),
+    )
+    def export_all_svg_action(self):
+        self.diagram_export.export_all_svg_action()
+
+    @action(
+        name="all-export-png",
+        label=gettext("Export all diagrams as PNG"),
+        tooltip=gettext("Export all diagrams as PNG diagrams in a specifieddirectory"),
+    )
+    def export_all_png_action(self):
+        self.diagram_export.export_all_png_action()
+
+    @action(
+        name="all-export-pdf",
+        label=gettext("Export all diagrams as PDF"),
+        tooltip=gettext("Export all diagrams as PDF diagrams in a specifieddirectory"),
+    )
+    def export_all_pdf_action(self):
+        self.diagram_export.export_all_pdf_action()
+
+    @action(
+        name="all-export-eps",
+        label=gettext("Export all diagrams as EPS"),
+        tooltip=gettext("Export all diagrams as EPS diagrams in a specifieddirectory"),
+    )
+    def export_all_eps_action(self):
+        self.diagram_export.export_all_eps_action()
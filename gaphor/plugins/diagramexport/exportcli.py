@@ -5,6 +5,7 @@ import logging
 import re
 
 from gaphor.application import Session
+from gaphor.core.tracing import mark
 from gaphor.diagram.export import save_eps, save_pdf, save_png, save_svg
 from gaphor.plugins.diagramexport.exportall import export_all
 from gaphor.storage import storage
@@ -65,7 +66,8 @@ def export_command(args):
     for model in args.model:
         log.debug("loading model %s", model)
         with open(model, encoding="utf-8") as file_obj:
-            storage.load(file_obj, factory, modeling_language)
+            storage.load(file_obj, factory, modeling_language, update_diagrams=False)
+        mark("startup.model_ready", model=str(model))
         log.debug("ready for rendering")
 
         out_fn = None
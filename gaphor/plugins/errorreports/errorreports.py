@@ -7,7 +7,6 @@ import textwrap
 import time
 from types import TracebackType
 
-import better_exceptions
 from gi.repository import Gtk
 
 from gaphor.abc import ActionProvider
@@ -16,9 +15,6 @@ from gaphor.core.eventmanager import event_handler
 from gaphor.event import Notification, SessionCreated
 from gaphor.i18n import gettext, translated_ui_string
 from gaphor.ui.abc import UIComponent
-from gaphor.ui.selftest import system_information
-
-better_exceptions.SUPPORTS_COLOR = False
 
 log = logging.getLogger(__name__)
 
@@ -84,6 +80,13 @@ class ErrorReports(UIComponent, ActionProvider):
         if not buffer:
             return
 
+        # Only needed once the report is shown; keep them off the start-up path.
+        import better_exceptions
+
+        from gaphor.ui.selftest import system_information
+
+        better_exceptions.SUPPORTS_COLOR = False
+
         buffer.delete(buffer.get_start_iter(), buffer.get_end_iter())
 
         buffer.insert(buffer.get_end_iter(), system_information())
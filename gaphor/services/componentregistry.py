@@ -6,6 +6,7 @@ from collections.abc import Iterator
 from typing import TypeVar
 
 from gaphor.abc import Service
+from gaphor.entrypoint import LazyService
 
 T = TypeVar("T", bound=Service)
 
@@ -16,10 +17,15 @@ class ComponentLookupError(LookupError):
 
 class ComponentRegistry(Service):
     """The ComponentRegistry provides a home for application wide
-    components."""
+    components.
+
+    Lazy services are created once they're looked up by name.
+    Until then they're left out when components are looked up by type.
+    """
 
     def __init__(self) -> None:
-        self._comp: list[tuple[str, object]] = []
+        self._comp: dict[str, list[object]] = {}
+        self._by_type: dict[type, list[tuple[str, object]]] = {}
 
     def shutdown(self) -> None:
         pass
@@ -32,13 +38,22 @@ class ComponentRegistry(Service):
         return self.get(Service, name)  # type: ignore[type-abstract] # noqa: F821
 
     def register(self, name: str, component: object) -> None:
-        self._comp.append((name, component))
+        self._comp.setdefault(name, []).append(component)
+        self._by_type.clear()
 
     def unregister(self, component: object) -> None:
-        self._comp = [(n, c) for n, c in self._comp if c is not component]
+        for name, components in list(self._comp.items()):
+            components[:] = [
+                c
+                for c in components
+                if c is not component and _resolved(c) is not component
+            ]
+            if not components:
+                del self._comp[name]
+        self._by_type.clear()
 
     def get(self, base: type[T], name: str) -> T:
-        found = [(n, c) for n, c in self._comp if isinstance(c, base) and n == name]
+        found = [c for c in self._resolve(name) if isinstance(c, base)]
         if len(found) > 1:
             raise ComponentLookupError(
                 f"More than one component matches {base}+{name}: {found}"
@@ -47,22 +62,46 @@ class ComponentRegistry(Service):
             raise ComponentLookupError(
                 f"Component with type {base} and name {name} is not registered"
             )
-        return found[0][1]
+        return found[0]
 
     def all(self, base: type[T]) -> Iterator[tuple[str, T]]:
-        return ((n, c) for n, c in self._comp if isinstance(c, base))
+        try:
+            candidates = self._by_type[base]
+        except KeyError:
+            candidates = self._by_type[base] = [
+                (n, c)
+                for n, components in self._comp.items()
+                for c in components
+                if isinstance(c, LazyService) or isinstance(c, base)
+            ]
+        return ((n, r) for n, c in candidates if isinstance(r := _resolved(c), base))
 
     def partial(self, func):
         """Return a new function with partial application of services."""
         kwargs = {}
 
         for param_name, _param in inspect.signature(func).parameters.items():
-            found = [(n, c) for n, c in self._comp if n == param_name]
+            found = self._resolve(param_name)
             if len(found) > 1:
                 raise ComponentLookupError(
                     f"More than one component matches {param_name}: {found}"
                 )
             if found:
-                kwargs[param_name] = found[0][1]
+                kwargs[param_name] = found[0]
 
         return functools.partial(func, **kwargs)
+
+    def _resolve(self, name: str) -> list[object]:
+        """Components named `name`, with lazy services created."""
+        components = self._comp.get(name, [])
+        for i, c in enumerate(components):
+            if isinstance(c, LazyService):
+                components[i] = c.resolve()
+        return components
+
+
+def _resolved(component: object) -> object:
+    """The component, or the created service of a lazy service (or ``None``)."""
+    if isinstance(component, LazyService):
+        return component.resolve() if component.resolved else None
+    return component
@@ -1,4 +1,7 @@
-from gaphor.services.componentregistry import ComponentRegistry
+import pytest
+
+from gaphor.entrypoint import LazyService
+from gaphor.services.componentregistry import ComponentLookupError, ComponentRegistry
 
 
 class Dependency:
@@ -31,3 +34,40 @@ def test_partial_service_application():
     subject = component_registry.partial(TestSubject)()
 
     assert subject.dependency is dependency
+
+
+def test_lazy_service_is_resolved_on_lookup():
+    component_registry = ComponentRegistry()
+    dependency = Dependency()
+    proxy = LazyService("dependency", lambda: Dependency, lambda _n, _c: dependency)
+    component_registry.register("dependency", proxy)
+
+    assert list(component_registry.all(Dependency)) == []
+    assert component_registry.get(Dependency, "dependency") is dependency
+    assert list(component_registry.all(Dependency)) == [("dependency", dependency)]
+
+
+def test_duplicate_components_are_detected():
+    component_registry = ComponentRegistry()
+    component_registry.register("dependency", Dependency())
+    component_registry.register("dependency", Dependency())
+
+    with pytest.raises(ComponentLookupError):
+        component_registry.get(Dependency, "dependency")
+
+
+def test_components_by_type_are_updated():
+    component_registry = ComponentRegistry()
+    dependency = Dependency()
+
+    assert list(component_registry.all(Dependency)) == []
+
+    component_registry.register("dependency", dependency)
+
+    assert list(component_registry.all(Dependency)) == [("dependency", dependency)]
+
+    component_registry.unregister(dependency)
+
+    assert list(component_registry.all(Dependency)) == []
+    with pytest.raises(ComponentLookupError):
+        component_registry.get(Dependency, "dependency")
@@ -45,6 +45,9 @@ class base:
         self.references: dict[str, str | list[str]] = {}
 
     def __getattr__(self, key):
+        if key.startswith("__"):
+            # Do not resolve special methods, e.g. when pickling
+            raise AttributeError(key)
         try:
             return self.__getitem__(key)
         except KeyError as e:
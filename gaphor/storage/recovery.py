@@ -130,10 +130,13 @@ class Recovery(Service):
         self.recorder.truncate()
 
     @event_handler(ModelReady)
-    def on_model_ready(self, _event):
+    def on_model_ready(self, event: ModelReady):
         if not self.event_log:
             return
 
+        if event.digest:
+            self.event_log.digest = event.digest
+
         events = []
         try:
             with Transaction(self.event_manager, context="recover"):
@@ -163,7 +166,9 @@ class Recovery(Service):
             self.event_log.clear()
 
         if event.filename:
-            self.event_log = EventLog(self.session_id, event.filename)
+            self.event_log = EventLog(
+                self.session_id, event.filename, digest=event.digest
+            )
             self.event_log.clear()
         else:
             self.event_log = None
@@ -179,10 +184,16 @@ class Recovery(Service):
 
 class EventLog:
     def __init__(
-        self, session_id: str, filename: Path | None, template: Path | None = None
+        self,
+        session_id: str,
+        filename: Path | None,
+        template: Path | None = None,
+        digest: str | None = None,
     ):
         self._filename = filename
         self._template = template
+        # SHA-256 digest of the model file (or template), as loaded or saved
+        self.digest = digest
         self._log_name = (sessions_dir() / session_id).with_suffix(".recovery")
 
         # The file that we use to save the events to:
@@ -217,7 +228,7 @@ class EventLog:
                 repr(
                     {
                         "path": str(filename.absolute()),
-                        "sha256": sha256sum(filename),
+                        "sha256": self._file_digest(filename),
                         "template": is_template,
                     }
                 )
@@ -243,7 +254,8 @@ class EventLog:
                 filename = (
                     self._template if preamble.get("template") else self._filename
                 )
-                if not filename or sha256sum(filename) != preamble.get("sha256"):
+                expected_digest = preamble.get("sha256")
+                if not filename or self._file_digest(filename) != expected_digest:
                     raise ChecksumFailed()
 
                 for line in f:
@@ -258,6 +270,11 @@ class EventLog:
             log.info("Recovery file hash does not match.")
             self.move_aside()
 
+    def _file_digest(self, filename: Path) -> str:
+        if self.digest and filename == (self._template or self._filename):
+            return self.digest
+        return sha256sum(filename)
+
     def close(self):
         if self._file:
             self._file.close()
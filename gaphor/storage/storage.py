@@ -6,16 +6,21 @@ file. `save(file_obj)` stores the current model in a file.
 
 __all__ = ["load", "save"]
 
+import hashlib
 import io
 import logging
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from functools import partial
+from pathlib import Path
+from typing import Literal
 
 from gaphor import application
 from gaphor.core.modeling import Base, Diagram, ElementFactory, Presentation
 from gaphor.core.modeling.collection import collection
 from gaphor.core.modeling.modelinglanguage import ModelingLanguage
 from gaphor.core.modeling.stylesheet import StyleSheet
+from gaphor.core.tracing import span
 from gaphor.storage.parser import GaphorLoader, element, parse_generator
 from gaphor.storage.xmlwriter import XMLWriter
 
@@ -36,6 +41,11 @@ def save_generator(out, element_factory: ElementFactory):
     """Save the current model using @writer, which is a
     gaphor.storage.xmlwriter.XMLWriter instance."""
 
+    with span("save", elements=element_factory.size()):
+        yield from _save_elements(out, element_factory)
+
+
+def _save_elements(out, element_factory: ElementFactory):
     with XMLWriter(out).document() as writer:
         writer.prefix_mapping("", MODEL_NS)
         for ml in sorted({e.__modeling_language__ for e in element_factory}):
@@ -115,9 +125,15 @@ def save_element(name, value, element_factory, writer):
         save_value(name, value)
 
 
-def load_elements(elements, element_factory, modeling_language, gaphor_version="1.0.0"):
+def load_elements(
+    elements,
+    element_factory,
+    modeling_language,
+    gaphor_version="1.0.0",
+    update_diagrams=True,
+):
     for _ in load_elements_generator(
-        elements, element_factory, modeling_language, gaphor_version
+        elements, element_factory, modeling_language, gaphor_version, update_diagrams
     ):
         pass
 
@@ -127,9 +143,13 @@ def load_elements_generator(
     element_factory: ElementFactory,
     modeling_language: ModelingLanguage,
     gaphor_version: str,
+    update_diagrams: bool = True,
 ) -> Iterable[float]:
     """Load a file and create a model if possible.
 
+    If ``update_diagrams`` is ``False``, diagrams are only scheduled for
+    an update. The update is performed once the diagram is needed.
+
     Exceptions: IOError, ValueError.
     """
     log.debug(f"Loading {len(elements)} elements")
@@ -148,31 +168,42 @@ def load_elements_generator(
 
     # First create elements and canvas items in the factory
     # The elements are stored as attribute 'element' on the parser objects:
-    yield from _load_elements_and_canvasitems(
-        elements,
-        element_factory,
-        modeling_language,
-        gaphor_version,
-        update_status_queue,
-        homeless_literals,
-    )
-    if version_lower_than(gaphor_version, (3, 1, 0)):
-        upgrade_package_package_to_nesting_package(elements)
-        upgrade_parameter_owned_node_to_activity_parameter_node(elements)
-
-    yield from _load_attributes_and_references(elements, update_status_queue)
-
-    upgrade_ensure_style_sheet_is_present(element_factory)
-    if version_lower_than(gaphor_version, (2, 28, 0)):
-        upgrade_dependency_owning_package(element_factory, modeling_language)
+    with span("load.create_elements", elements=len(elements)):
+        yield from _load_elements_and_canvasitems(
+            elements,
+            element_factory,
+            modeling_language,
+            gaphor_version,
+            update_status_queue,
+            homeless_literals,
+        )
+    with span("load.upgrade"):
+        if version_lower_than(gaphor_version, (3, 1, 0)):
+            upgrade_package_package_to_nesting_package(elements)
+            upgrade_parameter_owned_node_to_activity_parameter_node(elements)
 
-    for _id, elem in list(elements.items()):
-        yield from update_status_queue()
-        assert elem.element
-        elem.element.postload()
+    with span("load.attributes_and_references", elements=len(elements)):
+        yield from _load_attributes_and_references(elements, update_status_queue)
 
-    for diagram in element_factory.select(Diagram):
-        diagram.update()
+    with span("load.upgrade"):
+        upgrade_ensure_style_sheet_is_present(element_factory)
+        if version_lower_than(gaphor_version, (2, 28, 0)):
+            upgrade_dependency_owning_package(element_factory, modeling_language)
+
+    with span("load.postload", elements=len(elements)):
+        for _id, elem in list(elements.items()):
+            yield from update_status_queue()
+            assert elem.element
+            elem.element.postload()
+
+    with span("load.diagram_update", deferred=not update_diagrams) as info:
+        diagrams = element_factory.lselect(Diagram)
+        info["diagrams"] = len(diagrams)
+        for diagram in diagrams:
+            if update_diagrams:
+                diagram.update()
+            else:
+                diagram.request_update_all()
 
     house_homeless_literals(
         element_factory, homeless_literals, elements, modeling_language
@@ -277,14 +308,20 @@ def _load_attributes_and_references(elements, update_status_queue):
 
 
 def load(
-    file_obj: io.TextIOBase, element_factory, modeling_language, status_queue=None
+    file_obj: io.TextIOBase,
+    element_factory,
+    modeling_language,
+    status_queue=None,
+    update_diagrams=True,
 ):
     """Load a file and create a model if possible.
 
     Optionally, a status queue function can be given, to which the
     progress is written (as status_queue(progress)).
     """
-    for status in load_generator(file_obj, element_factory, modeling_language):
+    for status in load_generator(
+        file_obj, element_factory, modeling_language, update_diagrams
+    ):
         if status_queue:
             status_queue(status)
 
@@ -293,36 +330,43 @@ def load_generator(
     file_obj: io.TextIOBase,
     element_factory: ElementFactory,
     modeling_language: ModelingLanguage,
+    update_diagrams: bool = True,
 ) -> Iterable[int]:
     """Load a file and create a model if possible.
 
     This function is a generator. It will yield values from 0 to 100 (%)
     to indicate its progression.
+
+    If ``update_diagrams`` is ``False``, diagrams are updated once they're
+    needed, e.g. when opened or exported.
     """
     assert isinstance(file_obj, io.TextIOBase)
 
     # Use the incremental parser and yield the percentage of the file.
     loader = GaphorLoader()
-    for percentage in parse_generator(file_obj, loader):
-        if percentage:
-            yield percentage / 2
-        else:
-            yield percentage
+    with span("load.parse") as info:
+        for percentage in parse_generator(file_obj, loader):
+            if percentage:
+                yield percentage / 2
+            else:
+                yield percentage
+        info["elements"] = len(loader.elements)
 
     elements = loader.elements
     gaphor_version = loader.gaphor_version
-
-    if version_lower_than(gaphor_version, (0, 17, 0)):
-        raise ValueError(
-            f"Gaphor model version should be at least 0.17.0 (found {gaphor_version})"
-        )
+    check_version(gaphor_version)
 
     log.info(f"Read {len(elements)} elements from file")
 
-    element_factory.flush()
+    with span("load.flush", elements=element_factory.size()):
+        element_factory.flush()
     with element_factory.block_events():
         for percentage in load_elements_generator(
-            elements, element_factory, modeling_language, gaphor_version
+            elements,
+            element_factory,
+            modeling_language,
+            gaphor_version,
+            update_diagrams,
         ):
             if percentage:
                 yield percentage / 2 + 50
@@ -332,6 +376,109 @@ def load_generator(
     yield 100
 
 
+def parse_file(filename: str | Path) -> tuple[dict[str, element], str]:
+    """Parse a model file, without creating a model.
+
+    Returns the parsed elements and the Gaphor version the model was
+    saved with. Parsed elements can be pickled, hence a file can be
+    parsed in a separate process. Use :func:`load_elements` to create
+    the model.
+    """
+    loader = GaphorLoader()
+    with open(filename, encoding="utf-8", errors="replace") as file_obj:
+        with span("load.parse") as info:
+            for _ in parse_generator(file_obj, loader):
+                pass
+            info["elements"] = len(loader.elements)
+
+    check_version(loader.gaphor_version)
+    return loader.elements, loader.gaphor_version
+
+
+def element_digests(
+    elements: dict[str, element], gaphor_version: str
+) -> dict[str, bytes]:
+    """Compute a digest of each parsed element.
+
+    Elements with the same digest in two parsed models have the same
+    type, values and references. Digests should be computed before the
+    elements are loaded, since loading can upgrade elements.
+    """
+    return {
+        id: hashlib.blake2b(
+            repr((gaphor_version, e.type, e.values, e.references)).encode(),
+            digest_size=16,
+        ).digest()
+        for id, e in elements.items()
+    }
+
+
+class DigestFile(io.RawIOBase):
+    """Compute the SHA-256 digest of the data read from, or written to, a file."""
+
+    def __init__(self, raw):
+        super().__init__()
+        self._raw = raw
+        self._hash = hashlib.sha256()
+
+    def readable(self):
+        return self._raw.readable()
+
+    def writable(self):
+        return self._raw.writable()
+
+    def readinto(self, b):
+        n = self._raw.readinto(b)
+        if n:
+            self._hash.update(memoryview(b)[:n])
+        return n
+
+    def write(self, b):
+        n = self._raw.write(b)
+        if n:
+            self._hash.update(memoryview(b)[:n])
+        return n
+
+    def read_remaining(self) -> None:
+        while data := self._raw.read(io.DEFAULT_BUFFER_SIZE):
+            self._hash.update(data)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+@contextmanager
+def open_model(
+    filename: str | Path, mode: Literal["r", "w"] = "r"
+) -> Iterator[tuple[io.TextIOWrapper, DigestFile]]:
+    """Open a model file for loading or saving.
+
+    The SHA-256 digest of the file is computed while the model is read or
+    written. It is available from the :obj:`DigestFile` once the file is
+    closed.
+    """
+    with open(filename, f"{mode}b", buffering=0) as raw:
+        digest = DigestFile(raw)
+        text = io.TextIOWrapper(
+            io.BufferedReader(digest) if mode == "r" else io.BufferedWriter(digest),
+            encoding="utf-8",
+            errors="replace" if mode == "r" else "strict",
+        )
+        try:
+            yield text, digest
+            if mode == "r":
+                digest.read_remaining()
+        finally:
+            text.close()
+
+
+def check_version(gaphor_version):
+    if version_lower_than(gaphor_version, (0, 17, 0)):
+        raise ValueError(
+            f"Gaphor model version should be at least 0.17.0 (found {gaphor_version})"
+        )
+
+
 def version_lower_than(gaphor_version, version):
     """Only major and minor versions are checked.
 
@@ -44,6 +44,16 @@ def test_should_not_read_if_file_changed(event_log, test_file):
     assert ["my", "line"] not in lines
 
 
+def test_read_event_log_with_known_digest(test_file, monkeypatch):
+    event_log = EventLog("_", test_file, digest=sha256sum(test_file))
+    monkeypatch.setattr("gaphor.storage.recovery.sha256sum", None)
+
+    event_log.write(["my", "line"])
+    lines = list(event_log.read())
+
+    assert ["my", "line"] in lines
+
+
 def test_clear_event_log(event_log):
     event_log.write(["my", "line"])
 
@@ -1,5 +1,7 @@
 """Unittest the storage and parser modules."""
 
+import hashlib
+import pickle
 import re
 from io import StringIO
 
@@ -249,6 +251,70 @@ def test_load_and_save_of_a_model(element_factory, modeling_language, test_model
     assert copy == orig, "Saved model does not match copy"
 
 
+def test_load_with_deferred_diagram_update(
+    element_factory, modeling_language, test_models
+):
+    path = test_models / "simple-items.gaphor"
+
+    with open(path, encoding="utf-8") as ifile:
+        storage.load(
+            ifile,
+            element_factory=element_factory,
+            modeling_language=modeling_language,
+            update_diagrams=False,
+        )
+
+    diagram = next(element_factory.select(Diagram))
+
+    assert diagram.update_pending
+
+    diagram.update()
+
+    assert not diagram.update_pending
+
+
+def test_load_parsed_file_from_pickle(element_factory, modeling_language, test_models):
+    path = test_models / "simple-items.gaphor"
+
+    elements, gaphor_version = pickle.loads(pickle.dumps(storage.parse_file(path)))
+    with element_factory.block_events():
+        storage.load_elements(
+            elements, element_factory, modeling_language, gaphor_version
+        )
+
+    pf = PseudoFile()
+    storage.save(pf, element_factory=element_factory)
+
+    expr = re.compile('gaphor-version="[^"]*"')
+    assert expr.sub("%VER%", pf.data) == expr.sub(
+        "%VER%", path.read_text(encoding="utf-8")
+    )
+
+
+def test_element_digests_of_same_file_are_equal(test_models):
+    path = test_models / "simple-items.gaphor"
+
+    digests = storage.element_digests(*storage.parse_file(path))
+
+    assert digests == storage.element_digests(*storage.parse_file(path))
+    assert digests != storage.element_digests(storage.parse_file(path)[0], "0.1")
+
+
+def test_digest_is_computed_while_loading_and_saving(
+    element_factory, modeling_language, test_models, tmp_path
+):
+    path = test_models / "simple-items.gaphor"
+    saved = tmp_path / "saved.gaphor"
+
+    with storage.open_model(path) as (file_obj, load_digest):
+        storage.load(file_obj, element_factory, modeling_language)
+    with storage.open_model(saved, "w") as (out, save_digest):
+        storage.save(out, element_factory=element_factory)
+
+    assert load_digest.hexdigest() == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert save_digest.hexdigest() == hashlib.sha256(saved.read_bytes()).hexdigest()
+
+
 def test_can_not_load_models_older_that_0_17_0(
     element_factory, modeling_language, test_models
 ):
@@ -1,4 +1,4 @@
-from gaphor.entrypoint import init_entry_points
+from gaphor.entrypoint import LazyService, init_entry_points, resolve_service
 
 
 class ServiceA:
@@ -48,3 +48,50 @@ def test_load_multi_dependent_service():
     assert isinstance(initialized["service_c"], ServiceC)
     assert initialized["service_a"] is initialized["service_c"].service_a
     assert initialized["service_b"] is initialized["service_c"].service_b
+
+
+def test_lazy_service_is_not_created_up_front():
+    initialized = init_entry_points({}, {"service_a": lambda: ServiceA})
+
+    assert isinstance(initialized["service_a"], LazyService)
+    assert not initialized["service_a"].resolved
+
+
+def test_lazy_service_is_created_on_first_use():
+    initialized = init_entry_points({}, {"service_a": lambda: ServiceA})
+    proxy = initialized["service_a"]
+
+    service = resolve_service(proxy)
+
+    assert isinstance(service, ServiceA)
+    assert resolve_service(proxy) is service
+    assert initialized["service_a"] is service
+
+
+def test_lazy_service_is_created_as_dependency():
+    initialized = init_entry_points(
+        {"service_b": ServiceB}, {"service_a": lambda: ServiceA}
+    )
+
+    assert isinstance(initialized["service_b"].service_a, ServiceA)
+    assert initialized["service_a"] is initialized["service_b"].service_a
+
+
+def test_lazy_service_with_dependencies():
+    initialized = init_entry_points(
+        {"service_a": ServiceA}, {"service_b": lambda: ServiceB}
+    )
+
+    service_b = resolve_service(initialized["service_b"])
+
+    assert service_b.service_a is initialized["service_a"]
+
+
+def test_lazy_service_notifies_when_created():
+    initialized = init_entry_points({}, {"service_a": lambda: ServiceA})
+    created = []
+    initialized["service_a"].on_resolve(lambda name, srv: created.append((name, srv)))
+
+    service = resolve_service(initialized["service_a"])
+
+    assert created == [("service_a", service)]
@@ -1,3 +1,4 @@
+from gaphor import i18n
 from gaphor.i18n import translated_ui_string
 
 
@@ -5,3 +6,30 @@ def test_ui_builder_builds_from_resources():
     ui_xml = translated_ui_string("gaphor.diagram", "propertypages.ui")
 
     assert "translatable=" not in ui_xml
+
+
+def test_translated_ui_string_is_cached():
+    ui_xml = translated_ui_string("gaphor.diagram", "propertypages.ui")
+
+    assert translated_ui_string("gaphor.diagram", "propertypages.ui") is ui_xml
+
+
+def test_translated_ui_string_is_translated_again_for_new_language(monkeypatch):
+    class Translation:
+        def __init__(self, lang):
+            self.lang = lang
+
+        def gettext(self, message):
+            return f"{self.lang}: {message}"
+
+    monkeypatch.setattr(i18n, "translation", Translation)
+    monkeypatch.setattr(i18n, "_language", i18n._language)  # noqa: SLF001
+    monkeypatch.setattr(i18n, "gettext", i18n.gettext)
+
+    i18n.set_language("nl")
+    dutch = translated_ui_string("gaphor.diagram", "propertypages.ui")
+    i18n.set_language("de")
+    german = translated_ui_string("gaphor.diagram", "propertypages.ui")
+
+    assert "nl: " in dutch
+    assert "de: " in german
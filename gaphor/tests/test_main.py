@@ -59,3 +59,13 @@ def test_run_script(capsys):
     main([APP_NAME, "exec", str(run_script)])
 
     assert "Running a test script for Gaphor" in capsys.readouterr().out
+
+
+def test_trace(tmp_path):
+    run_script = Path(__file__).parent / "run_script.py"
+    trace_file = tmp_path / "trace.json"
+
+    exit_code = main([APP_NAME, "exec", "--trace", str(trace_file), str(run_script)])
+
+    assert exit_code == 0
+    assert "traceEvents" in trace_file.read_text(encoding="utf-8")
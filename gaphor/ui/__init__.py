@@ -6,6 +6,8 @@ and diagram windows."""
 from __future__ import annotations
 
 import sys
+from collections.abc import Callable
+from typing import Protocol
 
 import gi
 
@@ -21,6 +23,8 @@ import gaphor.ui.diagramview  # noqa: F401
 import gaphor.ui.textfield  # noqa: F401
 from gaphor.application import Application, Session
 from gaphor.core import event_handler
+from gaphor.core.modeling import ModelReady
+from gaphor.core.tracing import mark
 from gaphor.event import ActiveSessionChanged, ApplicationShutdown, SessionCreated
 from gaphor.settings import APPLICATION_ID, StyleVariant, settings
 from gaphor.storage.recovery import all_sessions
@@ -30,18 +34,43 @@ Adw.init()
 GtkSource.init()
 
 
-def run(argv: list[str], *, launch_service="greeter", recover=False) -> int:
+class LaunchService(Protocol):
+    def init(self, gtk_app) -> None: ...
+
+    def open(self) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+def run(
+    argv: list[str],
+    *,
+    launch_service: str | Callable[[Application], LaunchService] = "greeter",
+    recover=False,
+) -> int:
+    """Run the Gaphor GUI.
+
+    ``launch_service`` is the name of an application service, or a
+    factory that creates the launch service for the application.
+    """
     application: Application | None = None
+    launcher: LaunchService | None = None
 
     def app_startup(gtk_app):
-        nonlocal application
+        nonlocal application, launcher
 
         @event_handler(SessionCreated)
         def on_session_created(event: SessionCreated):
             event_manager = event.session.get_service("event_manager")
             event_manager.subscribe(on_session_changed)
+            event_manager.subscribe(on_model_ready)
             main_window = event.session.get_service("main_window")
             main_window.open(gtk_app)
+            mark("startup.window")
+
+        @event_handler(ModelReady)
+        def on_model_ready(event: ModelReady):
+            mark("startup.model_ready", model=str(event.filename or ""))
 
         @event_handler(ActiveSessionChanged)
         def on_session_changed(event: ActiveSessionChanged):
@@ -52,6 +81,8 @@ def run(argv: list[str], *, launch_service="greeter", recover=False) -> int:
 
         @event_handler(ApplicationShutdown)
         def on_quit(_event: ApplicationShutdown):
+            if launcher and not isinstance(launch_service, str):
+                launcher.shutdown()
             gtk_app.quit()
 
         try:
@@ -60,7 +91,12 @@ def run(argv: list[str], *, launch_service="greeter", recover=False) -> int:
             event_manager = application.get_service("event_manager")
             event_manager.subscribe(on_session_created)
             event_manager.subscribe(on_quit)
-            application.get_service(launch_service).init(gtk_app)
+            launcher = (
+                application.get_service(launch_service)
+                if isinstance(launch_service, str)
+                else launch_service(application)
+            )
+            launcher.init(gtk_app)
             if recover:
                 recover_sessions(application)
         except Exception:
@@ -70,8 +106,9 @@ def run(argv: list[str], *, launch_service="greeter", recover=False) -> int:
 
     def app_activate(gtk_app):
         assert application
+        assert launcher
         if not application.sessions:
-            application.get_service(launch_service).open()
+            launcher.open()
 
     def app_open(gtk_app, files, n_files, hint):
         # appfilemanager should take care of this:
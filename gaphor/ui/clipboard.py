@@ -2,29 +2,39 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Collection
 
-from gi.repository import Gdk, GLib, GObject
+from gi.repository import Gdk, Gio, GLib
 
 from gaphor.core import Transaction
 from gaphor.core.modeling import Presentation
-from gaphor.diagram.copypaste import copy_full, paste_full, paste_link
+from gaphor.diagram.copypaste import (
+    copy_full,
+    decode_copy_data,
+    encode_copy_data,
+    paste_full,
+    paste_link,
+)
 
+log = logging.getLogger(__name__)
 
-class CopyBuffer(GObject.Object):
-    def __init__(self, buffer):
-        super().__init__()
-        self.buffer = buffer
-
-    buffer = GObject.Property(type=object)
+COPY_BUFFER_MIME_TYPE = "application/x-gaphor-copy-buffer"
 
 
 class Clipboard:
-    """Copy/Cut/Paste functionality for diagrams."""
+    """Copy/Cut/Paste functionality for diagrams.
+
+    The copy buffer is put on the clipboard as bytes, so it can be
+    pasted in other sessions and other Gaphor instances.
+    """
 
-    def __init__(self, event_manager, element_factory, clipboard=None):
+    def __init__(
+        self, event_manager, element_factory, modeling_language, clipboard=None
+    ):
         self.event_manager = event_manager
         self.element_factory = element_factory
+        self.modeling_language = modeling_language
 
         self.clipboard = clipboard or Gdk.Display.get_default().get_clipboard()
 
@@ -52,23 +62,45 @@ class Clipboard:
     def _copy(self, items: Collection[Presentation]) -> None:
         if items:
             copy_buffer = copy_full(items, self.element_factory.lookup)
-            v = GObject.Value(CopyBuffer.__gtype__, CopyBuffer(buffer=copy_buffer))
-            self.clipboard.set_content(Gdk.ContentProvider.new_for_value(v))
+            data = GLib.Bytes.new(encode_copy_data(copy_buffer))
+            self.clipboard.set_content(
+                Gdk.ContentProvider.new_for_bytes(COPY_BUFFER_MIME_TYPE, data)
+            )
 
     def _paste(self, view, paster):
         diagram = view.model
 
-        def on_paste(_source_object, result):
+        def on_read(_source_object, result):
             try:
-                copy_buffer = self.clipboard.read_value_finish(result)
+                stream, _mime_type = self.clipboard.read_finish(result)
             except GLib.GError as e:
                 if str(e).startswith("g-io-error-quark:"):
                     return
                 raise
 
+            output = Gio.MemoryOutputStream.new_resizable()
+            output.splice_async(
+                stream,
+                Gio.OutputStreamSpliceFlags.CLOSE_SOURCE
+                | Gio.OutputStreamSpliceFlags.CLOSE_TARGET,
+                GLib.PRIORITY_DEFAULT,
+                None,
+                on_spliced,
+            )
+
+        def on_spliced(output, result):
+            output.splice_finish(result)
+            try:
+                copy_buffer = decode_copy_data(
+                    output.steal_as_bytes().get_data(), self.modeling_language
+                )
+            except ValueError:
+                log.warning("Clipboard content can not be pasted", exc_info=True)
+                return
+
             with Transaction(self.event_manager):
                 # Create new id's that have to be used to create the items:
-                new_items = paster(copy_buffer.buffer, diagram)
+                new_items = paster(copy_buffer, diagram)
 
                 # move pasted items a bit, so user can see result of his action :)
                 for item in new_items:
@@ -79,9 +111,9 @@ class Clipboard:
             selection.unselect_all()
             selection.select_items(*new_items)
 
-        self.clipboard.read_value_async(
-            CopyBuffer.__gtype__,
+        self.clipboard.read_async(
+            [COPY_BUFFER_MIME_TYPE],
             io_priority=GLib.PRIORITY_DEFAULT,
             cancellable=None,
-            callback=on_paste,
+            callback=on_read,
         )
@@ -103,7 +103,7 @@ class DiagramPage:
         self.event_manager = event_manager
         self.diagram = diagram
         self.modeling_language = modeling_language
-        self.clipboard = Clipboard(event_manager, element_factory)
+        self.clipboard = Clipboard(event_manager, element_factory, modeling_language)
         self.style_manager = Adw.StyleManager.get_default()
 
         self.view: GtkView | None = None
@@ -302,7 +302,7 @@ class DiagramPage:
         )
 
         view = self.view
-        item_painter = ItemPainter(view.selection, dark_mode)
+        item_painter = ItemPainter(view.selection, dark_mode, cache=True)
 
         if sloppiness := style.get("line-style", 0.0):
             item_painter = FreeHandPainter(item_painter, sloppiness=sloppiness)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 
 from generic.event import Event
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 from gaphor.abc import ActionProvider
 from gaphor.core import action, event_handler
@@ -48,6 +48,7 @@ class Diagrams(UIComponent, ActionProvider):
         self.toolbox = toolbox
         self._notebook: Gtk.Widget = None
         self._page_handler_ids: list[int] = []
+        self._deferred_update_id = 0
 
     def open(self):
         """Open the diagrams component."""
@@ -83,6 +84,7 @@ class Diagrams(UIComponent, ActionProvider):
 
     def close(self):
         """Close the diagrams component."""
+        self._cancel_deferred_updates()
         self.event_manager.unsubscribe(self._on_model_ready)
         self.event_manager.unsubscribe(self._on_flush_model)
         self.event_manager.unsubscribe(self._on_name_change)
@@ -123,6 +125,7 @@ class Diagrams(UIComponent, ActionProvider):
         return selected and selected.get_child().diagram_page.get_view()
 
     def create_diagram_page(self, diagram: Diagram) -> DiagramPage:
+        self._update_deferred_diagram(diagram)
         page = DiagramPage(
             diagram,
             self.event_manager,
@@ -393,9 +396,42 @@ class Diagrams(UIComponent, ActionProvider):
         if self._notebook and self._notebook.get_n_pages():
             self._notebook.set_selected_page(self._notebook.get_nth_page(0))
 
+        self._schedule_deferred_updates()
+
+    def _update_deferred_diagram(self, diagram: Diagram) -> None:
+        """Perform the update of a diagram that was deferred after loading."""
+        if diagram.update_pending and not Transaction.in_transaction():
+            with self.element_factory.block_events():
+                diagram.update()
+
+    def _schedule_deferred_updates(self) -> None:
+        """Update diagrams that are not opened in the background."""
+        self._cancel_deferred_updates()
+        diagrams = iter(self.element_factory.lselect(Diagram))
+
+        def update_next_diagram():
+            if Transaction.in_transaction():
+                return GLib.SOURCE_CONTINUE
+            for diagram in diagrams:
+                if diagram.update_pending and diagram in self.element_factory:
+                    self._update_deferred_diagram(diagram)
+                    return GLib.SOURCE_CONTINUE
+            self._deferred_update_id = 0
+            return GLib.SOURCE_REMOVE
+
+        self._deferred_update_id = GLib.idle_add(
+            update_next_diagram, priority=GLib.PRIORITY_LOW
+        )
+
+    def _cancel_deferred_updates(self) -> None:
+        if self._deferred_update_id:
+            GLib.source_remove(self._deferred_update_id)
+            self._deferred_update_id = 0
+
     @event_handler(ModelFlushed)
     def _on_flush_model(self, event):
         """Close all tabs."""
+        self._cancel_deferred_updates()
         for page in self._notebook.get_pages():
             if page:
                 self._notebook.close_page(page)
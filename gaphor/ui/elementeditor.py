@@ -20,7 +20,11 @@ from gaphor.core.modeling.event import (
 )
 from gaphor.core.styling import StyleNode
 from gaphor.diagram.event import DiagramSelectionChanged
-from gaphor.diagram.propertypages import PropertyPages, new_resource_builder
+from gaphor.diagram.propertypages import (
+    PropertyPageBase,
+    PropertyPages,
+    new_resource_builder,
+)
 from gaphor.i18n import gettext, localedir
 from gaphor.ui.abc import UIComponent
 from gaphor.ui.csscompletion import (
@@ -153,6 +157,7 @@ class EditorStack:
 
         self.vbox: Gtk.Box | None = None
         self._current_item = None
+        self._pages: dict[tuple[int, str], tuple[PropertyPageBase, Gtk.Widget]] = {}
 
     def open(self, builder):
         """Display the ElementEditor pane."""
@@ -172,40 +177,69 @@ class EditorStack:
 
         self.vbox = None
         self._current_item = None
+        self._pages = {}
 
-    def _get_adapters(self, item):
-        """Return an ordered list of (order, name, adapter)."""
+    def _page_types(self, item):
+        """Return an ordered list of ((order, name), (page type, subject))."""
         page_map = {}
-        partial = self.component_registry.partial
 
         if isinstance(item, Presentation) and item.subject:
             for page in PropertyPages.find(item.subject):
-                page_map[(page.order, page.__name__)] = partial(page)(item.subject)
+                page_map[(page.order, page.__name__)] = (page, item.subject)
 
         for page in PropertyPages.find(item):
-            page_map[(page.order, page.__name__)] = partial(page)(item)
+            page_map[(page.order, page.__name__)] = (page, item)
 
         return sorted(page_map.items())
 
+    def _construct_page(self, key, page_type, subject):
+        try:
+            page = self.component_registry.partial(page_type)(subject)
+            if widget := page.construct():
+                return page, widget
+        except Exception:
+            log.error("Could not construct property page for %s", key[1], exc_info=True)
+        return None
+
     def create_pages(self, item):
         """Load all tabs that can operate on the given item."""
         assert self.vbox
-        adapters = self._get_adapters(item)
 
-        for (_, name), adapter in adapters:
-            try:
-                page = adapter.construct()
-                if not page:
+        for key, (page_type, subject) in self._page_types(item):
+            if constructed := self._construct_page(key, page_type, subject):
+                self.vbox.append(constructed[1])
+                self._pages[key] = constructed
+
+    def update_pages(self, item):
+        """Show the tabs for the given item, reusing the tabs shown now.
+
+        Tabs of the same type are rebound to the new item. Only tabs
+        that can not be rebound are replaced.
+        """
+        assert self.vbox
+        old_pages = self._pages
+        self._pages = {}
+        previous = None
+
+        for key, (page_type, subject) in self._page_types(item):
+            page, widget = old_pages.pop(key, (None, None))
+            if not (type(page) is page_type and page.rebind(subject)):
+                if widget:
+                    self.vbox.remove(widget)
+                if not (constructed := self._construct_page(key, page_type, subject)):
                     continue
-                self.vbox.append(page)
-            except Exception:
-                log.error(
-                    "Could not construct property page for %s", name, exc_info=True
-                )
+                page, widget = constructed
+                self.vbox.insert_child_after(widget, previous)
+            self._pages[key] = (page, widget)
+            previous = widget
+
+        for _, widget in old_pages.values():
+            self.vbox.remove(widget)
 
     def clear_pages(self):
         """Remove all tabs from the notebook."""
         assert self.vbox
+        self._pages = {}
         while page := self.vbox.get_first_child():
             self.vbox.remove(page)
 
@@ -219,11 +253,13 @@ class EditorStack:
             return
 
         self._current_item = item
-        self.clear_pages()
 
         if item:
-            self.create_pages(item)
+            if not self._pages:
+                self.clear_pages()
+            self.update_pages(item)
         else:
+            self.clear_pages()
             self.show_no_item_selected()
 
     @event_handler(DiagramSelectionChanged)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import multiprocessing
 import tempfile
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from pathlib import Path
 
@@ -14,7 +17,7 @@ from gaphor.abc import ActionProvider, Service
 from gaphor._asyncio import TaskOwner, response_from_adwaita_dialog, sleep
 from gaphor._babel import translate_model
 from gaphor.core import action, event_handler, gettext
-from gaphor.core.changeset.compare import compare
+from gaphor.core.changeset.compare import compare, unchanged_elements
 from gaphor.core.modeling import ElementFactory, ModelReady
 from gaphor.event import (
     ModelSaved,
@@ -25,7 +28,7 @@ from gaphor.event import (
 )
 from gaphor.storage import storage
 from gaphor.storage.mergeconflict import split_ours_and_theirs
-from gaphor.storage.parser import MergeConflictDetected
+from gaphor.storage.parser import MergeConflictDetected, element
 from gaphor.ui.errordialog import error_dialog
 from gaphor.ui.filedialog import GAPHOR_FILTER, save_file_dialog
 from gaphor.ui.statuswindow import StatusWindow
@@ -120,10 +123,10 @@ class FileManager(Service, ActionProvider, TaskOwner):
         )
 
         try:
-            await self._load_async(filename, status_window.progress)
+            digest = await self._load_async(filename, status_window.progress)
         finally:
             status_window.done()
-        self.event_manager.handle(ModelReady(self, filename=filename))
+        self.event_manager.handle(ModelReady(self, filename=filename, digest=digest))
 
     @action("file-reload")
     def reload(self):
@@ -148,28 +151,44 @@ class FileManager(Service, ActionProvider, TaskOwner):
             parent=self.parent_window,
         )
 
-        def progress(percentage, completed=0):
-            status_window.progress(completed + percentage / 3)
+        def progress(percentage, completed=0, share=50):
+            status_window.progress(completed + percentage * share / 100)
 
+        loop = asyncio.get_running_loop()
         try:
-            log.debug("Loading current model from %s", current_filename)
-            await self._load_async(current_filename, progress)
-
-            log.debug("Loading ancestor model from %s", ancestor_filename)
-            ancestor_element_factory = ElementFactory()
-            await self._load_async(
-                ancestor_filename,
-                partial(progress, completed=33),
-                element_factory=ancestor_element_factory,
-            )
+            # Ancestor and incoming model are parsed in worker processes,
+            # while the current model is loaded. Workers are spawned: forking
+            # a process that runs GLib threads can deadlock the child.
+            with ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                log.debug("Parsing ancestor model from %s", ancestor_filename)
+                ancestor_parsed = loop.run_in_executor(
+                    executor, storage.parse_file, ancestor_filename
+                )
+                log.debug("Parsing incoming model from %s", incoming_filename)
+                incoming_parsed = loop.run_in_executor(
+                    executor, storage.parse_file, incoming_filename
+                )
 
-            log.debug("Loading incoming model from %s", incoming_filename)
-            incoming_element_factory = ElementFactory()
-            await self._load_async(
-                incoming_filename,
-                partial(progress, completed=66),
-                element_factory=incoming_element_factory,
-            )
+                log.debug("Loading current model from %s", current_filename)
+                await self._load_async(current_filename, progress)
+
+                ancestor_element_factory = ElementFactory()
+                ancestor_digests = await self._load_parsed_async(
+                    ancestor_filename,
+                    ancestor_parsed,
+                    ancestor_element_factory,
+                    partial(progress, completed=50, share=25),
+                )
+
+                incoming_element_factory = ElementFactory()
+                incoming_digests = await self._load_parsed_async(
+                    incoming_filename,
+                    incoming_parsed,
+                    incoming_element_factory,
+                    partial(progress, completed=75, share=25),
+                )
 
             log.debug("Comparing models")
             with self.element_factory.block_events():
@@ -178,6 +197,7 @@ class FileManager(Service, ActionProvider, TaskOwner):
                         self.element_factory,
                         ancestor_element_factory,
                         incoming_element_factory,
+                        unchanged_elements(ancestor_digests, incoming_digests),
                     )
                 )
         finally:
@@ -188,33 +208,73 @@ class FileManager(Service, ActionProvider, TaskOwner):
         filename: Path,
         progress: Callable[[int], None] | None = None,
         element_factory=None,
-    ):
+    ) -> str | None:
+        """Load a model file.
+
+        Returns the SHA-256 digest of the file, if loading succeeded.
+        """
         factory = element_factory or self.element_factory
         try:
-            with filename.open(encoding="utf-8", errors="replace") as file_obj:
+            with storage.open_model(filename) as (file_obj, digest):
                 for percentage in storage.load_generator(
                     file_obj,
                     factory,
                     self.modeling_language,
+                    update_diagrams=False,
                 ):
                     if progress:
                         progress(percentage)
                     await sleep(0)
+            return digest.hexdigest()
         except MergeConflictDetected:
             self.filename = None
             await self.resolve_merge_conflict(filename)
         except Exception:
-            self.filename = None
-            await error_dialog(
-                message=gettext("Unable to open model “{filename}”.").format(
-                    filename=filename
-                ),
-                secondary_message=gettext(
-                    "This file does not contain a valid Gaphor model."
-                ),
-                window=self.parent_window,
-            )
-            self.event_manager.handle(SessionShutdown())
+            await self._load_failed(filename)
+        return None
+
+    async def _load_parsed_async(
+        self,
+        filename: Path,
+        parsed: asyncio.Future[tuple[dict[str, element], str]],
+        element_factory: ElementFactory,
+        progress: Callable[[int], None],
+    ) -> dict[str, bytes]:
+        """Create a model from a file parsed in a worker process.
+
+        Returns the digests of the parsed elements.
+        """
+        try:
+            elements, gaphor_version = await parsed
+            digests = storage.element_digests(elements, gaphor_version)
+            log.debug("Loading model from %s", filename)
+            with element_factory.block_events():
+                for percentage in storage.load_elements_generator(
+                    elements,
+                    element_factory,
+                    self.modeling_language,
+                    gaphor_version,
+                    update_diagrams=False,
+                ):
+                    progress(percentage)
+                    await sleep(0)
+            return digests
+        except Exception:
+            await self._load_failed(filename)
+            return {}
+
+    async def _load_failed(self, filename: Path):
+        self.filename = None
+        await error_dialog(
+            message=gettext("Unable to open model “{filename}”.").format(
+                filename=filename
+            ),
+            secondary_message=gettext(
+                "This file does not contain a valid Gaphor model."
+            ),
+            window=self.parent_window,
+        )
+        self.event_manager.handle(SessionShutdown())
 
     async def resolve_merge_conflict(self, filename: Path):
         temp_dir = tempfile.TemporaryDirectory()
@@ -283,12 +343,12 @@ class FileManager(Service, ActionProvider, TaskOwner):
         )
 
         try:
-            with filename.open("w", encoding="utf-8") as out:
+            with storage.open_model(filename, "w") as (out, digest):
                 for percentage in storage.save_generator(out, self.element_factory):
                     if status_window:
                         status_window.progress(percentage)
                     await sleep(0)
-            self.event_manager.handle(ModelSaved(filename))
+            self.event_manager.handle(ModelSaved(filename, digest.hexdigest()))
         except Exception as e:
             await error_dialog(
                 message=gettext("Unable to save model “{filename}”.").format(
@@ -17,25 +17,26 @@ def new_builder():
     return builder
 
 
-def file_digest(filename: Path | None) -> bytes | None:
+def file_digest(filename: Path | None) -> str | None:
     if filename is None or not filename.exists():
         return None
 
     with open(filename, "rb") as f:
-        return hashlib.file_digest(f, "sha256").digest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 class ModelChanged(UIComponent, ActionProvider):
     """Show a banner if the current model file has changed.
 
     This service checks for content changes (file digest)
-    to determine if a file really changed.
+    to determine if a file really changed. The digest of the file
+    as loaded or saved is provided by the model events.
     """
 
     def __init__(self, event_manager):
         self.event_manager = event_manager
         self._filename: Path | None = None
-        self._file_digest: bytes | None = None
+        self._file_digest: str | None = None
         self._banner: Adw.Banner | None = None
         self._monitor: Gio.FileMonitor | None = None
         self._timeout_id: int = 0
@@ -74,12 +75,12 @@ class ModelChanged(UIComponent, ActionProvider):
             self._timeout_id == 0
             and self._banner
             and event_type != Gio.FileMonitorEvent.ATTRIBUTE_CHANGED
-            and self._file_digest != file_digest(self._filename)
         ):
             self._timeout_id = GLib.timeout_add(1000, self._delayed_reveal)
 
     def _delayed_reveal(self):
-        if self._banner:
+        # File monitor events come in bursts: check the content once
+        if self._banner and self._file_digest != file_digest(self._filename):
             self._banner.set_revealed(True)
         self._timeout_id = 0
         return GLib.SOURCE_REMOVE
@@ -90,7 +91,7 @@ class ModelChanged(UIComponent, ActionProvider):
             self._filename = event.filename
             self._update_monitor()
 
-        self._file_digest = file_digest(self._filename)
+        self._file_digest = event.digest or file_digest(self._filename)
 
         if self._timeout_id:
             GLib.source_remove(self._timeout_id)
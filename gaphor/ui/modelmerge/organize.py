@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Iterable, Sequence
 from itertools import groupby
 
@@ -26,7 +27,8 @@ class Node(GObject.Object):
         self.children: Sequence[Node] | None = (
             as_list_store(children) if children else None
         )
-        self.sync()
+        # Children are in sync already
+        self._update()
 
     label = GObject.Property(type=str, default="")
     applied = GObject.Property(type=bool, default=True)
@@ -38,23 +40,25 @@ class Node(GObject.Object):
             for child in self.children:
                 child.sync()
 
-        self.applied = all(e.applied for e in self.elements) and (
-            not self.children or all(c.applied for c in self.children)
-        )
+        self._update()
+
+    def _update(self) -> None:
+        children = list(self.children) if self.children else []
+        children_applied = [c.applied for c in children]
+
+        applied = all(e.applied for e in self.elements) and all(children_applied)
+        self.applied = applied
         self.sensitive = (
-            not self.applied
+            not applied
+            or any(c.sensitive for c in children)
             or any(not e.applied and applicable(e, e.model) for e in self.elements)
-            or (self.children and any(c.sensitive for c in self.children))
         )
         self.inconsistent = (
-            not self.applied
-            and self.children
+            not applied
+            and bool(children)
             and (
-                any(c.inconsistent for c in self.children)
-                or not (
-                    all(c.applied for c in self.children)
-                    or all(not c.applied for c in self.children)
-                )
+                any(c.inconsistent for c in children)
+                or not (all(children_applied) or not any(children_applied))
             )
         )
 
@@ -72,20 +76,52 @@ def as_list_store(list) -> Gio.ListStore:
     return store
 
 
+class PendingChanges:
+    """Pending changes in a model, indexed by the element they apply to."""
+
+    def __init__(self, element_factory):
+        self.element_factory = element_factory
+        self.changes: list[PendingChange] = []
+        self.diagram_changes: list[ElementChange] = []
+        self.element_changes: dict[str, ElementChange] = {}
+        self.value_changes: dict[str, list[ValueChange]] = defaultdict(list)
+        self.ref_changes: dict[str, list[RefChange]] = defaultdict(list)
+        self.name_changes: dict[str, ValueChange] = {}
+
+        for change in element_factory.select(PendingChange):
+            self.changes.append(change)
+            element_id = change.element_id
+            if isinstance(change, ElementChange):
+                self.element_changes.setdefault(element_id, change)
+                if change.element_name == "Diagram":
+                    self.diagram_changes.append(change)
+            elif isinstance(change, ValueChange):
+                self.value_changes[element_id].append(change)
+                if change.property_name == "name":
+                    self.name_changes.setdefault(element_id, change)
+            elif isinstance(change, RefChange):
+                self.ref_changes[element_id].append(change)
+
+    def lookup(self, element_id):
+        return self.element_factory.lookup(element_id)
+
+
 def organize_changes(element_factory, modeling_language):
+    changes = PendingChanges(element_factory)
+    element_types: dict[str, type | None] = {}
+
     def lookup_element(element_id: str):
+        if element_id in element_types:
+            return element_types[element_id]
         if element := element_factory.lookup(element_id):
-            return type(element)
-        elif element_change := next(
-            element_factory.select(
-                lambda e: isinstance(e, ElementChange) and e.element_id == element_id
-            ),
-            None,
-        ):
+            element_type = type(element)
+        elif element_change := changes.element_changes.get(element_id):
             element_type = modeling_language.lookup_element(element_change.element_name)
             assert element_type
-            return element_type
-        return None
+        else:
+            element_type = None
+        element_types[element_id] = element_type
+        return element_type
 
     def composite(change: RefChange):
         element_type = lookup_element(change.element_id)
@@ -110,10 +146,8 @@ def organize_changes(element_factory, modeling_language):
     seen_change_ids: set[str] = set()
 
     # Add/remove diagrams
-    for change in element_factory.select(
-        lambda e: isinstance(e, ElementChange) and e.element_name == "Diagram"
-    ):
-        node = _element_change_node(change, element_factory, *nesting_rules)
+    for change in changes.diagram_changes:
+        node = _element_change_node(change, changes, *nesting_rules)
         seen_change_ids.update(_all_change_ids(node))
         yield node
 
@@ -121,14 +155,10 @@ def organize_changes(element_factory, modeling_language):
     for diagram in element_factory.select(
         lambda e: isinstance(e, Diagram) and e.id not in seen_change_ids
     ):
-        value_changes: list[PendingChange] = list(
-            _value_changes(diagram.id, element_factory)
-        )
-        ref_changes = list(
-            _ref_change_nodes(diagram.id, element_factory, *nesting_rules)
-        )
+        value_changes: list[PendingChange] = list(changes.value_changes[diagram.id])
+        ref_changes = list(_ref_change_nodes(diagram.id, changes, *nesting_rules))
         presentation_updates = list(
-            _presentation_updates(diagram, element_factory, *nesting_rules[1:])
+            _presentation_updates(diagram, changes, *nesting_rules[1:])
         )
         if value_changes or ref_changes:
             node = Node(
@@ -143,26 +173,24 @@ def organize_changes(element_factory, modeling_language):
 
     # Add/remove/update elements with/without a presentation
     for element_id, changes_iter in groupby(
-        element_factory.select(
-            lambda e: isinstance(e, PendingChange) and e.id not in seen_change_ids
-        ),
+        (c for c in changes.changes if c.id not in seen_change_ids),
         lambda e: e.element_id,
     ):
-        changes = list(changes_iter)
+        element_changes = list(changes_iter)
         if element_change := next(
-            (c for c in changes if isinstance(c, ElementChange)), None
+            (c for c in element_changes if isinstance(c, ElementChange)), None
         ):
             node = _element_change_node(
-                element_change, element_factory, composite_and_not_presentation
+                element_change, changes, composite_and_not_presentation
             )
             seen_change_ids.update(_all_change_ids(node))
             yield node
         elif element := element_factory.lookup(element_id):
             node = Node(
-                [c for c in changes if isinstance(c, ValueChange)],
+                [c for c in element_changes if isinstance(c, ValueChange)],
                 list(
                     _ref_change_nodes(
-                        element.id, element_factory, composite_and_not_presentation
+                        element.id, changes, composite_and_not_presentation
                     )
                 ),
                 label(element),
@@ -192,62 +220,47 @@ def _all_change_ids(node: Node):
             yield from _all_change_ids(c)
 
 
-def _element_change_node(change, element_factory, *nesting_rules):
+def _element_change_node(change, changes: PendingChanges, *nesting_rules):
+    value_changes = changes.value_changes[change.element_id]
     if change.op == "add":
         return Node(
-            [change, *_value_changes(change.element_id, element_factory)],
+            [change, *value_changes],
             list(
-                _ref_change_nodes(change.element_id, element_factory, *nesting_rules),
+                _ref_change_nodes(change.element_id, changes, *nesting_rules),
             ),
-            _create_label(change, element_factory),
+            _create_label(change, changes),
         )
     elif change.op == "remove":
         return Node(
-            [*_value_changes(change.element_id, element_factory), change],
+            [*value_changes, change],
             list(
-                _ref_change_nodes(change.element_id, element_factory, *nesting_rules),
+                _ref_change_nodes(change.element_id, changes, *nesting_rules),
             ),
-            _create_label(change, element_factory),
+            _create_label(change, changes),
         )
     else:
         raise ValueError(f"Unknown operation for {change}: {change.op}")
 
 
-def _value_changes(element_id, element_factory) -> Iterable[ValueChange]:
-    return element_factory.select(  # type: ignore[no-any-return]
-        lambda e: isinstance(e, ValueChange) and e.element_id == element_id
-    )
-
-
 def _ref_change_nodes(
-    element_id, element_factory, nesting_rule, *nesting_rules
+    element_id, changes: PendingChanges, nesting_rule, *nesting_rules
 ) -> Iterable[Node]:
-    for change in element_factory.select(
-        lambda e: isinstance(e, RefChange) and e.element_id == element_id
-    ):
+    for change in changes.ref_changes[element_id]:
         if nesting_rule(change) and (
-            element_change := next(
-                element_factory.select(
-                    lambda e: isinstance(e, ElementChange)
-                    and e.element_id == change.property_ref  # noqa: B023
-                ),
-                None,
-            )
+            element_change := changes.element_changes.get(change.property_ref)
         ):
             yield _element_change_node(
-                element_change, element_factory, *(nesting_rules or [nesting_rule])
+                element_change, changes, *(nesting_rules or [nesting_rule])
             )
-        yield Node([change], [], _create_label(change, element_factory))
+        yield Node([change], [], _create_label(change, changes))
 
 
-def _presentation_updates(diagram, element_factory, *nesting_rules):
+def _presentation_updates(diagram, changes: PendingChanges, *nesting_rules):
     for presentation in diagram.ownedPresentation:
         value_changes: list[PendingChange] = list(
-            _value_changes(presentation.id, element_factory)
-        )
-        ref_changes = list(
-            _ref_change_nodes(presentation.id, element_factory, *nesting_rules)
+            changes.value_changes[presentation.id]
         )
+        ref_changes = list(_ref_change_nodes(presentation.id, changes, *nesting_rules))
         if value_changes or ref_changes:
             yield Node(
                 value_changes,
@@ -256,22 +269,13 @@ def _presentation_updates(diagram, element_factory, *nesting_rules):
             )
 
 
-def _create_label(change, element_factory):
-    element = element_factory.lookup(change.element_id)
+def _create_label(change, changes: PendingChanges):
+    element = changes.lookup(change.element_id)
     name = (
         element.name
         if hasattr(element, "name")
         else v.property_value
-        if (
-            v := next(
-                element_factory.select(
-                    lambda e: isinstance(e, ValueChange)
-                    and e.element_id == change.element_id
-                    and e.property_name == "name"
-                ),
-                None,
-            )
-        )
+        if (v := changes.name_changes.get(change.element_id))
         else None
     )
 
@@ -321,7 +325,7 @@ def _create_label(change, element_factory):
                 )
             )
     elif isinstance(change, RefChange):
-        if ref_name := _resolve_ref(change.property_ref, element_factory):
+        if ref_name := _resolve_ref(change.property_ref, changes):
             return (
                 gettext("Add relation “{name}” to “{ref_name}”")
                 if op == "add"
@@ -344,17 +348,10 @@ def _create_label(change, element_factory):
             )
 
 
-def _resolve_ref(ref, element_factory):
-    element = element_factory.lookup(ref)
+def _resolve_ref(ref, changes: PendingChanges):
+    element = changes.lookup(ref)
     if element and hasattr(element, "name"):
         return element.name
-    if value_changed := next(
-        element_factory.select(
-            lambda e: isinstance(e, ValueChange)
-            and e.element_id == ref
-            and e.property_name == "name"
-        ),
-        None,
-    ):
+    if value_changed := changes.name_changes.get(ref):
         return value_changed.property_value
     return None
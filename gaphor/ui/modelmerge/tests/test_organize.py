@@ -10,7 +10,7 @@ from gaphor.core.modeling import (
     RefChange,
     ValueChange,
 )
-from gaphor.ui.modelmerge.organize import organize_changes
+from gaphor.ui.modelmerge.organize import PendingChanges, organize_changes
 from gaphor.UML.diagramitems import ClassItem
 
 
@@ -410,3 +410,27 @@ def test_add_diagram_contains_presentation_with_subject_and_composite_element(
     assert add_class in tree[0].children[0].children[0].elements
     assert tree[0].children[0].children[0].children
     assert add_property in tree[0].children[0].children[0].children[0].elements
+
+
+def test_pending_changes_are_indexed_by_element(element_factory, change):
+    add_diagram = change(ElementChange, op="add", element_name="Diagram")
+    name = change(
+        ValueChange,
+        op="update",
+        element_id=add_diagram.element_id,
+        property_name="name",
+    )
+    ref = change(
+        RefChange,
+        op="add",
+        element_id=add_diagram.element_id,
+        property_name="ownedPresentation",
+    )
+
+    changes = PendingChanges(element_factory)
+
+    assert changes.diagram_changes == [add_diagram]
+    assert changes.element_changes[add_diagram.element_id] is add_diagram
+    assert changes.value_changes[add_diagram.element_id] == [name]
+    assert changes.name_changes[add_diagram.element_id] is name
+    assert changes.ref_changes[add_diagram.element_id] == [ref]
@@ -1,7 +1,9 @@
 import pytest
+from gi.repository import Gio
 
 from gaphor import UML
-from gaphor.ui.clipboard import Clipboard
+from gaphor.ui.clipboard import COPY_BUFFER_MIME_TYPE, Clipboard
+from gaphor.ui.tests.fixtures import iterate_until
 from gaphor.UML.classes import PackageItem
 from gaphor.UML.general import CommentItem
 
@@ -11,20 +13,25 @@ class MockSystemClipboard:
         self.copy_buffer = None
 
     def set_content(self, content_provider):
-        self.copy_buffer = content_provider.get_value()
+        self.copy_buffer = content_provider
 
-    def read_value_async(self, gtype, io_priority, cancellable, callback):
+    def read_async(self, mime_types, io_priority, cancellable, callback):
+        assert COPY_BUFFER_MIME_TYPE in mime_types
         callback(None, self.copy_buffer)
 
-    def read_value_finish(self, result):
-        return result
+    def read_finish(self, result):
+        return Gio.MemoryInputStream.new_from_bytes(result), COPY_BUFFER_MIME_TYPE
 
 
 @pytest.fixture
-def clipboard(event_manager, element_factory, monkeypatch):
-    monkeypatch.setattr("gi.repository.Gdk.ContentProvider.new_for_value", lambda v: v)
+def clipboard(event_manager, element_factory, modeling_language, monkeypatch):
+    monkeypatch.setattr(
+        "gi.repository.Gdk.ContentProvider.new_for_bytes", lambda _mime, data: data
+    )
 
-    return Clipboard(event_manager, element_factory, MockSystemClipboard())
+    return Clipboard(
+        event_manager, element_factory, modeling_language, MockSystemClipboard()
+    )
 
 
 def test_copy_link(clipboard, diagram, view, element_factory):
@@ -35,6 +42,7 @@ def test_copy_link(clipboard, diagram, view, element_factory):
     assert list(diagram.get_all_items()) == [ci]
 
     clipboard.paste_link(view)
+    iterate_until(lambda: len(list(diagram.get_all_items())) == 2)
 
     assert ci in diagram.get_all_items()
     assert len(list(diagram.get_all_items())) == 2, list(diagram.get_all_items())
@@ -50,5 +58,15 @@ def test_copy_full_with_owned_element(clipboard, diagram, view, element_factory)
     clipboard.copy(view)
 
     clipboard.paste_full(view)
+    iterate_until(lambda: len(element_factory.lselect(UML.Package)) == 4)
 
     assert len(element_factory.lselect(UML.Package)) == 4
+
+
+def test_copy_buffer_is_bytes(clipboard, diagram, view, element_factory):
+    ci = diagram.create(CommentItem, subject=element_factory.create(UML.Comment))
+    view.selection.select_items(ci)
+
+    clipboard.copy(view)
+
+    assert isinstance(clipboard.clipboard.copy_buffer.get_data(), bytes)
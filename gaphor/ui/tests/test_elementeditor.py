@@ -89,6 +89,36 @@ def test_create_pages(
     assert not find(editor.editors.vbox, "name-editor")
 
 
+def test_update_pages_reuses_pages(
+    event_manager,
+    component_registry,
+    element_factory,
+    modeling_language,
+    diagrams,
+    create,
+):
+    properties = DummyProperties()
+    editor = ElementEditor(
+        event_manager,
+        component_registry,
+        element_factory,
+        modeling_language,
+        diagrams,
+        properties,
+    )
+    class_item = create(ClassItem, UML.Class)
+    other_item = create(ClassItem, UML.Class)
+    other_item.subject.name = "Other"
+
+    editor.open()
+    editor.editors.update_pages(class_item)
+    name_editor = find(editor.editors.vbox, "name-editor")
+    editor.editors.update_pages(other_item)
+
+    assert find(editor.editors.vbox, "name-editor") is name_editor
+    assert find(editor.editors.vbox, "name-entry").get_text() == "Other"
+
+
 def test_dump_css_tree(element_factory, create):
     class_item = create(ClassItem, UML.Class)
 
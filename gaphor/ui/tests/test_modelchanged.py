@@ -1,6 +1,9 @@
+import hashlib
+
 from gi.repository import GLib
 
 from gaphor.core.modeling import ModelReady
+from gaphor.event import ModelSaved
 from gaphor.ui.modelchanged import ModelChanged
 from gaphor.ui.tests.fixtures import iterate_until
 
@@ -45,3 +48,19 @@ def test_monitor_file_not_changed(event_manager, tmp_path):
     iterate_until(condition=lambda: False, timeout=2)
 
     assert not widget.get_revealed()
+
+
+def test_digest_from_model_event_is_used(event_manager, tmp_path):
+    new_file = tmp_path / "new_file"
+    new_file.write_text("a", encoding="utf-8")
+
+    model_changed = ModelChanged(event_manager)
+    widget = model_changed.open()
+    event_manager.handle(
+        ModelSaved(filename=new_file, digest=hashlib.sha256(b"b").hexdigest())
+    )
+
+    new_file.write_text("b", encoding="utf-8")
+    iterate_until(condition=lambda: False, timeout=2)
+
+    assert not widget.get_revealed()
@@ -0,0 +1,48 @@
+"""Benchmarks for pytest-benchmark.
+
+Run with ``pytest tests/benchmarks --benchmark-only``.
+Results can be saved and compared with ``--benchmark-autosave``
+and ``--benchmark-compare``.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from gaphor.plugins.benchmark.benchmarkcli import synthetic_parameters
+from gaphor.plugins.benchmark.benchmarks import BENCHMARKS
+from gaphor.plugins.benchmark.modelgenerator import generate_model_file
+
+pytest.importorskip("pytest_benchmark")
+
+MODELS = Path(__file__).parent.parent.parent / "models"
+
+
+@pytest.fixture(scope="module")
+def synthetic_model(tmp_path_factory):
+    path = tmp_path_factory.mktemp("models") / "synthetic-1.gaphor"
+    generate_model_file(path, synthetic_parameters(1))
+    return path
+
+
+@pytest.mark.parametrize(
+    "model", ["UML.gaphor", "UML_test.gaphor", "RAAML_full.gaphor", "synthetic"]
+)
+@pytest.mark.parametrize("name", BENCHMARKS)
+def test_model_benchmark(benchmark, name, model, request):
+    path = (
+        request.getfixturevalue("synthetic_model")
+        if model == "synthetic"
+        else MODELS / model
+    )
+    runs = BENCHMARKS[name](path)
+
+    def setup():
+        return (next(runs),), {}
+
+    try:
+        benchmark.pedantic(lambda run: run(), setup=setup, rounds=3)
+    except StopIteration:
+        pytest.skip(f"Benchmark {name} is not applicable to {model}")
+    finally:
+        runs.close()
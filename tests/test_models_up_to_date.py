@@ -1,12 +1,10 @@
 """Test if models are up to date."""
 
-import functools
 from pathlib import Path
 
 import pytest
 
 from gaphor.C4Model import c4model
-from gaphor.codegen import coder
 from gaphor.codegen.coder import main
 from gaphor.core.modeling import coremodel
 from gaphor.RAAML import raaml
@@ -14,18 +12,19 @@ from gaphor.SysML import sysml
 from gaphor.UML import uml
 
 
-@pytest.fixture(scope="session", autouse=True)
-def cache_loaded_models():
-    """Speed up testing by caching loaded models."""
-    coder.load_model = functools.lru_cache(maxsize=None)(coder.load_model)
+@pytest.fixture(scope="session")
+def model_cache(tmp_path_factory):
+    """Speed up testing by parsing each model only once."""
+    return tmp_path_factory.mktemp("codegen")
 
 
-def test_core_model(tmp_path):
+def test_core_model(tmp_path, model_cache):
     outfile = tmp_path / "coremodel.py"
     main(
         modelfile="models/Core.gaphor",
         overridesfile="models/Core.override",
         outfile=outfile,
+        cache=model_cache,
     )
 
     current_model = Path(coremodel.__file__).read_text(encoding="utf-8")
@@ -34,13 +33,14 @@ def test_core_model(tmp_path):
     assert generated_model == current_model
 
 
-def test_uml_model(tmp_path):
+def test_uml_model(tmp_path, model_cache):
     outfile = tmp_path / "uml.py"
     main(
         modelfile="models/UML.gaphor",
         overridesfile="models/UML.override",
         supermodelfiles=[("Core", "models/Core.gaphor")],
         outfile=outfile,
+        cache=model_cache,
     )
 
     current_model = Path(uml.__file__).read_text(encoding="utf-8")
@@ -49,7 +49,7 @@ def test_uml_model(tmp_path):
     assert generated_model == current_model
 
 
-def test_c4model_model(tmp_path):
+def test_c4model_model(tmp_path, model_cache):
     outfile = tmp_path / "c4model.py"
     main(
         modelfile="models/C4Model.gaphor",
@@ -58,6 +58,7 @@ def test_c4model_model(tmp_path):
             ("Core", "models/Core.gaphor"),
         ],
         outfile=outfile,
+        cache=model_cache,
     )
 
     current_model = Path(c4model.__file__).read_text(encoding="utf-8")
@@ -66,7 +67,7 @@ def test_c4model_model(tmp_path):
     assert generated_model == current_model
 
 
-def test_sysml_model(tmp_path):
+def test_sysml_model(tmp_path, model_cache):
     outfile = tmp_path / "sysml.py"
     main(
         modelfile="models/SysML.gaphor",
@@ -76,6 +77,7 @@ def test_sysml_model(tmp_path):
             ("Core", "models/Core.gaphor"),
         ],
         outfile=outfile,
+        cache=model_cache,
     )
 
     current_model = Path(sysml.__file__).read_text(encoding="utf-8")
@@ -84,7 +86,7 @@ def test_sysml_model(tmp_path):
     assert generated_model == current_model
 
 
-def test_raaml_model(tmp_path):
+def test_raaml_model(tmp_path, model_cache):
     outfile = tmp_path / "raaml.py"
     main(
         modelfile="models/RAAML.gaphor",
@@ -94,6 +96,7 @@ def test_raaml_model(tmp_path):
             ("Core", "models/Core.gaphor"),
         ],
         outfile=outfile,
+        cache=model_cache,
     )
 
     current_model = Path(raaml.__file__).read_text(encoding="utf-8")